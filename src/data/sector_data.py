@@ -159,12 +159,12 @@ class SectorDataProvider:
                 sector_list = sector_list[sector_list['板块代码'].isin(sector_codes)]
             
             sector_data = []
+            update_time = datetime.now().strftime('%H:%M:%S')
             
-            for _, sector in sector_list.iterrows():
-                sector_code = sector['板块代码']
-                sector_name = sector['板块名称']
-                sector_type = sector['板块类型']
-                stock_codes = sector['成分股'].split(',')
+            # 只取需要的列逐行生成普通元组，不再为每行构造 Series
+            rows = sector_list[['板块代码', '板块名称', '板块类型', '成分股']].itertuples(index=False, name=None)
+            for sector_code, sector_name, sector_type, members in rows:
+                stock_codes = members.split(',')
                 
                 # 计算板块指标
                 sector_metrics = self._calculate_sector_metrics(stock_codes, sector_name)
@@ -182,7 +182,7 @@ class SectorDataProvider:
                     '领涨股': sector_metrics['top_gainer'],
                     '领跌股': sector_metrics['top_loser'],
                     '热度指数': sector_metrics['heat_index'],
-                    '更新时间': datetime.now().strftime('%H:%M:%S')
+                    '更新时间': update_time
                 })
             
             if sector_data:
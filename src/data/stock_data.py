@@ -2,13 +2,23 @@ import akshare as ak
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Iterator
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 市场统计缓存时间 (秒)，同一刷新周期内重复获取直接命中缓存
+_MARKET_STATS_TTL = 30
+# 模拟市场统计的取值范围: 上涨家数、下跌家数、涨停家数、跌停家数、总成交额(亿)，上界不含
+_MOCK_STATS_LOW = np.array([1500, 1500, 10, 5, 8000])
+_MOCK_STATS_HIGH = np.array([2501, 2501, 101, 51, 15001])
+
+# 备选数据源逐只股票请求时并发执行
+_hist_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="hist")
+
 class StockDataProvider:
     """股票数据提供者"""
     
@@ -17,22 +27,23 @@ class StockDataProvider:
         self._cache_timeout = 300  # 5分钟缓存
         self._last_update = {}
         self._lock = threading.Lock()
+        self._name_map = None  # 股票代码 -> 名称，首次查询时从股票列表建立，各界面组件共用
     
     def _get_cache_key(self, method: str, **kwargs) -> str:
         """生成缓存键"""
         return f"{method}_{hash(str(sorted(kwargs.items())))}"
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """检查缓存是否有效"""
+    def _is_cache_valid(self, cache_key: str, timeout: Optional[float] = None) -> bool:
+        """检查缓存是否有效 (timeout 为空时使用默认缓存时间)"""
         if cache_key not in self._last_update:
             return False
         
-        return (time.time() - self._last_update[cache_key]) < self._cache_timeout
+        return (time.time() - self._last_update[cache_key]) < (timeout or self._cache_timeout)
     
-    def _get_from_cache(self, cache_key: str):
+    def _get_from_cache(self, cache_key: str, timeout: Optional[float] = None):
         """从缓存获取数据"""
         with self._lock:
-            if cache_key in self._cache and self._is_cache_valid(cache_key):
+            if cache_key in self._cache and self._is_cache_valid(cache_key, timeout):
                 data = self._cache[cache_key]
                 # 如果是DataFrame，返回副本；否则直接返回
                 if hasattr(data, 'copy'):
@@ -102,6 +113,34 @@ class StockDataProvider:
             logger.error(f"获取股票列表失败: {e}")
             return self._generate_mock_stock_list()
     
+    def get_name_map(self) -> Dict[str, str]:
+        """获取股票代码到名称的映射 (首次调用时建立并缓存，股票列表更新后调用 invalidate_name_map 重建)"""
+        name_map = self._name_map
+        if name_map is None:
+            stock_list = self.get_stock_list()
+            if stock_list.empty:
+                return {}
+            name_map = dict(zip(stock_list['代码'].astype(str), stock_list['名称'].astype(str)))
+            self._name_map = name_map
+        return name_map
+    
+    def peek_name_map(self) -> Optional[Dict[str, str]]:
+        """获取已建立的股票名称映射，尚未建立时返回 None (不触发网络请求，供界面线程使用)"""
+        return self._name_map
+    
+    def invalidate_name_map(self) -> None:
+        """清空股票名称映射，下次查询时重建"""
+        self._name_map = None
+    
+    def get_stock_name(self, stock_code: str, default: str = "未知") -> str:
+        """按代码查询股票名称 (各界面组件统一走共享的名称映射)"""
+        return self.get_name_map().get(stock_code, default)
+    
+    def get_stock_symbols(self, limit: Optional[int] = None) -> List[str]:
+        """获取股票代码列表 (取自缓存的名称映射，不再为取代码复制整张股票列表)"""
+        symbols = list(self.get_name_map())
+        return symbols if limit is None else symbols[:limit]
+    
     def _generate_mock_stock_list(self) -> pd.DataFrame:
         """生成模拟股票列表"""
         sample_stocks = [
@@ -166,26 +205,11 @@ class StockDataProvider:
             # 方法2: 使用腾讯数据作为备选
             if result is None or result.empty:
                 try:
-                    all_data = []
-                    for symbol in symbols[:10]:  # 限制数量避免超时
-                        try:
-                            # 尝试获取单只股票数据
-                            stock_data = ak.stock_zh_a_hist(symbol=symbol, period="daily", 
-                                                          start_date=pd.Timestamp.now().strftime('%Y%m%d'),
-                                                          end_date=pd.Timestamp.now().strftime('%Y%m%d'))
-                            if not stock_data.empty:
-                                latest = stock_data.iloc[-1]
-                                all_data.append({
-                                    '代码': symbol,
-                                    '名称': f'股票{symbol}',
-                                    '最新价': latest.get('收盘', 0),
-                                    '涨跌幅': 0,  # 计算涨跌幅需要前一日数据
-                                    '涨跌额': 0,
-                                    '成交量': latest.get('成交量', 0),
-                                    '成交额': latest.get('成交额', 0)
-                                })
-                        except Exception:
-                            continue
+                    # 逐只股票的请求并发执行，总耗时接近单次请求而不是逐个累加
+                    today = pd.Timestamp.now().strftime('%Y%m%d')
+                    bars = _hist_executor.map(lambda symbol: self._fetch_today_bar(symbol, today),
+                                              symbols[:10])  # 限制数量避免超时
+                    all_data = [bar for bar in bars if bar is not None]
                     
                     if all_data:
                         result = pd.DataFrame(all_data)
@@ -213,6 +237,33 @@ class StockDataProvider:
             logger.error(f"获取实时数据失败: {e}")
             return self._generate_mock_real_time_data(symbols)
     
+    def _fetch_today_bar(self, symbol: str, today: str) -> Optional[Dict]:
+        """获取单只股票当日日线作为实时数据的备选，失败时返回 None"""
+        try:
+            stock_data = ak.stock_zh_a_hist(symbol=symbol, period="daily",
+                                          start_date=today, end_date=today)
+        except Exception:
+            return None
+        if stock_data.empty:
+            return None
+        latest = stock_data.iloc[-1]
+        return {
+            '代码': symbol,
+            '名称': f'股票{symbol}',
+            '最新价': latest.get('收盘', 0),
+            '涨跌幅': 0,  # 计算涨跌幅需要前一日数据
+            '涨跌额': 0,
+            '成交量': latest.get('成交量', 0),
+            '成交额': latest.get('成交额', 0)
+        }
+    
+    def get_real_time_data_batched(self, symbols: List[str], batch_size: int = 50) -> Iterator[pd.DataFrame]:
+        """按批获取实时行情数据，每获取一批就返回一批，调用方可以边取边显示"""
+        for start in range(0, len(symbols), batch_size):
+            batch = self.get_real_time_data(symbols[start:start + batch_size])
+            if not batch.empty:
+                yield batch
+    
     def _generate_mock_real_time_data(self, symbols: List[str]) -> pd.DataFrame:
         """生成模拟实时数据"""
         import random
@@ -255,15 +306,22 @@ class StockDataProvider:
                 indices_codes = ['sh000001', 'sz399001', 'sz399006', 'sh000688']
                 indices_names = ['上证指数', '深证成指', '创业板指', '科创50']
                 
+                # 全市场实时数据只获取一次，代码排序后各指数二分查找，不再每个指数整表扫描
+                try:
+                    data = ak.stock_zh_a_spot_em()
+                    data_codes = data['代码'].astype(str).to_numpy()
+                    order = np.argsort(data_codes, kind='stable')
+                    sorted_codes = data_codes[order]
+                except Exception:
+                    sorted_codes = np.array([], dtype=str)
+                index_data = None
+                
                 for code, name in zip(indices_codes, indices_names):
                     try:
-                        # 使用股票实时数据接口
-                        data = ak.stock_zh_a_spot_em()
                         # 查找指数数据（某些情况下指数也在这个接口中）
-                        index_row = data[data['代码'] == code[-6:]]
-                        
-                        if not index_row.empty:
-                            row = index_row.iloc[0]
+                        pos = np.searchsorted(sorted_codes, code[-6:])
+                        if pos < len(sorted_codes) and sorted_codes[pos] == code[-6:]:
+                            row = data.iloc[order[pos]]
                             market_data[name] = {
                                 '现价': self._safe_float(row.get('最新价', 0)),
                                 '涨跌幅': self._safe_float(row.get('涨跌幅', 0)),
@@ -278,7 +336,8 @@ class StockDataProvider:
                     
                     # 方法2: 使用指数专用接口
                     try:
-                        index_data = ak.stock_zh_index_spot_em()
+                        if index_data is None:
+                            index_data = ak.stock_zh_index_spot_em()
                         if not index_data.empty:
                             # 查找对应指数
                             matching_rows = index_data[index_data['代码'].str.contains(code[-6:], na=False)]
@@ -314,6 +373,29 @@ class StockDataProvider:
             logger.error(f"获取大盘数据失败: {e}")
             return self._generate_mock_market_data()
     
+    def get_market_stats(self) -> Dict[str, int]:
+        """获取市场统计数据 (涨跌家数、涨跌停家数、总成交额)，缓存30秒"""
+        cache_key = self._get_cache_key("market_stats")
+        cached_data = self._get_from_cache(cache_key, timeout=_MARKET_STATS_TTL)
+        if cached_data is not None:
+            return cached_data
+        
+        # 这里应该从数据源获取真实的市场统计数据
+        # 目前使用模拟数据: 一次生成全部随机数
+        up_count, down_count, limit_up, limit_down, amount = \
+            np.random.randint(_MOCK_STATS_LOW, _MOCK_STATS_HIGH).tolist()
+        total_stocks = 4800
+        stats = {
+            '上涨家数': up_count,
+            '下跌家数': down_count,
+            '平盘家数': total_stocks - up_count - down_count,
+            '涨停家数': limit_up,
+            '跌停家数': limit_down,
+            '总成交额': amount,  # 亿元
+        }
+        self._set_cache(cache_key, stats)
+        return stats
+    
     def _safe_float(self, value, default=0.0):
         """安全转换为浮点数"""
         try:
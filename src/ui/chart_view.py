@@ -111,6 +111,10 @@ class ChartViewWidget(QWidget):
         # 创建标签页
         self.indicator_tabs = QTabWidget()
         
+        # 指标页 -> 绘制函数；只绘制当前可见的指标页，其余页标记为待绘制，切换到时再绘制
+        self._indicator_updaters = {}
+        self._stale_indicators = set()
+        
         # MACD标签页
         self.setup_macd_tab()
         
@@ -120,6 +124,7 @@ class ChartViewWidget(QWidget):
         # 成交量标签页
         self.setup_volume_tab()
         
+        self.indicator_tabs.currentChanged.connect(self._on_indicator_tab_changed)
         parent.addWidget(self.indicator_tabs)
         
     def setup_macd_tab(self):
@@ -131,6 +136,7 @@ class ChartViewWidget(QWidget):
         self.macd_plot.showGrid(x=True, y=True)
         
         self.indicator_tabs.addTab(macd_widget, "MACD")
+        self._indicator_updaters[macd_widget] = self.update_macd_chart
         
     def setup_kdj_tab(self):
         """设置KDJ标签页"""
@@ -141,6 +147,7 @@ class ChartViewWidget(QWidget):
         self.kdj_plot.showGrid(x=True, y=True)
         
         self.indicator_tabs.addTab(kdj_widget, "KDJ")
+        self._indicator_updaters[kdj_widget] = self.update_kdj_chart
         
     def setup_volume_tab(self):
         """设置成交量标签页"""
@@ -151,6 +158,7 @@ class ChartViewWidget(QWidget):
         self.volume_plot.showGrid(x=True, y=True)
         
         self.indicator_tabs.addTab(volume_widget, "成交量")
+        self._indicator_updaters[volume_widget] = self.update_volume_chart
         
     def load_stock(self, stock_code: str, stock_name: str):
         """加载股票数据"""
@@ -292,11 +300,21 @@ class ChartViewWidget(QWidget):
             logger.warning(f"添加均线失败: {e}")
             
     def update_indicator_charts(self):
-        """更新指标图表"""
+        """更新指标图表 (只绘制当前指标页)"""
+        self._stale_indicators = set(self._indicator_updaters)
+        self._draw_indicator(self.indicator_tabs.currentWidget())
+        
+    def _on_indicator_tab_changed(self, index):
+        """切换指标页 - 数据变化后尚未绘制过的页在此时绘制"""
+        self._draw_indicator(self.indicator_tabs.widget(index))
+        
+    def _draw_indicator(self, widget):
+        """绘制待更新的指标页"""
+        if widget not in self._stale_indicators:
+            return
+        self._stale_indicators.discard(widget)
         try:
-            self.update_macd_chart()
-            self.update_kdj_chart()
-            self.update_volume_chart()
+            self._indicator_updaters[widget]()
         except Exception as e:
             logger.error(f"更新指标图表失败: {e}")
             
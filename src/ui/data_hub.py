@@ -0,0 +1,189 @@
+"""
+共享数据刷新中心
+进程内所有主窗口共用一个刷新定时器和一次后台获取，结果通过信号广播给各窗口
+"""
+import weakref
+from datetime import datetime, time as dt_time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, QThreadPool, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+from PyQt6 import sip
+
+from src.data.stock_data import data_provider
+from src.ui.workers import RefreshWorker
+from src.utils.config import config_manager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 非交易时段（盘前、午休、收盘后）的刷新间隔 (毫秒)
+_OFF_HOURS_INTERVAL_MS = 30000
+
+# 可在窗口间共享的数据: 子模块 -> 获取函数 (与界面无关，在后台线程调用)
+_FETCHERS = {
+    'market': data_provider.get_market_data,
+}
+
+
+def _changes(key, previous, current):
+    """计算本次结果相对上次的变化: 大盘只保留有变化的指数，其它数据整体无变化时跳过；无变化返回 None"""
+    if previous is None or not current:
+        return current
+    if key == 'market':
+        changed = {name: row for name, row in current.items() if previous.get(name) != row}
+        return changed or None
+    if current is previous or (hasattr(current, 'equals') and current.equals(previous)):
+        return None
+    return current
+
+
+def _refresh_interval(trading_interval, now=None):
+    """按A股交易时段计算刷新间隔，返回0表示休市暂停刷新"""
+    now = now or datetime.now()
+    if now.weekday() >= 5:
+        return 0
+    t = now.time()
+    if dt_time(9, 30) <= t <= dt_time(11, 30) or dt_time(13, 0) <= t <= dt_time(15, 0):
+        return trading_interval
+    if dt_time(9, 0) <= t <= dt_time(15, 30):
+        return _OFF_HOURS_INTERVAL_MS
+    return 0
+
+
+class DataHub(QObject):
+    """数据刷新中心 - 持有唯一的刷新定时器，各主窗口订阅其信号而不再各自轮询"""
+
+    tick = pyqtSignal()                   # 定时刷新时间到，各窗口提交本窗口需要的刷新
+    data_ready = pyqtSignal(dict)         # 子模块 -> 相对上次的变化 (只包含成功且有变化的子模块)
+    fetch_failed = pyqtSignal(str, str)   # 子模块, 错误信息
+    round_finished = pyqtSignal(bool)     # 一轮获取结束，参数为是否全部成功
+
+    def __init__(self):
+        super().__init__()
+        self._windows = weakref.WeakSet()  # 已订阅的主窗口
+        self._in_flight = set()            # 后台获取尚未返回的子模块，返回前不重复提交
+        self.latest = {}                   # 最近一次获取成功的数据，新窗口打开时直接使用
+
+        # 单次定时器: 每轮刷新完成后再安排下一轮，刷新耗时超过间隔时不会堆积
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self._on_timer)
+
+        # 交易时段使用配置的更新间隔，其余时段放慢或暂停；获取失败时按倍数退避
+        self._trading_interval = config_manager.get('data.update_interval', 5000)
+        self._refresh_backoff = 1.0
+        self._round_failed = False
+
+        # 每分钟检查一次: 休市暂停后进入交易时段时恢复轮询
+        self._regime_timer = QTimer(self)
+        self._regime_timer.timeout.connect(self.ensure_scheduled)
+        self._regime_timer.start(60000)
+
+        # 应用整体转入后台 (隐藏/挂起) 时暂停刷新
+        QApplication.instance().applicationStateChanged.connect(self._on_app_state_changed)
+
+    def attach(self, window):
+        """登记主窗口"""
+        self._windows.add(window)
+
+    def detach(self, window):
+        """注销主窗口，没有可见窗口时暂停刷新"""
+        self._windows.discard(window)
+        self.update_visibility()
+
+    def is_busy(self):
+        """是否有后台获取尚未返回"""
+        return bool(self._in_flight)
+
+    def is_scheduled(self):
+        """是否已安排下一轮刷新"""
+        return self.update_timer.isActive()
+
+    def _any_visible(self):
+        """是否至少有一个主窗口可见"""
+        return any(not sip.isdeleted(w) and w.is_refresh_visible() for w in list(self._windows))
+
+    def request(self, *keys):
+        """提交共享数据的获取，已在获取中的子模块不重复提交"""
+        fetchers = {key: _FETCHERS[key] for key in keys if key not in self._in_flight}
+        if not fetchers:
+            return
+        self._in_flight.update(fetchers)
+        worker = RefreshWorker(fetchers)
+        # 显式使用队列连接: 结果总是在界面线程处理，即使任务被同步执行也不会在发射过程中直接更新界面
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.signals.error_occurred.connect(self._on_error, queued)
+        worker.signals.finished.connect(self._on_finished, queued)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_error(self, key, error_msg):
+        """某个子模块的数据获取失败"""
+        self._in_flight.discard(key)
+        self._round_failed = True
+        self.fetch_failed.emit(key, error_msg)
+
+    def _on_finished(self, results):
+        """一轮获取结束 - 广播结果并按成败调整下一轮间隔"""
+        self._in_flight.difference_update(results)
+        changes = {}
+        for key, data in results.items():
+            delta = _changes(key, self.latest.get(key), data)
+            if delta is not None:
+                changes[key] = delta
+        self.latest.update(results)
+        if changes:
+            self.data_ready.emit(changes)
+
+        # 本轮有失败则加倍退避 (最多8倍)，全部成功则恢复正常间隔
+        if self._round_failed:
+            self._refresh_backoff = min(self._refresh_backoff * 2, 8.0)
+            logger.info(f"数据获取失败，下一轮刷新间隔放大为 {self._refresh_backoff:g} 倍")
+        else:
+            self._refresh_backoff = 1.0
+        self.round_finished.emit(not self._round_failed)
+        self._round_failed = False
+        self._schedule_next()
+
+    def _on_timer(self):
+        """定时刷新时间到 - 没有可见窗口时不再通知，等窗口重新显示后恢复"""
+        if self._any_visible():
+            self.tick.emit()
+
+    def _schedule_next(self):
+        """按交易时段和退避倍数安排下一轮刷新，没有可见窗口或休市时不再安排"""
+        interval = _refresh_interval(self._trading_interval) if self._any_visible() else 0
+        if interval == 0:
+            self.update_timer.stop()
+            return
+        self.update_timer.start(int(interval * self._refresh_backoff))
+
+    def ensure_scheduled(self):
+        """没有刷新在进行、也没有安排下一轮时，重新安排"""
+        if not self.update_timer.isActive() and not self._in_flight:
+            self._schedule_next()
+
+    def update_visibility(self):
+        """窗口显示状态变化 - 全部不可见时暂停刷新，否则确保已安排下一轮"""
+        if self._any_visible():
+            self.ensure_scheduled()
+        else:
+            self.update_timer.stop()
+
+    def _on_app_state_changed(self, state):
+        """应用状态变化 - 转入后台时暂停刷新，回到前台后恢复"""
+        if state in (Qt.ApplicationState.ApplicationHidden, Qt.ApplicationState.ApplicationSuspended):
+            self.update_timer.stop()
+            logger.info("应用已转入后台，暂停定时刷新")
+        else:
+            self.ensure_scheduled()
+
+
+_data_hub = None
+
+
+def get_data_hub():
+    """获取数据刷新中心 (首次调用时创建，需在QApplication创建之后调用)"""
+    global _data_hub
+    if _data_hub is None:
+        _data_hub = DataHub()
+    return _data_hub
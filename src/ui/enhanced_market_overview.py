@@ -2,6 +2,8 @@
 增强版大盘概览组件 - 适配新的上下布局设计
 参考同花顺大盘指数显示风格
 """
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGridLayout, QFrame)
 from PyQt6.QtCore import Qt, QTimer
@@ -11,6 +13,24 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 涨跌方向 -> (价格样式, 涨跌样式)，按方向预先生成，刷新时只做查表
+_SIGN_MAP = {
+    1: ("color: #e74c3c; padding: 2px 0;", "color: #e74c3c;"),   # 红色
+    -1: ("color: #27ae60; padding: 2px 0;", "color: #27ae60;"),  # 绿色
+    0: ("color: #34495e; padding: 2px 0;", "color: #34495e;"),   # 灰色
+}
+
+# 卡片固定样式 (价格样式在首次收到数据后按涨跌方向替换)
+_PRICE_INIT_QSS = "color: #2c3e50; padding: 5px 0;"
+_VOLUME_QSS = "color: #7f8c8d; padding: 2px 0;"
+
+
+@lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Weight.Normal):
+    """按需创建并缓存字体，所有卡片共享 (需在QApplication创建之后调用)"""
+    return QFont(family, size, weight)
+
+
 class EnhancedMarketOverviewWidget(QWidget):
     """增强版大盘概览组件"""
     
@@ -18,7 +38,7 @@ class EnhancedMarketOverviewWidget(QWidget):
         super().__init__()
         self.index_cards = {}  # 存储指数卡片
         self.init_ui()
-        self.refresh_data()
+        # 数据由主窗口在后台获取后通过 apply_data 填充，构造时不阻塞取数
         
     def init_ui(self):
         """初始化界面 - 水平卡片布局"""
@@ -42,7 +62,7 @@ class EnhancedMarketOverviewWidget(QWidget):
             
     def create_index_card(self, index_name, color):
         """创建指数卡片 - 大尺寸显示"""
-        # 主容器
+        # 主容器（不设置:hover规则，避免鼠标移入移出时边框宽度变化引发整条卡片重新布局）
         card_widget = QFrame()
         card_widget.setStyleSheet(f"""
             QFrame {{
@@ -52,11 +72,6 @@ class EnhancedMarketOverviewWidget(QWidget):
                 padding: 8px;
                 min-height: 140px;
             }}
-            QFrame:hover {{
-                border-color: {color};
-                background-color: #f8f9fa;
-                border-width: 3px;
-            }}
         """)
         
         layout = QVBoxLayout(card_widget)
@@ -65,15 +80,15 @@ class EnhancedMarketOverviewWidget(QWidget):
         
         # 指数名称 - 更大字体
         name_label = QLabel(index_name)
-        name_label.setFont(QFont("微软雅黑", 14, QFont.Weight.Bold))
+        name_label.setFont(_font("微软雅黑", 14, QFont.Weight.Bold))
         name_label.setStyleSheet(f"color: {color}; padding: 3px 0;")
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(name_label)
         
         # 当前价格 - 更大字体
         price_label = QLabel("---.--")
-        price_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        price_label.setStyleSheet("color: #2c3e50; padding: 5px 0;")
+        price_label.setFont(_font("Arial", 20, QFont.Weight.Bold))
+        price_label.setStyleSheet(_PRICE_INIT_QSS)
         price_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(price_label)
         
@@ -85,12 +100,12 @@ class EnhancedMarketOverviewWidget(QWidget):
         
         # 涨跌额
         change_amount_label = QLabel("±-.--")
-        change_amount_label.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        change_amount_label.setFont(_font("Arial", 13, QFont.Weight.Bold))
         change_amount_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # 涨跌幅
         change_pct_label = QLabel("±-.--％")
-        change_pct_label.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        change_pct_label.setFont(_font("Arial", 13, QFont.Weight.Bold))
         change_pct_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         change_layout.addWidget(change_amount_label)
@@ -99,8 +114,8 @@ class EnhancedMarketOverviewWidget(QWidget):
         
         # 成交量信息
         volume_label = QLabel("成交: ---万手")
-        volume_label.setFont(QFont("微软雅黑", 10))
-        volume_label.setStyleSheet("color: #7f8c8d; padding: 2px 0;")
+        volume_label.setFont(_font("微软雅黑", 10))
+        volume_label.setStyleSheet(_VOLUME_QSS)
         volume_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(volume_label)
         
@@ -110,17 +125,30 @@ class EnhancedMarketOverviewWidget(QWidget):
             'price': price_label,
             'change_amount': change_amount_label,
             'change_pct': change_pct_label,
-            'volume': volume_label
+            'volume': volume_label,
+            'sign': None  # 当前涨跌方向，用于避免重复设置样式表
         }
         
     def refresh_data(self):
-        """刷新数据"""
+        """刷新数据 (同步获取并更新)"""
         try:
-            logger.debug("开始刷新大盘数据...")
-            
-            # 获取大盘数据
-            market_data = data_provider.get_market_data()
+            self.apply_data(self.fetch_data())
+        except Exception as e:
+            self.on_fetch_error(str(e))
             
+    def fetch_data(self):
+        """获取大盘数据 - 可在后台线程调用，不访问界面控件"""
+        logger.debug("开始获取大盘数据...")
+        return data_provider.get_market_data()
+        
+    def on_fetch_error(self, error_msg):
+        """数据获取失败"""
+        logger.error(f"更新大盘数据失败: {error_msg}")
+        self._show_error_message(error_msg)
+        
+    def apply_data(self, market_data):
+        """把大盘数据更新到指数卡片 - 必须在界面线程调用，可只传入有变化的指数"""
+        try:
             if not market_data:
                 logger.warning("未获取到大盘数据")
                 self._show_no_data_message()
@@ -142,20 +170,14 @@ class EnhancedMarketOverviewWidget(QWidget):
                     card['change_amount'].setText(f"{change_amount:+.2f}")
                     card['change_pct'].setText(f"{change_pct:+.2f}%")
                     
-                    # 设置颜色
-                    if change_pct > 0:
-                        color = "#e74c3c"  # 红色
-                        arrow = "↗"
-                    elif change_pct < 0:
-                        color = "#27ae60"  # 绿色
-                        arrow = "↘"
-                    else:
-                        color = "#34495e"  # 灰色
-                        arrow = "→"
-                    
-                    card['price'].setStyleSheet(f"color: {color}; padding: 2px 0;")
-                    card['change_amount'].setStyleSheet(f"color: {color};")
-                    card['change_pct'].setStyleSheet(f"color: {color};")
+                    # 设置颜色 - 仅在涨跌方向变化时重设样式表
+                    sign = (change_pct > 0) - (change_pct < 0)
+                    if card.get('sign') != sign:
+                        price_qss, change_qss = _SIGN_MAP[sign]
+                        card['price'].setStyleSheet(price_qss)
+                        card['change_amount'].setStyleSheet(change_qss)
+                        card['change_pct'].setStyleSheet(change_qss)
+                        card['sign'] = sign
                     
                     # 更新成交量
                     volume = data.get('成交量', 0)
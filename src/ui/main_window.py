@@ -2,171 +2,265 @@
 优化版主窗口 - 同花顺风格上下布局
 大幅放大指数和板块内容显示
 """
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTabWidget, QMenuBar, QStatusBar, QToolBar, 
-                             QMessageBox, QLabel, QPushButton, QFrame)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QIcon, QFont
+import time
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 
-from src.ui.enhanced_market_overview import EnhancedMarketOverviewWidget
-from src.ui.stock_list import StockListWidget
-from src.ui.chart_view import ChartViewWidget
-from src.ui.stock_pool import StockPoolWidget
-from src.ui.sector_info import SectorInfoPanel
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+                             QTabWidget, QMessageBox, QLabel, QPushButton, QToolButton, QFrame, QSizePolicy)
+from PyQt6.QtCore import Qt, QTimer, QEvent, QThreadPool, QSettings, pyqtSlot
+from PyQt6.QtGui import QAction, QFont
+from PyQt6 import sip
+
+from src.ui.data_hub import get_data_hub
+from src.ui.styles import load_qss
+from src.ui.workers import FetchRunnable
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+# 刷新请求合并窗口 (毫秒)
+_FLUSH_DELAY_MS = 50
+
+# 状态栏更新时间格式
+_TIME_FMT = '更新时间: %H:%M:%S'
+
+# 状态栏连接状态文字: 连接是否正常 -> 文字
+_CONNECTION_TEXT = {True: '🟢 数据连接正常', False: '🔴 数据连接异常'}
+
+# 选择事件防抖间隔 (毫秒)
+_SELECTION_DEBOUNCE_MS = 120
+
+# 板块成分股缓存有效期 (秒)
+_SECTOR_STOCKS_TTL = 60
+
+
+def _log_errors(prefix, level="error", show_status=False):
+    """方法异常处理装饰器: 捕获异常并记录日志，可选在状态栏提示"""
+    def decorator(func):
+        # 与Qt槽函数调用方式一致: 信号参数多于函数形参时丢弃多余参数
+        nargs = func.__code__.co_argcount - 1
+        
+        @wraps(func)
+        def wrapper(self, *args):
+            try:
+                return func(self, *args[:nargs])
+            except Exception as e:
+                getattr(logger, level)(f"{prefix}: {e}")
+                if show_status:
+                    self.status_bar.showMessage(f"{prefix}: {e}", 3000)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def _updates_suspended(widget):
+    """暂停控件重绘，批量修改完成后统一重绘一次"""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+@lru_cache(maxsize=128)
+def _cached_sector_stocks(sector_code, ttl_bucket):
+    """缓存板块成分股，ttl_bucket 随时间推进，使过期结果自然失效"""
+    from src.data.sector_data import sector_data_provider
+    return tuple(sector_data_provider.get_sector_stocks(sector_code))
+
+
+def _fetch_sector_stocks(sector_code, sector_name):
+    """获取板块成分股 (在后台线程执行)"""
+    stocks = _cached_sector_stocks(sector_code, int(time.time() // _SECTOR_STOCKS_TTL))
+    return sector_code, sector_name, list(stocks)
+
+
+# 界面样式表，所有主窗口实例共享
+_TITLE_QSS = "color: #2c3e50; padding: 5px;"
+_MARKET_STATUS_QSS = "color: #27ae60; padding: 5px;"
+_TRANSPARENT_QSS = "background-color: transparent; border: none;"
+_ANALYSIS_TITLE_QSS = "color: #1F2937; margin: 20px;"
+
+# 菜单/工具栏动作: (名称, 菜单文字, 工具栏文字, 快捷键, 槽函数)
+_ACTIONS = (
+    ('new_window', '新建窗口', None, 'Ctrl+N', 'new_window'),
+    ('exit', '退出', None, 'Ctrl+Q', 'close'),
+    ('strategy', '策略选股', '🎯 策略选股', 'Ctrl+S', 'open_strategy_window'),
+    ('refresh', '刷新数据', '🔄 刷新', 'F5', 'refresh_all_data'),
+    ('fullscreen', '全屏', '🖥️ 全屏', 'F11', 'toggle_fullscreen'),
+    ('about', '关于', None, None, 'show_about'),
+)
+
+# 菜单布局，None 表示分隔线
+_MENU_LAYOUT = (
+    ('文件', ('new_window', None, 'exit')),
+    ('工具', ('strategy', 'refresh')),
+    ('视图', ('fullscreen',)),
+    ('帮助', ('about',)),
+)
+
+# 工具栏布局，None 表示分隔线
+_TOOLBAR_LAYOUT = ('refresh', None, 'strategy', None, 'fullscreen')
+
+
+@lru_cache(maxsize=None)
+def _font(size, weight=QFont.Weight.Normal, family="微软雅黑"):
+    """按需创建并缓存字体，所有窗口共享 (需在QApplication创建之后调用)"""
+    return QFont(family, size, weight)
+
+
 class MainWindow(QMainWindow):
     """优化版主窗口 - 同花顺风格"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._strategy_window_ref = lambda: None  # 弱引用，窗口关闭销毁后自动失效
         self.init_ui()
         self.setup_connections()
         self.restore_window_state()
         self.setup_timer()
         
-        # 立即进行一次数据更新
-        self.initial_data_load()
+        # 首次数据加载推迟到事件循环开始之后，窗口先完成首次绘制，数据到达后再填充
+        QTimer.singleShot(0, self.initial_data_load)
         
+    @_log_errors("初始数据加载失败")
     def initial_data_load(self):
-        """初始数据加载"""
-        try:
-            logger.info("开始初始数据加载...")
-            self.update_data()
-            logger.info("初始数据加载完成")
-        except Exception as e:
-            logger.error(f"初始数据加载失败: {e}")
+        """初始数据加载 (含股票列表，各面板构造时不再自行取数)"""
+        logger.info("开始初始数据加载...")
+        # 其它窗口已获取过的共享数据直接使用，只获取尚未缓存的部分
+        cached = dict(self._hub.latest)
+        if cached:
+            self._apply_refresh(cached)
+        self._request_update('sector', 'stocks', *(self._refreshables.keys() - cached.keys()))
+        logger.info("初始数据加载已提交")
         
     def init_ui(self):
         """初始化用户界面 - 同花顺风格上下布局"""
         self.setWindowTitle("📊 A股投资分析工具 v2.0 - 专业版")
         self.setMinimumSize(1600, 1000)  # 更大的窗口以容纳更多信息
         
-        # 设置中心部件
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # 创建主布局 - 垂直布局 (上下排列)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(12)
-        
-        # 1. 顶部大盘指数区域 (大幅放大)
-        self.setup_large_market_area(main_layout)
-        
-        # 2. 中部板块信息区域 (大幅放大)
-        self.setup_large_sector_area(main_layout)
-        
-        # 3. 底部股票信息和图表区域 (可伸缩)
-        self.setup_stock_content_area(main_layout)
-        
-        # 创建菜单栏
-        self.create_menu_bar()
-        
-        # 创建工具栏
-        self.create_tool_bar()
-        
-        # 创建状态栏
-        self.create_status_bar()
-        
-        # 设置专业主题
+        # 先设置专业主题，子控件创建时直接按最终样式表完成样式计算，不必整棵控件树重新计算
         self.apply_professional_theme()
         
+        # 构建期间暂停重绘，全部控件就绪后只做一次布局和绘制
+        with _updates_suspended(self):
+            # 创建菜单栏 / 工具栏 / 标题栏按钮共用的动作
+            self.create_actions()
+            
+            # 设置中心部件
+            central_widget = QWidget()
+            self.setCentralWidget(central_widget)
+            
+            # 创建主布局 - 单层网格 (上下排列)，前两行固定高度，第三行占用剩余空间
+            main_layout = QGridLayout(central_widget)
+            main_layout.setContentsMargins(10, 10, 10, 10)
+            main_layout.setSpacing(12)
+            main_layout.setRowStretch(2, 1)
+            
+            # 1. 顶部大盘指数区域 (大幅放大)
+            self.setup_large_market_area(main_layout)
+            
+            # 2. 中部板块信息区域 (大幅放大)
+            self.setup_large_sector_area(main_layout)
+            
+            # 3. 底部股票信息和图表区域 (可伸缩)
+            self.setup_stock_content_area(main_layout)
+            
+            # 刷新登记表: 共享子模块 -> (界面更新, 获取失败处理)，数据由 DataHub 统一获取后广播
+            self._refreshables = {
+                'market': (self.market_overview.apply_data, self.market_overview.on_fetch_error),
+            }
+            # 本窗口独有的子模块: 直接调用各面板的 refresh_data (自带后台获取)；
+            # 股票列表按本窗口的显示模式 (热门/全部/自选) 获取，不能在窗口间共享
+            self._local_refreshes = {
+                'sector': self.sector_info.refresh_data,
+                'stocks': self.stock_list_widget.refresh_data,
+            }
+            
+            # 创建菜单栏
+            self.create_menu_bar()
+            
+            # 创建工具栏
+            self.create_tool_bar()
+            
+            # 创建状态栏
+            self.create_status_bar()
+        
     def setup_large_market_area(self, main_layout):
         """设置大尺寸大盘指数区域 - 参考同花顺"""
         # 创建大盘区域容器
         market_frame = QFrame()
         market_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        market_frame.setFixedHeight(220)  # 大幅增加高度
-        market_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 2px solid #3498db;
-                border-radius: 10px;
-                margin: 5px;
-            }
-        """)
+        # 高度固定为220 (大幅增加高度)，用尺寸策略表达，便于布局缓存尺寸提示
+        market_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        market_frame.setMinimumHeight(220)
+        market_frame.setMaximumHeight(220)
+        market_frame.setObjectName("marketFrame")  # 样式见 styles/professional.qss
         
         market_layout = QVBoxLayout(market_frame)
         market_layout.setContentsMargins(15, 15, 15, 15)
         market_layout.setSpacing(10)
         
-        # 标题区域
-        title_container = QWidget()
-        title_layout = QHBoxLayout(title_container)
+        # 标题区域 (直接嵌入外框布局，不再额外包一层容器控件)
+        title_layout = QHBoxLayout()
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         market_title = QLabel("📈 大盘指数")
-        market_title.setFont(QFont("微软雅黑", 16, QFont.Weight.Bold))
-        market_title.setStyleSheet("color: #2c3e50; padding: 5px;")
+        market_title.setFont(_font(16, QFont.Weight.Bold))
+        market_title.setStyleSheet(_TITLE_QSS)
         title_layout.addWidget(market_title)
         
         # 市场状态指示
         market_status = QLabel("🟢 交易中")
-        market_status.setFont(QFont("微软雅黑", 12, QFont.Weight.Bold))
-        market_status.setStyleSheet("color: #27ae60; padding: 5px;")
+        market_status.setFont(_font(12, QFont.Weight.Bold))
+        market_status.setStyleSheet(_MARKET_STATUS_QSS)
         title_layout.addWidget(market_status)
         
         title_layout.addStretch()
         
-        # 快捷按钮
-        refresh_btn = QPushButton("🔄 刷新")
+        # 快捷按钮 - 直接使用刷新动作，与菜单、工具栏、F5 共用同一个动作和信号连接
+        refresh_btn = QToolButton()
+        refresh_btn.setDefaultAction(self._actions['refresh'])
         refresh_btn.setFixedSize(80, 35)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        refresh_btn.clicked.connect(self.refresh_all_data)
+        refresh_btn.setObjectName("refreshButton")  # 样式见 styles/professional.qss
         title_layout.addWidget(refresh_btn)
         
-        market_layout.addWidget(title_container)
+        market_layout.addLayout(title_layout)
         
-        # 大盘概览组件 - 使用增强版
+        # 大盘概览组件 - 使用增强版 (界面子模块在构建时才导入，缩短启动导入耗时)
+        from src.ui.enhanced_market_overview import EnhancedMarketOverviewWidget
         self.market_overview = EnhancedMarketOverviewWidget()
-        self.market_overview.setStyleSheet("background-color: transparent; border: none;")
+        self.market_overview.setStyleSheet(_TRANSPARENT_QSS)
         market_layout.addWidget(self.market_overview, 1)
         
-        main_layout.addWidget(market_frame)
+        main_layout.addWidget(market_frame, 0, 0)
         
     def setup_large_sector_area(self, main_layout):
         """设置大尺寸板块信息区域"""
         # 创建板块区域容器
         sector_frame = QFrame()
         sector_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        sector_frame.setFixedHeight(320)  # 大幅增加高度
-        sector_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 2px solid #e74c3c;
-                border-radius: 10px;
-                margin: 5px;
-            }
-        """)
+        # 高度固定为320 (大幅增加高度)
+        sector_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sector_frame.setMinimumHeight(320)
+        sector_frame.setMaximumHeight(320)
+        sector_frame.setObjectName("sectorFrame")  # 样式见 styles/professional.qss
         
         sector_layout = QVBoxLayout(sector_frame)
         sector_layout.setContentsMargins(15, 15, 15, 15)
         sector_layout.setSpacing(10)
         
-        # 标题区域
-        title_container = QWidget()
-        title_layout = QHBoxLayout(title_container)
+        # 标题区域 (直接嵌入外框布局，不再额外包一层容器控件)
+        title_layout = QHBoxLayout()
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         sector_title = QLabel("🏭 热门板块")
-        sector_title.setFont(QFont("微软雅黑", 16, QFont.Weight.Bold))
-        sector_title.setStyleSheet("color: #2c3e50; padding: 5px;")
+        sector_title.setFont(_font(16, QFont.Weight.Bold))
+        sector_title.setStyleSheet(_TITLE_QSS)
         title_layout.addWidget(sector_title)
         
         title_layout.addStretch()
@@ -174,49 +268,32 @@ class MainWindow(QMainWindow):
         # 自选股按钮
         pool_btn = QPushButton("⭐ 自选股")
         pool_btn.setFixedSize(80, 35)
-        pool_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
+        pool_btn.setObjectName("poolButton")  # 样式见 styles/professional.qss
         pool_btn.clicked.connect(self.show_stock_pool)
         title_layout.addWidget(pool_btn)
         
-        sector_layout.addWidget(title_container)
+        sector_layout.addLayout(title_layout)
         
         # 内容区域 - 板块信息和自选股并排显示
-        content_container = QWidget()
-        content_layout = QHBoxLayout(content_container)
+        content_layout = QHBoxLayout()
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(15)
         
+        from src.ui.sector_info import SectorInfoPanel
+        from src.ui.stock_pool import StockPoolWidget
+        
         # 板块信息组件 (70%)
         self.sector_info = SectorInfoPanel()
-        self.sector_info.setStyleSheet("background-color: transparent; border: none;")
+        self.sector_info.setStyleSheet(_TRANSPARENT_QSS)
         content_layout.addWidget(self.sector_info, 7)
         
         # 自选股组件 (30%)
         self.stock_pool = StockPoolWidget()
-        self.stock_pool.setStyleSheet("""
-            StockPoolWidget {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        self.stock_pool.setObjectName("stockPool")  # 样式见 styles/professional.qss
         content_layout.addWidget(self.stock_pool, 3)
         
-        sector_layout.addWidget(content_container, 1)
-        main_layout.addWidget(sector_frame)
+        sector_layout.addLayout(content_layout, 1)
+        main_layout.addWidget(sector_frame, 1, 0)
         
     def setup_stock_content_area(self, main_layout):
         """设置股票内容区域"""
@@ -227,18 +304,55 @@ class MainWindow(QMainWindow):
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
         
         # 股票列表标签页
+        from src.ui.stock_list import StockListWidget
         self.stock_list_widget = StockListWidget()
         self.tab_widget.addTab(self.stock_list_widget, "📋 股票行情")
         
-        # 图表分析标签页
+        # 图表分析、数据分析标签页先放占位控件，首次切换到时再创建
+        # (标签可拖动排序，因此以占位控件而不是下标来登记)
+        self.chart_view = None
+        self._chart_placeholder = QWidget()
+        analysis_placeholder = QWidget()
+        self._tab_factories = {
+            self._chart_placeholder: ("📊 技术分析", self._build_chart_tab),
+            analysis_placeholder: ("🔬 数据挖掘", self.create_analysis_tab),
+        }
+        for placeholder, (label, _) in self._tab_factories.items():
+            self.tab_widget.addTab(placeholder, label)
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        
+        main_layout.addWidget(self.tab_widget, 2, 0)  # 占用剩余空间
+        
+    def _ensure_tab(self, index):
+        """首次切换到延迟加载的标签页时，用真实内容替换占位控件"""
+        placeholder = self.tab_widget.widget(index)
+        entry = self._tab_factories.pop(placeholder, None)
+        if entry is None:
+            return
+        label, factory = entry
+        widget = factory()
+        
+        # 替换过程中屏蔽 currentChanged，避免移除当前页时误触发其它标签页的加载
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, label)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+    def _build_chart_tab(self):
+        """创建技术分析标签页"""
+        from src.ui.chart_view import ChartViewWidget
         self.chart_view = ChartViewWidget()
-        self.tab_widget.addTab(self.chart_view, "📊 技术分析")
-        
-        # 数据分析标签页
-        analysis_widget = self.create_analysis_tab()
-        self.tab_widget.addTab(analysis_widget, "🔬 数据挖掘")
+        return self.chart_view
         
-        main_layout.addWidget(self.tab_widget, 1)  # 占用剩余空间
+    def _ensure_chart_view(self):
+        """确保技术分析标签页已创建"""
+        if self.chart_view is None:
+            self._ensure_tab(self.tab_widget.indexOf(self._chart_placeholder))
+        return self.chart_view
         
     def create_analysis_tab(self):
         """创建数据分析标签页"""
@@ -248,9 +362,9 @@ class MainWindow(QMainWindow):
         
         # 分析功能标题
         title_label = QLabel("📈 高级数据分析中心")
-        title_label.setFont(QFont("微软雅黑", 16, QFont.Weight.Bold))
+        title_label.setFont(_font(16, QFont.Weight.Bold))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: #1F2937; margin: 20px;")
+        title_label.setStyleSheet(_ANALYSIS_TITLE_QSS)
         layout.addWidget(title_label)
         
         # 功能说明
@@ -265,17 +379,7 @@ class MainWindow(QMainWindow):
         • 🎯 智能选股：多因子选股模型
         """)
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_label.setStyleSheet("""
-            QLabel {
-                color: #6B7280; 
-                font-size: 14px; 
-                line-height: 1.6;
-                background-color: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        info_label.setObjectName("analysisInfo")  # 样式见 styles/professional.qss
         layout.addWidget(info_label)
         
         layout.addStretch()  # 弹性空间
@@ -283,156 +387,50 @@ class MainWindow(QMainWindow):
         return widget
         
     def show_stock_pool(self):
-        """显示自选股管理窗口"""
-        try:
-            QMessageBox.information(self, "自选股", "自选股管理功能开发中...")
-        except Exception as e:
-            logger.error(f"显示自选股失败: {e}")
-    
-    def apply_professional_theme(self):
-        """应用专业主题 - 同花顺风格"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f6fa;
-                color: #2c3e50;
-            }
-            QMenuBar {
-                background-color: #34495e;
-                color: white;
-                padding: 5px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QMenuBar::item {
-                padding: 8px 12px;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background-color: #3498db;
-            }
-            QToolBar {
-                background-color: #ecf0f1;
-                border: 1px solid #bdc3c7;
-                spacing: 5px;
-                padding: 8px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QToolBar QToolButton {
-                padding: 8px 12px;
-                border-radius: 4px;
-                border: 1px solid transparent;
-            }
-            QToolBar QToolButton:hover {
-                background-color: #d5dbdb;
-                border: 1px solid #95a5a6;
-            }
-            QTabWidget::pane {
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                background-color: white;
-                margin-top: 5px;
-            }
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                padding: 12px 24px;
-                margin-right: 3px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 100px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTabBar::tab:hover {
-                background-color: #d5dbdb;
-            }
-            QStatusBar {
-                background-color: #34495e;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 5px;
-            }
-        """)
+        """显示自选股管理窗口 (开发中，用状态栏提示代替模态对话框，不阻塞定时刷新)"""
+        self.status_bar.showMessage('自选股管理功能正在开发中...', 3000)
         
+    def apply_professional_theme(self):
+        """应用专业主题 - 同花顺风格 (样式表设置在QApplication上，整个进程只解析一次)"""
+        app = QApplication.instance()
+        if app.property("professional_theme_applied"):
+            return
+        app.setStyleSheet(load_qss("professional.qss"))
+        app.setProperty("professional_theme_applied", True)
+        
+    def create_actions(self):
+        """创建菜单栏、工具栏和标题栏按钮共用的动作 (每个动作只创建一次)"""
+        self._actions = {}
+        for name, text, icon_text, shortcut, slot in _ACTIONS:
+            action = QAction(text, self)
+            if icon_text:
+                action.setIconText(icon_text)  # 工具栏按钮显示的文字
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            self._actions[name] = action
+            
     def create_menu_bar(self):
         """创建菜单栏"""
         menubar = self.menuBar()
-        
-        # 文件菜单
-        file_menu = menubar.addMenu('文件')
-        
-        new_action = QAction('新建窗口', self)
-        new_action.setShortcut('Ctrl+N')
-        new_action.triggered.connect(self.new_window)
-        file_menu.addAction(new_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction('退出', self)
-        exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # 工具菜单
-        tools_menu = menubar.addMenu('工具')
-        
-        strategy_action = QAction('策略选股', self)
-        strategy_action.setShortcut('Ctrl+S')
-        strategy_action.triggered.connect(self.open_strategy_window)
-        tools_menu.addAction(strategy_action)
-        
-        refresh_action = QAction('刷新数据', self)
-        refresh_action.setShortcut('F5')
-        refresh_action.triggered.connect(self.refresh_all_data)
-        tools_menu.addAction(refresh_action)
-        
-        # 视图菜单
-        view_menu = menubar.addMenu('视图')
-        
-        fullscreen_action = QAction('全屏', self)
-        fullscreen_action.setShortcut('F11')
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
-        
-        # 帮助菜单
-        help_menu = menubar.addMenu('帮助')
-        
-        about_action = QAction('关于', self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-        
+        for title, names in _MENU_LAYOUT:
+            menu = menubar.addMenu(title)
+            for name in names:
+                if name is None:
+                    menu.addSeparator()
+                else:
+                    menu.addAction(self._actions[name])
+                    
     def create_tool_bar(self):
         """创建工具栏"""
         toolbar = self.addToolBar('主工具栏')
+        toolbar.setObjectName('main_toolbar')  # saveState/restoreState 按对象名识别工具栏
         toolbar.setMovable(False)
-        
-        # 刷新按钮
-        refresh_action = QAction('🔄 刷新', self)
-        refresh_action.setShortcut('F5')
-        refresh_action.triggered.connect(self.refresh_all_data)
-        toolbar.addAction(refresh_action)
-        
-        toolbar.addSeparator()
-        
-        # 策略选股按钮
-        strategy_action = QAction('🎯 策略选股', self)
-        strategy_action.setShortcut('Ctrl+S')
-        strategy_action.triggered.connect(self.open_strategy_window)
-        toolbar.addAction(strategy_action)
-        
-        toolbar.addSeparator()
-        
-        # 全屏按钮
-        fullscreen_action = QAction('🖥️ 全屏', self)
-        fullscreen_action.setShortcut('F11')
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        toolbar.addAction(fullscreen_action)
+        for name in _TOOLBAR_LAYOUT:
+            if name is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(self._actions[name])
         
     def create_status_bar(self):
         """创建状态栏"""
@@ -440,125 +438,266 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage('就绪 - A股投资分析工具 v2.0')
         
         # 添加右侧状态信息
-        self.connection_status = QLabel('🟢 数据连接正常')
+        self.connection_status = QLabel(_CONNECTION_TEXT[True])
+        self._connection_ok = True
         self.status_bar.addPermanentWidget(self.connection_status)
         
-        self.update_time = QLabel('更新时间: --:--:--')
+        self.update_time = QLabel('更新时间: 加载中…')
+        self._last_time_str = ""
         self.status_bar.addPermanentWidget(self.update_time)
         
+    @_log_errors("设置信号连接失败", level="warning")
     def setup_connections(self):
         """设置信号连接"""
-        try:
-            # 股票池选择信号
-            if hasattr(self.stock_pool, 'stock_selected'):
-                self.stock_pool.stock_selected.connect(self.on_stock_selected)
-        
-            # 股票列表选择信号
-            if hasattr(self.stock_list_widget, 'stock_selected'):
-                self.stock_list_widget.stock_selected.connect(self.on_stock_selected)
+        # 选择事件防抖: 快速连续选择 (如键盘上下翻动) 时只处理最后一次
+        self._pending_stock = None
+        self._stock_debounce = QTimer(self)
+        self._stock_debounce.setSingleShot(True)
+        self._stock_debounce.setInterval(_SELECTION_DEBOUNCE_MS)
+        self._stock_debounce.timeout.connect(self._flush_stock_selection)
+        
+        self._pending_sector = None
+        self._sector_debounce = QTimer(self)
+        self._sector_debounce.setSingleShot(True)
+        self._sector_debounce.setInterval(_SELECTION_DEBOUNCE_MS)
+        self._sector_debounce.timeout.connect(self._flush_sector_selection)
+        
+        # 选择信号统一使用队列连接: 槽函数在发射方的事件处理结束后才执行，
+        # 切换标签页等操作不会在发射过程中重入；发射方移到工作线程后也无需改动。
+        # 同时要求唯一连接 (槽函数用 pyqtSlot 声明，Qt 才能识别重复连接)，避免重复连接导致一次选择处理多次
+        queued = Qt.ConnectionType.QueuedConnection | Qt.ConnectionType.UniqueConnection
+        
+        # 股票池选择信号
+        if hasattr(self.stock_pool, 'stock_selected'):
+            self.stock_pool.stock_selected.connect(self.on_stock_selected, queued)
+        
+        # 股票列表选择信号
+        if hasattr(self.stock_list_widget, 'stock_selected'):
+            self.stock_list_widget.stock_selected.connect(self.on_stock_selected, queued)
+        
+        # 板块信息选择信号
+        if hasattr(self.sector_info, 'sector_selected'):
+            self.sector_info.sector_selected.connect(self.on_sector_selected, queued)
         
-            # 板块信息选择信号
-            if hasattr(self.sector_info, 'sector_selected'):
-                self.sector_info.sector_selected.connect(self.on_sector_selected)
-                
-        except Exception as e:
-            logger.warning(f"设置信号连接失败: {e}")
-            
     def setup_timer(self):
-        """设置定时器"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_data)
-        
-        # 从配置读取更新间隔
-        interval = config_manager.get('data.update_interval', 5000)
-        self.update_timer.start(interval)
-        
-        logger.info(f"数据更新定时器已启动，间隔: {interval}ms")
-        
-    def update_data(self):
-        """更新数据"""
-        try:
-            # 更新大盘数据
-            if hasattr(self, 'market_overview'):
-                self.market_overview.refresh_data()
-                
-            # 更新板块数据
-            if hasattr(self, 'sector_info'):
-                self.sector_info.refresh_data()
+        """设置刷新调度 - 定时器由进程内共享的 DataHub 持有，本窗口只订阅其信号"""
+        # 延迟刷新调度：合并窗口内的多次刷新请求只执行一次
+        self._dirty = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+        
+        self._hub = get_data_hub()
+        self._hub.attach(self)
+        self._hub.tick.connect(self.update_data)
+        self._hub.data_ready.connect(self._apply_refresh)
+        self._hub.fetch_failed.connect(self._on_refresh_error)
+        self._hub.round_finished.connect(self._on_round_finished)
+        
+    def is_refresh_visible(self):
+        """窗口是否可见 - 不可见时刷新结果无人查看，不发起网络请求"""
+        if not self.isVisible() or self.isMinimized():
+            return False
+        # 仅失去焦点 (Inactive) 时行情窗口仍可见，继续刷新
+        return QApplication.applicationState() not in (
+            Qt.ApplicationState.ApplicationHidden, Qt.ApplicationState.ApplicationSuspended)
+            
+    def changeEvent(self, event):
+        """窗口状态变化 - 最小化时暂停刷新，恢复后立即刷新一次"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and hasattr(self, '_hub'):
+            was_minimized = bool(event.oldState() & Qt.WindowState.WindowMinimized)
+            if self.isMinimized():
+                self._hub.update_visibility()
+                logger.info("窗口已最小化，暂停定时刷新")
+            elif was_minimized:
+                self.update_data()
                 
-            # 更新时间显示
-            from datetime import datetime
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.update_time.setText(f'更新时间: {current_time}')
+    def showEvent(self, event):
+        """窗口重新显示 - 刷新已暂停时立即刷新一次"""
+        super().showEvent(event)
+        if hasattr(self, '_hub') and not self._hub.is_scheduled() and not self._hub.is_busy():
+            self.update_data()
             
-            logger.debug("数据更新完成")
+    def hideEvent(self, event):
+        """窗口隐藏 - 没有其它可见窗口时暂停定时刷新"""
+        super().hideEvent(event)
+        if hasattr(self, '_hub'):
+            self._hub.update_visibility()
+        
+    def _request_update(self, *keys):
+        """登记需要刷新的子模块 (market/sector/stocks)，合并后统一刷新"""
+        self._dirty.update(keys)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(_FLUSH_DELAY_MS)
             
-        except Exception as e:
-            logger.error(f"数据更新失败: {e}")
-            self.status_bar.showMessage(f"数据更新失败: {e}", 3000)
+    @_log_errors("数据更新失败", show_status=True)
+    def _flush(self):
+        """执行合并后的刷新，每个子模块只刷新一次；共享数据交给 DataHub 获取"""
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty & self._local_refreshes.keys():
+            self._local_refreshes[key]()
+        shared = dirty - self._local_refreshes.keys()
+        if shared:
+            self._hub.request(*shared)
+        
+        logger.debug(f"已提交数据更新: {', '.join(sorted(dirty))}")
+        
+    def _apply_refresh(self, results):
+        """在界面线程中一次性应用 DataHub 广播的变化，整个窗口只重绘一次"""
+        with _updates_suspended(self.centralWidget()):
+            for key, data in results.items():
+                self._refreshables[key][0](data)
+                
+        logger.debug(f"数据更新完成: {', '.join(sorted(results))}")
+        
+    def _on_round_finished(self, ok):
+        """一轮获取结束 (无论数据是否变化) - 更新状态栏的更新时间和连接状态"""
+        # 同一秒内不重复设置文本
+        time_str = time.strftime(_TIME_FMT)
+        if time_str != self._last_time_str:
+            self.update_time.setText(time_str)
+            self._last_time_str = time_str
+            
+        # 连接状态不变时不重设文字，避免状态栏重绘
+        if ok != self._connection_ok:
+            self.connection_status.setText(_CONNECTION_TEXT[ok])
+            self._connection_ok = ok
+        
+    def _on_refresh_error(self, key, error_msg):
+        """某个子模块的数据获取失败"""
+        self._refreshables[key][1](error_msg)
+        
+    def _submit_fetch(self, fetch, on_result, on_error=None, *args):
+        """把阻塞的数据获取提交到全局线程池，结果经信号回到界面线程"""
+        runnable = FetchRunnable(fetch, *args)
+        runnable.signals.result_ready.connect(on_result)
+        runnable.signals.error_occurred.connect(on_error or self._on_fetch_error)
+        QThreadPool.globalInstance().start(runnable)
+        
+    def _on_fetch_error(self, error_msg):
+        """后台数据获取失败"""
+        self.status_bar.showMessage(f"数据更新失败: {error_msg}", 3000)
+        
+    def _do_refresh(self, include_stock_list=False):
+        """提交一次刷新 - 定时刷新与手动刷新共用的唯一入口"""
+        if include_stock_list:
+            self._request_update('market', 'sector', 'stocks')
+        else:
+            self._request_update('market', 'sector')
+        
+    def update_data(self):
+        """更新数据 (定时刷新，不含股票列表)，窗口不可见时跳过"""
+        if not self.is_refresh_visible():
+            return
+        self._do_refresh(include_stock_list=False)
     
+    @pyqtSlot(str, str)
     def on_stock_selected(self, stock_code: str, stock_name: str):
-        """处理股票选择事件"""
+        """处理股票选择事件 (防抖后加载图表)"""
+        self._pending_stock = (stock_code, stock_name)
+        self._stock_debounce.start()
+        
+    def _flush_stock_selection(self):
+        """加载最后一次选择的股票"""
+        stock_code, stock_name = self._pending_stock
         logger.info(f"选择股票: {stock_code} - {stock_name}")
         
-        # 更新图表视图
-        if hasattr(self, 'chart_view'):
-            self.chart_view.load_stock(stock_code, stock_name)
+        # 切换到图表标签页 (首次使用时创建图表)
+        chart_view = self._ensure_chart_view()
+        self.tab_widget.setCurrentWidget(chart_view)
         
-        # 切换到图表标签页
-        self.tab_widget.setCurrentIndex(1)
+        # 更新图表视图 (图表已显示该股票时不重复加载，可用图表自带的刷新按钮重新获取)
+        if chart_view.current_stock_code != stock_code:
+            chart_view.load_stock(stock_code, stock_name)
         
         self.status_bar.showMessage(f'已选择股票: {stock_name} ({stock_code})', 3000)
     
+    @pyqtSlot(str, str)
     def on_sector_selected(self, sector_code: str, sector_name: str):
-        """处理板块选择事件"""
+        """处理板块选择事件 (防抖后获取成分股)"""
+        self._pending_sector = (sector_code, sector_name)
+        self._sector_debounce.start()
+        
+    def _flush_sector_selection(self):
+        """获取最后一次选择的板块成分股"""
+        sector_code, sector_name = self._pending_sector
         logger.info(f"选择板块: {sector_code} - {sector_name}")
         
-        # 获取板块成分股
-        try:
-            from src.data.sector_data import sector_data_provider
-            stocks = sector_data_provider.get_sector_stocks(sector_code)
-            
-            if stocks and hasattr(self, 'stock_list_widget'):
+        # 成分股在后台线程获取，避免网络请求阻塞界面
+        self._submit_fetch(_fetch_sector_stocks, self._apply_sector_stocks,
+                           self._on_sector_stocks_error, sector_code, sector_name)
+        
+    def _apply_sector_stocks(self, result):
+        """显示板块成分股"""
+        sector_code, sector_name, stocks = result
+        if stocks:
+            with _updates_suspended(self.stock_list_widget):
                 self.stock_list_widget.filter_by_stocks(stocks)
-                self.tab_widget.setCurrentIndex(0)  # 切换到股票列表
-                self.status_bar.showMessage(f'已切换到板块: {sector_name}', 3000)
-            else:
-                self.status_bar.showMessage(f'板块 {sector_name} 暂无数据', 3000)
-                
-        except Exception as e:
-            logger.error(f"获取板块成分股失败: {e}")
-            self.status_bar.showMessage(f'获取板块数据失败: {e}', 3000)
+            self.tab_widget.setCurrentWidget(self.stock_list_widget)  # 切换到股票列表
+            self.status_bar.showMessage(f'已切换到板块: {sector_name}', 3000)
+        else:
+            self.status_bar.showMessage(f'板块 {sector_name} 暂无数据', 3000)
+            
+    def _on_sector_stocks_error(self, error_msg):
+        """获取板块成分股失败"""
+        logger.error(f"获取板块成分股失败: {error_msg}")
+        self.status_bar.showMessage(f'获取板块数据失败: {error_msg}', 3000)
         
     def refresh_all_data(self):
         """刷新所有数据"""
+        if self._hub.is_busy():
+            self.status_bar.showMessage('数据刷新进行中，请稍候...', 2000)
+            return
         self.status_bar.showMessage('正在刷新数据...', 2000)
-        self.update_data()
-        
-        # 也刷新股票列表
-        if hasattr(self, 'stock_list_widget'):
-            self.stock_list_widget.refresh_data()
-            
-        logger.info("手动刷新数据完成")
-        
+        # 手动刷新时丢弃板块成分股缓存和共用的股票代码-名称映射，下次使用时重新获取
+        _cached_sector_stocks.cache_clear()
+        from src.data.stock_data import data_provider
+        data_provider.invalidate_name_map()
+        self._do_refresh(include_stock_list=True)
+        logger.info("已提交手动刷新请求")
+        
+    @_log_errors("创建新窗口失败")
     def new_window(self):
         """新建窗口"""
-        try:
-            new_window = MainWindow()
-            new_window.show()
-        except Exception as e:
-            logger.error(f"创建新窗口失败: {e}")
-            
+        # 以当前窗口为父对象，避免新窗口被回收；新窗口复用已加载的样式，并订阅同一个 DataHub，不会新增定时轮询
+        new_window = MainWindow(self)
+        new_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        new_window.show()
+        
     def open_strategy_window(self):
         """打开策略选股窗口"""
+        # 已打开的策略窗口直接激活，不重复创建
+        window = self._strategy_window_ref()
+        if window is not None and not sip.isdeleted(window) and window.isVisible():
+            window.raise_()
+            window.activateWindow()
+            return
+            
         try:
+            # 延迟导入: 策略模块较重，且多数会话不会打开策略窗口
             from src.ui.strategy_window import StrategyWindow
-            self.strategy_window = StrategyWindow()
-            self.strategy_window.show()
+            window = StrategyWindow(self)
+            window.setWindowFlag(Qt.WindowType.Window)
+            window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            window.strategy_applied.connect(self.on_strategy_applied, Qt.ConnectionType.UniqueConnection)
+            self._strategy_window_ref = weakref.ref(window)
+            window.show()
         except Exception as e:
             logger.error(f"打开策略窗口失败: {e}")
             QMessageBox.warning(self, "错误", f"无法打开策略选股窗口: {e}")
             
+    @pyqtSlot(list)
+    def on_strategy_applied(self, stocks):
+        """策略选股结果 - 在股票列表中显示选出的股票"""
+        if not stocks:
+            self.status_bar.showMessage('策略未选出股票', 3000)
+            return
+        with _updates_suspended(self.stock_list_widget):
+            self.stock_list_widget.filter_by_stocks(stocks)
+        self.tab_widget.setCurrentWidget(self.stock_list_widget)
+        self.status_bar.showMessage(f'策略选出 {len(stocks)} 只股票', 3000)
+            
     def toggle_fullscreen(self):
         """切换全屏模式"""
         if self.isFullScreen():
@@ -574,38 +713,44 @@ class MainWindow(QMainWindow):
                          "设计原则: 响应速度优先 | 高度可定制 | 直观易用 | 数据准确\\n\\n"
                          "© 2025 股票分析工具")
             
+    @_log_errors("恢复窗口状态失败", level="warning")
     def restore_window_state(self):
-        """恢复窗口状态"""
-        try:
+        """恢复窗口状态 (窗口几何信息由QSettings保存，首次运行时使用配置文件中的默认值)"""
+        settings = QSettings("QuantAnalyzer", "MainWindow")
+        geometry = settings.value('geometry')
+        if geometry:
+            self.restoreGeometry(geometry)
+        else:
             size = config_manager.get('ui.window_size', [1600, 1000])
             position = config_manager.get('ui.window_position', [100, 100])
-            
             self.resize(size[0], size[1])
             self.move(position[0], position[1])
-        except Exception as e:
-            logger.warning(f"恢复窗口状态失败: {e}")
+            
+        state = settings.value('windowState')
+        if state:
+            self.restoreState(state)
         
+    @_log_errors("保存窗口状态失败", level="warning")
     def save_window_state(self):
-        """保存窗口状态"""
-        try:
-            config_manager.set('ui.window_size', [self.width(), self.height()])
-            config_manager.set('ui.window_position', [self.x(), self.y()])
-            config_manager.save()
-        except Exception as e:
-            logger.warning(f"保存窗口状态失败: {e}")
+        """保存窗口状态 (几何信息和工具栏布局，不再改写配置文件)"""
+        settings = QSettings("QuantAnalyzer", "MainWindow")
+        settings.setValue('geometry', self.saveGeometry())
+        settings.setValue('windowState', self.saveState())
         
     def closeEvent(self, event):
         """窗口关闭事件"""
-        try:
-            self.save_window_state()
-            
-            # 停止定时器
-            if hasattr(self, 'update_timer'):
-                self.update_timer.stop()
-                
-            logger.info("应用程序正在退出...")
-            event.accept()
-            
-        except Exception as e:
-            logger.error(f"关闭程序时发生错误: {e}")
-            event.accept()
+        self._shutdown()
+        event.accept()
+        
+    @_log_errors("关闭程序时发生错误")
+    def _shutdown(self):
+        """保存窗口状态和待写配置并停止定时器"""
+        self.save_window_state()
+        
+        # 立即写入股票池等延迟保存的配置修改，不必等到解释器退出
+        config_manager.flush()
+        
+        # 注销刷新订阅，没有其它可见窗口时共享定时器随之暂停
+        self._hub.detach(self)
+        
+        logger.info("应用程序正在退出...")
@@ -7,6 +7,19 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 涨跌方向 -> 指数价格/涨跌样式，预先生成，刷新时只做查表
+_SIGN_QSS = {
+    1: "color: red; font-weight: bold;",
+    -1: "color: green; font-weight: bold;",
+    0: "color: black; font-weight: bold;",
+}
+_GRAY_QSS = "color: gray;"
+_RED_QSS = "color: red;"
+
+# 统计项 -> 固定样式
+_STAT_QSS = {'上涨家数': "color: red;", '下跌家数': "color: green;"}
+_STAT_DEFAULT_QSS = "color: black;"
+
 class MarketOverviewWidget(QWidget):
     """大盘概览组件"""
     
@@ -21,6 +34,13 @@ class MarketOverviewWidget(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(10)
         
+        # 共享字体: 各指数和统计标签复用同一组字体对象，不再逐个标签构造
+        self._font_name = QFont("Microsoft YaHei", 9, QFont.Weight.Bold)
+        self._font_price = QFont("Microsoft YaHei", 10, QFont.Weight.Bold)
+        self._font_change = QFont("Microsoft YaHei", 8)
+        self._font_stat = QFont("Microsoft YaHei", 8)
+        self._font_stat_bold = QFont("Microsoft YaHei", 8, QFont.Weight.Bold)
+        
         # 标题
         title_label = QLabel("大盘概览")
         title_font = QFont()
@@ -65,18 +85,18 @@ class MarketOverviewWidget(QWidget):
             
             # 指数名称
             name_label = QLabel(index_name)
-            name_label.setFont(QFont("Microsoft YaHei", 9, QFont.Weight.Bold))
+            name_label.setFont(self._font_name)
             frame_layout.addWidget(name_label)
             
             # 指数价格和涨跌
             price_layout = QHBoxLayout()
             
             price_label = QLabel("--")
-            price_label.setFont(QFont("Microsoft YaHei", 10, QFont.Weight.Bold))
+            price_label.setFont(self._font_price)
             price_layout.addWidget(price_label)
             
             change_label = QLabel("--")
-            change_label.setFont(QFont("Microsoft YaHei", 8))
+            change_label.setFont(self._font_change)
             price_layout.addWidget(change_label)
             
             price_layout.addStretch()
@@ -85,7 +105,8 @@ class MarketOverviewWidget(QWidget):
             # 保存标签引用
             self.index_labels[index_name] = {
                 'price': price_label,
-                'change': change_label
+                'change': change_label,
+                'qss': None  # 当前样式，用于避免重复设置样式表
             }
             
             layout.addWidget(frame)
@@ -113,12 +134,14 @@ class MarketOverviewWidget(QWidget):
             
             # 标签
             label = QLabel(label_text + ":")
-            label.setFont(QFont("Microsoft YaHei", 8))
+            label.setFont(self._font_stat)
             layout.addWidget(label, row, col)
             
             # 数值
             value_label = QLabel(default_value)
-            value_label.setFont(QFont("Microsoft YaHei", 8, QFont.Weight.Bold))
+            value_label.setFont(self._font_stat_bold)
+            # 上涨下跌颜色固定，创建时设置一次，刷新时只更新文字
+            value_label.setStyleSheet(_STAT_QSS.get(label_text, _STAT_DEFAULT_QSS))
             layout.addWidget(value_label, row, col + 1)
             
             self.stats_labels[label_text] = value_label
@@ -152,16 +175,8 @@ class MarketOverviewWidget(QWidget):
                     change_text = f"{change_pct:+.2f}% ({change_amount:+.2f})"
                     labels['change'].setText(change_text)
                     
-                    # 设置颜色
-                    if change_pct > 0:
-                        color = "red"
-                    elif change_pct < 0:
-                        color = "green"
-                    else:
-                        color = "black"
-                    
-                    labels['price'].setStyleSheet(f"color: {color}; font-weight: bold;")
-                    labels['change'].setStyleSheet(f"color: {color}; font-weight: bold;")
+                    # 设置颜色 - 仅在样式变化时重设样式表
+                    self._set_labels_qss(labels, _SIGN_QSS[(change_pct > 0) - (change_pct < 0)])
             
             # 更新统计数据
             self._update_market_stats()
@@ -178,8 +193,7 @@ class MarketOverviewWidget(QWidget):
             labels = self.index_labels[index_name]
             labels['price'].setText("--")
             labels['change'].setText("数据获取中...")
-            labels['price'].setStyleSheet("color: gray;")
-            labels['change'].setStyleSheet("color: gray;")
+            self._set_labels_qss(labels, _GRAY_QSS)
             
     def _show_error_message(self, error_msg: str):
         """显示错误消息"""
@@ -187,42 +201,25 @@ class MarketOverviewWidget(QWidget):
             labels = self.index_labels[index_name]
             labels['price'].setText("--")
             labels['change'].setText("连接异常")
-            labels['price'].setStyleSheet("color: red;")
-            labels['change'].setStyleSheet("color: red;")
+            self._set_labels_qss(labels, _RED_QSS)
+            
+    @staticmethod
+    def _set_labels_qss(labels, qss):
+        """设置指数价格和涨跌标签的样式，与当前样式相同时跳过 (避免重复触发样式表解析)"""
+        if labels['qss'] is not qss:
+            labels['price'].setStyleSheet(qss)
+            labels['change'].setStyleSheet(qss)
+            labels['qss'] = qss
             
     def _update_market_stats(self):
         """更新市场统计数据"""
         try:
-            # 这里应该从数据源获取真实的市场统计数据
-            # 目前使用模拟数据
-            import random
-            
-            total_stocks = 4800
-            up_count = random.randint(1500, 2500)
-            down_count = random.randint(1500, 2500)
-            flat_count = total_stocks - up_count - down_count
-            
-            stats_data = {
-                '上涨家数': f"{up_count}",
-                '下跌家数': f"{down_count}",
-                '平盘家数': f"{flat_count}",
-                '涨停家数': f"{random.randint(10, 100)}",
-                '跌停家数': f"{random.randint(5, 50)}",
-                '总成交额': f"{random.randint(8000, 15000)}亿"
-            }
+            stats_data = data_provider.get_market_stats()
             
             for stat_name, value in stats_data.items():
                 if stat_name in self.stats_labels:
                     label = self.stats_labels[stat_name]
-                    label.setText(value)
-                    
-                    # 设置上涨下跌颜色
-                    if stat_name == '上涨家数':
-                        label.setStyleSheet("color: red;")
-                    elif stat_name == '下跌家数':
-                        label.setStyleSheet("color: green;")
-                    else:
-                        label.setStyleSheet("color: black;")
+                    label.setText(f"{value}亿" if stat_name == '总成交额' else str(value))
                         
         except Exception as e:
             logger.error(f"更新市场统计失败: {e}")
@@ -6,40 +6,192 @@
 显示行业板块和概念板块的实时数据和热度排行
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                            QTableWidgetItem, QTabWidget, QLabel, QPushButton,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                            QTabWidget, QLabel, QPushButton,
                             QComboBox, QLineEdit, QSplitter, QHeaderView,
                             QMessageBox, QMenu, QFrame)
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import (QTimer, Qt, pyqtSignal, QThread, pyqtSlot,
+                          QAbstractTableModel, QModelIndex)
 from PyQt6.QtGui import QFont, QColor, QAction
+import time
+import numpy as np
 import pandas as pd
 from src.data.sector_data import sector_data_provider
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 板块类型 -> 板块类型列的取值
+_SECTOR_TYPE_NAMES = {'industry': '行业板块', 'concept': '概念板块'}
+
+# 搜索框输入停顿多久后再过滤表格 (毫秒)
+_SEARCH_DEBOUNCE_MS = 200
+
+# 热度排行结果缓存: (排行类型, 条数) -> (获取时间, 数据)；快速切换排行类型时直接复用
+_HOT_CACHE_TTL = 25  # 秒，略短于30秒的自动刷新周期
+_hot_cache: dict = {}
+
+
+# 表格文字颜色
+_RED = QColor(220, 38, 38)
+_GREEN = QColor(34, 197, 94)
+_ORANGE = QColor(251, 146, 60)
+_MEDAL_COLORS = (QColor(255, 215, 0), QColor(192, 192, 192), QColor(205, 127, 50))  # 前三名: 金、银、铜
+
+# 数值列的显示格式 (整列向量化格式化为字符串数组)，未列出的列直接转为字符串
+_FORMATTERS = {
+    '平均涨跌幅': lambda v: np.char.add(np.where(v >= 0, '+', ''), np.char.mod('%.2f%%', v)),
+    '总成交额': lambda v: np.char.mod('%.1f', v / 100000000),  # 转换为亿元
+    '平均换手率': lambda v: np.char.mod('%.2f%%', v),
+    '热度指数': lambda v: np.char.mod('%.1f', v),
+}
+
+
+def _format_column(field, column: pd.Series):
+    """把一整列格式化为显示字符串数组"""
+    formatter = _FORMATTERS.get(field)
+    if formatter is None:
+        return column.astype(str).to_numpy()
+    return formatter(column.to_numpy(dtype=float))
+
+
+# 颜色编码 -> 文字颜色 (0 表示默认颜色)
+_PALETTE = (None, _RED, _GREEN, _ORANGE)
+
+
+def _color_codes(field, values: np.ndarray):
+    """按数据列整列计算颜色编码 (对应 _PALETTE 下标)"""
+    if field == '平均涨跌幅':
+        return np.select([values > 0, values < 0], [1, 2], 0).astype(np.uint8)
+    if field == '涨停数量':
+        return np.where(values > 0, 1, 0).astype(np.uint8)
+    if field == '跌停数量':
+        return np.where(values > 0, 2, 0).astype(np.uint8)
+    if field == '热度指数':
+        return np.select([values >= 80, values >= 60], [1, 3], 0).astype(np.uint8)  # 高热度红色，中热度橙色
+    return np.zeros(len(values), dtype=np.uint8)
+
+
+class SectorTableModel(QAbstractTableModel):
+    """板块实时数据表格模型 - 直接持有DataFrame，视图只查询可见单元格，刷新时不再逐格创建表格项"""
+    
+    # 列定义: (表头, 数据列)
+    COLUMNS = (
+        ('板块名称', '板块名称'), ('类型', '板块类型'), ('成分股数', '成分股数量'),
+        ('平均涨跌幅', '平均涨跌幅'), ('涨停数', '涨停数量'), ('跌停数', '跌停数量'),
+        ('总成交额(亿)', '总成交额'), ('平均换手率', '平均换手率'), ('领涨股', '领涨股'),
+        ('热度指数', '热度指数'), ('更新时间', '更新时间'),
+    )
+    # 按数值着色的数据列
+    COLORED = {'平均涨跌幅', '涨停数量', '跌停数量', '热度指数'}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = 0
+        self._columns = {}  # 数据列 -> numpy数组，按行号直接取值
+        self._display = {}  # 数据列 -> 预先格式化好的显示字符串数组
+        self._lowered = {}  # 列号 -> 小写显示文本数组，搜索过滤时按需生成
+        self._colors = {}  # 着色数据列 -> 颜色编码数组
+        
+    def set_data(self, data: pd.DataFrame):
+        """替换表格数据 - 行数和列不变时只通知数据变化 (保留选中行和滚动位置)，否则重置模型"""
+        # 每列只提取一次numpy数组，取单元格时按位置索引，不再逐行装箱为Series
+        fields = {field for _, field in self.COLUMNS if field is not None} | {'板块代码'}
+        columns = {field: data[field].to_numpy() for field in fields if field in data.columns}
+        # 显示文本在重置前整列格式化，视图绘制时只取现成的字符串
+        display = {field: _format_column(field, data[field]) for field in columns}
+        colors = {field: _color_codes(field, data[field].to_numpy(dtype=float))
+                  for field in self.COLORED if field in columns}
+        rows = len(data) if columns else 0
+        same_shape = rows == self._rows and columns.keys() == self._columns.keys()
+        
+        if not same_shape:
+            self.beginResetModel()
+        self._rows = rows
+        self._columns = columns
+        self._display = display
+        self._lowered = {}
+        self._colors = colors
+        if not same_shape:
+            self.endResetModel()
+        elif rows:
+            # 一次 dataChanged 覆盖整张表，视图只重绘可见单元格
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, len(self.COLUMNS) - 1))
+        
+    def lowered_text(self, column: int):
+        """返回指定列的小写显示文本数组 (按列缓存，数据重置时失效)"""
+        lowered = self._lowered.get(column)
+        if lowered is None:
+            values = self._display.get(self.COLUMNS[column][1])
+            if values is None:
+                values = np.full(self._rows, '')
+            lowered = self._lowered[column] = np.char.lower(values.astype(str))
+        return lowered
+        
+    def sector_at(self, row: int):
+        """返回指定行的 (板块代码, 板块名称)"""
+        return self._columns['板块代码'][row], self._columns['板块名称'][row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        field = self.COLUMNS[col][1]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if field is None:  # 排名列
+                return str(row + 1)
+            values = self._display.get(field)
+            return None if values is None else str(values[row])
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if field is None:
+                return _MEDAL_COLORS[row] if row < len(_MEDAL_COLORS) else None
+            codes = self._colors.get(field)
+            if codes is not None:
+                return _PALETTE[codes[row]]
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole and field is None:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.UserRole:
+            return self._columns['板块代码'][row]
+        return None
+
+
+class HotSectorTableModel(SectorTableModel):
+    """热度排行表格模型 - 首列为排名，前三名使用金银铜色"""
+    
+    COLUMNS = (
+        ('排名', None), ('板块名称', '板块名称'), ('类型', '板块类型'), ('平均涨跌幅', '平均涨跌幅'),
+        ('热度指数', '热度指数'), ('涨停数', '涨停数量'), ('领涨股', '领涨股'),
+    )
+    COLORED = {'平均涨跌幅'}
+
+
 class SectorDataWorker(QThread):
     """板块数据获取工作线程"""
     data_ready = pyqtSignal(pd.DataFrame)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, sector_type='all'):
+    def __init__(self):
         super().__init__()
-        self.sector_type = sector_type
         self.running = True
     
     def run(self):
-        """运行数据获取"""
+        """运行数据获取 - 返回全部板块，类型和搜索筛选由界面一次完成"""
         try:
             if self.running:
                 data = sector_data_provider.get_sector_realtime_data()
                 if not data.empty:
-                    # 筛选板块类型
-                    if self.sector_type == 'industry':
-                        data = data[data['板块类型'] == '行业板块']
-                    elif self.sector_type == 'concept':
-                        data = data[data['板块类型'] == '概念板块']
-                    
                     self.data_ready.emit(data)
                 else:
                     self.error_occurred.emit("无法获取板块数据")
@@ -50,6 +202,24 @@ class SectorDataWorker(QThread):
         """停止线程"""
         self.running = False
 
+class HotSectorsWorker(QThread):
+    """热度排行获取工作线程"""
+    data_ready = pyqtSignal(pd.DataFrame)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, sector_type='all', limit=20):
+        super().__init__()
+        self.sector_type = sector_type
+        self.limit = limit
+    
+    def run(self):
+        """运行数据获取"""
+        try:
+            data = sector_data_provider.get_hot_sectors(self.sector_type, limit=self.limit)
+            self.data_ready.emit(data)
+        except Exception as e:
+            self.error_occurred.emit(f"刷新热度排行失败: {str(e)}")
+
 class SectorInfoPanel(QWidget):
     """板块信息面板"""
     
@@ -57,9 +227,22 @@ class SectorInfoPanel(QWidget):
     
     def __init__(self):
         super().__init__()
+        self.worker = None
+        self._refresh_pending = False  # 获取进行中又收到刷新请求 (如切换板块类型)，完成后立即补一次
+        self.hot_worker = None
+        self._hot_refresh_pending = False
+        self._hidden_rows = {}  # 表格 -> 当前隐藏行的布尔数组，过滤时只改动显隐发生变化的行
+        self._last_data_hash = None  # 上次显示的 (数据哈希, 板块类型, 搜索文本)，数据未变化时跳过表格重建
+        self._sector_type = 'all'  # 最近一次刷新请求的板块类型
+        
+        # 搜索防抖: 输入停顿后才过滤一次，不在每次按键时遍历整张表格
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+        
         self.init_ui()
         self.setup_timer()
-        self.worker = None
         
     def init_ui(self):
         """初始化UI"""
@@ -112,9 +295,11 @@ class SectorInfoPanel(QWidget):
         self.realtime_tab = self.create_realtime_tab()
         self.tab_widget.addTab(self.realtime_tab, "实时数据")
         
-        # 热度排行标签页
-        self.hot_tab = self.create_hot_sectors_tab()
-        self.tab_widget.addTab(self.hot_tab, "热度排行")
+        # 热度排行标签页先放占位控件，首次切换到时再创建
+        self.hot_tab = None
+        self._hot_placeholder = QWidget()
+        self.tab_widget.addTab(self._hot_placeholder, "热度排行")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tab_widget)
         
@@ -129,19 +314,17 @@ class SectorInfoPanel(QWidget):
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(0, 5, 0, 0)
         
-        # 板块数据表格
-        self.sectors_table = QTableWidget()
+        # 板块数据表格 (模型/视图，列定义见 SectorTableModel)
+        self.sectors_model = SectorTableModel(self)
+        self.sectors_table = QTableView()
+        self.sectors_table.setModel(self.sectors_model)
         self.sectors_table.setAlternatingRowColors(True)
-        self.sectors_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.sectors_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.sectors_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.sectors_table.customContextMenuRequested.connect(self.show_sector_context_menu)
-        self.sectors_table.itemDoubleClicked.connect(self.on_sector_double_clicked)
-        
-        # 设置表格列
-        columns = ['板块名称', '类型', '成分股数', '平均涨跌幅', '涨停数', '跌停数', 
-                  '总成交额(亿)', '平均换手率', '领涨股', '热度指数', '更新时间']
-        self.sectors_table.setColumnCount(len(columns))
-        self.sectors_table.setHorizontalHeaderLabels(columns)
+        self.sectors_table.doubleClicked.connect(self.on_sector_double_clicked)
+        # 模型重置后所有行恢复显示，丢弃记录的隐藏状态
+        self.sectors_model.modelReset.connect(lambda: self._hidden_rows.pop(self.sectors_table, None))
         
         # 设置列宽
         header = self.sectors_table.horizontalHeader()
@@ -178,16 +361,13 @@ class SectorInfoPanel(QWidget):
         
         layout.addLayout(control_layout)
         
-        # 热度排行表格
-        self.hot_table = QTableWidget()
+        # 热度排行表格 (列定义见 HotSectorTableModel)
+        self.hot_model = HotSectorTableModel(self)
+        self.hot_table = QTableView()
+        self.hot_table.setModel(self.hot_model)
         self.hot_table.setAlternatingRowColors(True)
-        self.hot_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.hot_table.itemDoubleClicked.connect(self.on_hot_sector_double_clicked)
-        
-        # 设置热度排行表格列
-        hot_columns = ['排名', '板块名称', '类型', '平均涨跌幅', '热度指数', '涨停数', '领涨股']
-        self.hot_table.setColumnCount(len(hot_columns))
-        self.hot_table.setHorizontalHeaderLabels(hot_columns)
+        self.hot_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.hot_table.doubleClicked.connect(self.on_hot_sector_double_clicked)
         
         # 设置热度表格列宽
         hot_header = self.hot_table.horizontalHeader()
@@ -204,15 +384,42 @@ class SectorInfoPanel(QWidget):
         layout.addWidget(self.hot_table)
         return widget
     
+    def _on_tab_changed(self, index: int):
+        """切换标签页 - 首次打开热度排行时创建内容，之后每次切换回来刷新一次 (隐藏期间不刷新)"""
+        widget = self.tab_widget.widget(index)
+        if widget is self._hot_placeholder:
+            self.hot_tab = self.create_hot_sectors_tab()
+            # 替换过程中屏蔽 currentChanged，避免移除当前页时重复触发
+            self.tab_widget.blockSignals(True)
+            try:
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, self.hot_tab, "热度排行")
+                self.tab_widget.setCurrentIndex(index)
+            finally:
+                self.tab_widget.blockSignals(False)
+            self._hot_placeholder.deleteLater()
+            self._hot_placeholder = None
+            widget = self.hot_tab
+        if widget is not None and widget is self.hot_tab:
+            self.refresh_hot_sectors()
+    
     def setup_timer(self):
-        """设置定时器"""
-        self.timer = QTimer()
+        """设置定时器 - 单次定时，每次获取完成后再安排下一次，慢网络下不会堆积刷新"""
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.refresh_data)
         self.timer.start(30000)  # 30秒刷新一次
     
     def refresh_data(self):
         """刷新数据"""
         try:
+            # 上一次获取尚未完成时不再阻塞等待，记下请求，完成后补刷
+            if self.worker and self.worker.isRunning():
+                self._refresh_pending = True
+                return
+            self._refresh_pending = False
+            self.timer.stop()
+            
             self.status_label.setText("正在获取板块数据...")
             self.refresh_btn.setEnabled(False)
             
@@ -222,15 +429,10 @@ class SectorInfoPanel(QWidget):
                 '行业板块': 'industry', 
                 '概念板块': 'concept'
             }
-            sector_type = sector_type_map.get(self.sector_type_combo.currentText(), 'all')
-            
-            # 停止之前的工作线程
-            if self.worker and self.worker.isRunning():
-                self.worker.stop()
-                self.worker.wait()
+            self._sector_type = sector_type_map.get(self.sector_type_combo.currentText(), 'all')
             
             # 启动新的工作线程
-            self.worker = SectorDataWorker(sector_type)
+            self.worker = SectorDataWorker()
             self.worker.data_ready.connect(self.update_sectors_data)
             self.worker.error_occurred.connect(self.handle_error)
             self.worker.finished.connect(self.on_data_loading_finished)
@@ -247,77 +449,31 @@ class SectorInfoPanel(QWidget):
                 self.status_label.setText("暂无板块数据")
                 return
             
-            # 应用搜索过滤
+            # 热度排行有独立的数据来源，实时数据无变化时也要刷新；只在其标签页可见时更新，切换过去时会再刷新
+            if self.hot_tab is not None and self.tab_widget.currentWidget() is self.hot_tab:
+                self.refresh_hot_sectors()
+            
+            # 数据和搜索条件都与上次相同 (如休市期间) 时只更新时间，不重建表格
             search_text = self.search_input.text().strip()
+            data_hash = (int(pd.util.hash_pandas_object(data, index=False).sum()), self._sector_type, search_text)
+            if data_hash == self._last_data_hash:
+                self.status_label.setText(f"数据无变化 {self.sectors_model.rowCount()} 个板块 - {pd.Timestamp.now().strftime('%H:%M:%S')}")
+                return
+            self._last_data_hash = data_hash
+            
+            # 板块类型和搜索条件合并为一个掩码，只做一次筛选 (全部保留时不复制数据)
+            mask = np.ones(len(data), dtype=bool)
+            type_name = _SECTOR_TYPE_NAMES.get(self._sector_type)
+            if type_name:
+                mask &= data['板块类型'].to_numpy() == type_name
             if search_text:
-                mask = data['板块名称'].str.contains(search_text, case=False, na=False)
+                mask &= data['板块名称'].str.contains(search_text, case=False, na=False).to_numpy()
+            if not mask.all():
                 data = data[mask]
             
-            # 更新实时数据表格
-            self.sectors_table.setRowCount(len(data))
-            
-            for row, (_, sector) in enumerate(data.iterrows()):
-                # 板块名称
-                name_item = QTableWidgetItem(sector['板块名称'])
-                name_item.setData(Qt.ItemDataRole.UserRole, sector['板块代码'])
-                self.sectors_table.setItem(row, 0, name_item)
-                
-                # 板块类型
-                type_item = QTableWidgetItem(sector['板块类型'])
-                self.sectors_table.setItem(row, 1, type_item)
-                
-                # 成分股数量
-                count_item = QTableWidgetItem(str(sector['成分股数量']))
-                self.sectors_table.setItem(row, 2, count_item)
-                
-                # 平均涨跌幅（带颜色）
-                change_pct = sector['平均涨跌幅']
-                change_item = QTableWidgetItem(f"{change_pct:+.2f}%")
-                if change_pct > 0:
-                    change_item.setForeground(QColor(220, 38, 38))  # 红色
-                elif change_pct < 0:
-                    change_item.setForeground(QColor(34, 197, 94))  # 绿色
-                self.sectors_table.setItem(row, 3, change_item)
-                
-                # 涨停数量
-                limit_up_item = QTableWidgetItem(str(sector['涨停数量']))
-                if sector['涨停数量'] > 0:
-                    limit_up_item.setForeground(QColor(220, 38, 38))
-                self.sectors_table.setItem(row, 4, limit_up_item)
-                
-                # 跌停数量
-                limit_down_item = QTableWidgetItem(str(sector['跌停数量']))
-                if sector['跌停数量'] > 0:
-                    limit_down_item.setForeground(QColor(34, 197, 94))
-                self.sectors_table.setItem(row, 5, limit_down_item)
-                
-                # 总成交额（转换为亿元）
-                amount_item = QTableWidgetItem(f"{sector['总成交额']/100000000:.1f}")
-                self.sectors_table.setItem(row, 6, amount_item)
-                
-                # 平均换手率
-                turnover_item = QTableWidgetItem(f"{sector['平均换手率']:.2f}%")
-                self.sectors_table.setItem(row, 7, turnover_item)
-                
-                # 领涨股
-                gainer_item = QTableWidgetItem(sector['领涨股'])
-                self.sectors_table.setItem(row, 8, gainer_item)
-                
-                # 热度指数
-                heat_item = QTableWidgetItem(f"{sector['热度指数']:.1f}")
-                heat_value = sector['热度指数']
-                if heat_value >= 80:
-                    heat_item.setForeground(QColor(220, 38, 38))  # 高热度红色
-                elif heat_value >= 60:
-                    heat_item.setForeground(QColor(251, 146, 60))  # 中热度橙色
-                self.sectors_table.setItem(row, 9, heat_item)
-                
-                # 更新时间
-                time_item = QTableWidgetItem(sector['更新时间'])
-                self.sectors_table.setItem(row, 10, time_item)
-            
-            # 更新热度排行
-            self.refresh_hot_sectors()
+            # 更新实时数据表格 (行数不变时模型不重置，行的显隐状态保留，按新数据重新过滤一次)
+            self.sectors_model.set_data(data)
+            self._apply_search_filter()
             
             self.status_label.setText(f"已更新 {len(data)} 个板块数据 - {pd.Timestamp.now().strftime('%H:%M:%S')}")
             
@@ -336,58 +492,50 @@ class SectorInfoPanel(QWidget):
             }
             hot_type = hot_type_map.get(self.hot_type_combo.currentText(), 'all')
             
-            # 获取热门板块数据
-            hot_data = sector_data_provider.get_hot_sectors(hot_type, limit=20)
-            
-            if hot_data.empty:
-                self.hot_table.setRowCount(0)
+            # 缓存未过期时直接使用 (仍有旧请求在获取时，完成后再按当前类型补刷一次)
+            entry = _hot_cache.get((hot_type, 20))
+            if entry and time.monotonic() - entry[0] < _HOT_CACHE_TTL:
+                self._populate_hot_table(entry[1])
+                if self.hot_worker and self.hot_worker.isRunning():
+                    self._hot_refresh_pending = True
                 return
             
-            # 更新热度排行表格
-            self.hot_table.setRowCount(len(hot_data))
+            # 在后台线程获取热门板块数据，上一次尚未完成时完成后补刷
+            if self.hot_worker and self.hot_worker.isRunning():
+                self._hot_refresh_pending = True
+                return
+            self._hot_refresh_pending = False
             
-            for row, (_, sector) in enumerate(hot_data.iterrows()):
-                # 排名
-                rank_item = QTableWidgetItem(str(row + 1))
-                rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if row < 3:  # 前三名特殊颜色
-                    colors = [QColor(255, 215, 0), QColor(192, 192, 192), QColor(205, 127, 50)]
-                    rank_item.setForeground(colors[row])
-                self.hot_table.setItem(row, 0, rank_item)
-                
-                # 板块名称
-                name_item = QTableWidgetItem(sector['板块名称'])
-                name_item.setData(Qt.ItemDataRole.UserRole, sector['板块代码'])
-                self.hot_table.setItem(row, 1, name_item)
-                
-                # 类型
-                type_item = QTableWidgetItem(sector['板块类型'])
-                self.hot_table.setItem(row, 2, type_item)
-                
-                # 平均涨跌幅
-                change_pct = sector['平均涨跌幅']
-                change_item = QTableWidgetItem(f"{change_pct:+.2f}%")
-                if change_pct > 0:
-                    change_item.setForeground(QColor(220, 38, 38))
-                elif change_pct < 0:
-                    change_item.setForeground(QColor(34, 197, 94))
-                self.hot_table.setItem(row, 3, change_item)
-                
-                # 热度指数
-                heat_item = QTableWidgetItem(f"{sector['热度指数']:.1f}")
-                self.hot_table.setItem(row, 4, heat_item)
-                
-                # 涨停数
-                limit_up_item = QTableWidgetItem(str(sector['涨停数量']))
-                self.hot_table.setItem(row, 5, limit_up_item)
-                
-                # 领涨股
-                gainer_item = QTableWidgetItem(sector['领涨股'])
-                self.hot_table.setItem(row, 6, gainer_item)
+            self.hot_worker = HotSectorsWorker(hot_type, limit=20)
+            self.hot_worker.data_ready.connect(self._on_hot_sectors_ready)
+            self.hot_worker.error_occurred.connect(logger.error)
+            self.hot_worker.finished.connect(self._on_hot_sectors_finished)
+            self.hot_worker.start()
                 
         except Exception as e:
             logger.error(f"刷新热度排行失败: {e}")
     
+    @pyqtSlot(pd.DataFrame)
+    def _on_hot_sectors_ready(self, hot_data: pd.DataFrame):
+        """热度排行获取成功 - 写入缓存并更新表格"""
+        worker = self.sender()
+        if worker is not None:
+            _hot_cache[(worker.sector_type, worker.limit)] = (time.monotonic(), hot_data)
+        self._populate_hot_table(hot_data)
+    
+    def _populate_hot_table(self, hot_data: pd.DataFrame):
+        """更新热度排行表格 (数据为空时清空表格)"""
+        try:
+            self.hot_model.set_data(hot_data)
+        except Exception as e:
+            logger.error(f"更新热度排行失败: {e}")
+    
+    @pyqtSlot()
+    def _on_hot_sectors_finished(self):
+        """热度排行获取完成 - 期间有新的请求 (如切换排行类型) 时再获取一次"""
+        if self._hot_refresh_pending:
+            self.refresh_hot_sectors()
+    
     @pyqtSlot(str)
     def handle_error(self, error_msg: str):
         """处理错误"""
@@ -397,31 +545,54 @@ class SectorInfoPanel(QWidget):
     
     @pyqtSlot()
     def on_data_loading_finished(self):
-        """数据加载完成"""
+        """数据加载完成 - 有待处理的刷新请求时立即执行，否则安排下一次定时刷新"""
         self.refresh_btn.setEnabled(True)
+        if self._refresh_pending:
+            self.refresh_data()
+        else:
+            self.timer.start(30000)
     
     def on_sector_type_changed(self, text: str):
         """板块类型改变"""
         self.refresh_data()
     
     def on_search_text_changed(self, text: str):
-        """搜索文本改变"""
-        # 实时过滤当前数据
-        if hasattr(self, 'sectors_table'):
-            self.filter_table_data(self.sectors_table, text, 0)  # 在板块名称列中搜索
+        """搜索文本改变 - 重新开始防抖计时"""
+        self._search_timer.start()
+    
+    def _apply_search_filter(self):
+        """输入停顿后过滤当前数据"""
+        self.filter_table_data(self.sectors_table, self.search_input.text(), 0)  # 在板块名称列中搜索
     
-    def filter_table_data(self, table: QTableWidget, search_text: str, column: int):
+    def filter_table_data(self, table: QTableView, search_text: str, column: int):
         """过滤表格数据"""
-        for row in range(table.rowCount()):
-            item = table.item(row, column)
-            if item:
-                # 如果搜索文本为空或者在项目文本中找到，显示该行
-                visible = not search_text or search_text.lower() in item.text().lower()
-                table.setRowHidden(row, not visible)
+        names = table.model().lowered_text(column)
+        # 如果搜索文本为空或者在单元格文本中找到，显示该行 (整列一次向量化匹配)
+        search_text = search_text.lower()
+        if search_text:
+            hidden = np.char.find(names, search_text) < 0
+        else:
+            hidden = np.zeros(len(names), dtype=bool)
+        
+        previous = self._hidden_rows.get(table)
+        if previous is None or len(previous) != len(hidden):
+            previous = np.zeros(len(hidden), dtype=bool)
+        changed = np.flatnonzero(hidden != previous)
+        self._hidden_rows[table] = hidden
+        if not len(changed):
+            return
+        
+        # 只改动显隐发生变化的行，期间暂停重绘，结束后统一刷新一次
+        table.setUpdatesEnabled(False)
+        try:
+            for row in changed.tolist():
+                table.setRowHidden(row, bool(hidden[row]))
+        finally:
+            table.setUpdatesEnabled(True)
     
     def show_sector_context_menu(self, position):
         """显示板块右键菜单"""
-        if self.sectors_table.itemAt(position) is None:
+        if not self.sectors_table.indexAt(position).isValid():
             return
         
         menu = QMenu(self)
@@ -442,60 +613,58 @@ class SectorInfoPanel(QWidget):
         
         menu.exec(self.sectors_table.mapToGlobal(position))
     
-    def on_sector_double_clicked(self, item):
+    def on_sector_double_clicked(self, index):
         """板块双击事件"""
         self.view_sector_detail()
     
-    def on_hot_sector_double_clicked(self, item):
+    def on_hot_sector_double_clicked(self, index):
         """热度排行双击事件"""
-        row = item.row()
-        name_item = self.hot_table.item(row, 1)
-        if name_item:
-            sector_code = name_item.data(Qt.ItemDataRole.UserRole)
-            sector_name = name_item.text()
+        if index.isValid():
+            sector_code, sector_name = self.hot_model.sector_at(index.row())
             self.sector_selected.emit(sector_code, sector_name)
+            
+    def _current_sector(self):
+        """实时数据表格当前行的 (板块代码, 板块名称)，没有选中行时返回 None"""
+        current_row = self.sectors_table.currentIndex().row()
+        if current_row < 0:
+            return None
+        return self.sectors_model.sector_at(current_row)
     
     def view_sector_detail(self):
         """查看板块详情"""
-        current_row = self.sectors_table.currentRow()
-        if current_row >= 0:
-            name_item = self.sectors_table.item(current_row, 0)
-            if name_item:
-                sector_code = name_item.data(Qt.ItemDataRole.UserRole)
-                sector_name = name_item.text()
-                self.sector_selected.emit(sector_code, sector_name)
+        sector = self._current_sector()
+        if sector:
+            self.sector_selected.emit(*sector)
     
     def view_sector_stocks(self):
         """查看板块成分股"""
-        current_row = self.sectors_table.currentRow()
-        if current_row >= 0:
-            name_item = self.sectors_table.item(current_row, 0)
-            if name_item:
-                sector_code = name_item.data(Qt.ItemDataRole.UserRole)
-                sector_name = name_item.text()
-                
-                # 获取成分股
-                stocks = sector_data_provider.get_sector_stocks(sector_code)
-                if stocks:
-                    stocks_text = "\n".join([f"• {stock}" for stock in stocks])
-                    QMessageBox.information(self, f"{sector_name} - 成分股", 
-                                          f"成分股列表 ({len(stocks)}只):\n\n{stocks_text}")
-                else:
-                    QMessageBox.information(self, "提示", f"{sector_name} 暂无成分股数据")
+        sector = self._current_sector()
+        if sector:
+            sector_code, sector_name = sector
+            
+            # 获取成分股
+            stocks = sector_data_provider.get_sector_stocks(sector_code)
+            if stocks:
+                stocks_text = "\n".join([f"• {stock}" for stock in stocks])
+                QMessageBox.information(self, f"{sector_name} - 成分股", 
+                                      f"成分股列表 ({len(stocks)}只):\n\n{stocks_text}")
+            else:
+                QMessageBox.information(self, "提示", f"{sector_name} 暂无成分股数据")
     
     def copy_sector_name(self):
         """复制板块名称"""
-        current_row = self.sectors_table.currentRow()
-        if current_row >= 0:
-            name_item = self.sectors_table.item(current_row, 0)
-            if name_item:
-                from PyQt6.QtWidgets import QApplication
-                QApplication.clipboard().setText(name_item.text())
-                self.status_label.setText(f"已复制: {name_item.text()}")
+        sector = self._current_sector()
+        if sector:
+            sector_name = sector[1]
+            from PyQt6.QtWidgets import QApplication
+            QApplication.clipboard().setText(sector_name)
+            self.status_label.setText(f"已复制: {sector_name}")
     
     def closeEvent(self, event):
         """关闭事件"""
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker.wait()
+        if self.hot_worker and self.hot_worker.isRunning():
+            self.hot_worker.wait()
         event.accept()
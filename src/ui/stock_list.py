@@ -1,15 +1,207 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QHeaderView, QLineEdit, QPushButton,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                             QHeaderView, QLineEdit, QPushButton,
                              QComboBox, QLabel, QMenu, QMessageBox, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSortFilterProxyModel
+from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, QSortFilterProxyModel,
+                          QAbstractTableModel, QModelIndex, QThreadPool)
 from PyQt6.QtGui import QFont, QColor, QAction, QBrush
+import numpy as np
 import pandas as pd
+from typing import Optional
 from src.data.stock_data import data_provider
 from src.utils.config import config_manager
 from src.utils.logger import get_logger
+from src.utils.formatting import format_scaled
+from src.ui.workers import FetchRunnable, BatchFetchRunnable
 
 logger = get_logger(__name__)
 
+# 搜索框输入停顿多久后再过滤 (毫秒)
+_SEARCH_DEBOUNCE_MS = 150
+
+# 全部股票模式: 显示的股票数量上限，以及每批获取的股票数量
+_ALL_STOCKS_LIMIT = 100
+_ALL_STOCKS_BATCH_SIZE = 50
+
+# 表头 -> 数据列
+_COLUMN_MAPPING = {
+    '代码': '代码',
+    '名称': '名称', 
+    '现价': '最新价',
+    '涨跌幅': '涨跌幅',
+    '涨跌额': '涨跌额',
+    '成交量': '成交量',
+    '成交额': '成交额',
+    '换手率': '换手率',
+    '市盈率': '市盈率-动态',
+    '市净率': '市净率'
+}
+
+# 按数值排序的列 / 按涨跌着色的列
+_NUMERIC_HEADERS = frozenset({'现价', '涨跌幅', '涨跌额', '成交量', '成交额', '换手率', '市盈率', '市净率'})
+_COLORED_HEADERS = frozenset({'涨跌幅', '涨跌额'})
+
+# 数值列的显示格式 (成交量、成交额按亿/万换算单位，未列出的列直接转为字符串)
+_NUMBER_FORMATS = {
+    '现价': '%.2f', '涨跌额': '%.2f', '市盈率': '%.2f', '市净率': '%.2f',
+    '涨跌幅': '%.2f%%', '换手率': '%.2f%%',
+}
+_SCALED_HEADERS = frozenset({'成交量', '成交额'})
+
+# 空值或缺失列的显示文本
+_EMPTY_TEXT = '--'
+
+
+def _format_column(header: str, column: pd.Series, values: Optional[np.ndarray] = None) -> np.ndarray:
+    """把一整列格式化为显示字符串数组 - 空值显示为 _EMPTY_TEXT，无法转为数值的保留原文
+    
+    values 为调用方已转换好的数值数组 (无法转换的为 NaN)，传入时不再重复转换
+    """
+    out = column.astype(str).to_numpy(dtype=object)
+    if header in _NUMBER_FORMATS or header in _SCALED_HEADERS:
+        if values is None:
+            values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        if header in _SCALED_HEADERS:
+            text = format_scaled(values)
+        else:
+            text = np.char.mod(_NUMBER_FORMATS[header], values)
+        valid = ~np.isnan(values)
+        out[valid] = text[valid]
+    out[column.isna().to_numpy() | (column.to_numpy(dtype=object) == '')] = _EMPTY_TEXT
+    return out
+
+
+# 涨跌颜色画刷，所有行共用
+_RISE_BRUSH = QBrush(QColor(255, 0, 0))   # 红色
+_FALL_BRUSH = QBrush(QColor(0, 128, 0))   # 绿色
+_SIGN_BRUSHES = {1: _RISE_BRUSH, -1: _FALL_BRUSH}
+
+
+class StockTableModel(QAbstractTableModel):
+    """股票表格模型 - 直接持有按列整理好的数据，视图只查询可见单元格，刷新时不再逐格创建表格项"""
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = 0
+        self._display = {}  # 列号 -> 显示字符串数组
+        self._sort_keys = {}  # 列号 -> 排序值数组 (数值列为浮点数，空值按0)
+        self._signs = {}  # 列号 -> 涨跌方向数组 (1/-1/0)
+        self._codes = None
+        self._names = None
+        # 每列的 (列号, 表头, 数据列, 是否数值列, 是否着色列)，表头固定，构造时算好，刷新时不再查表
+        self._col_specs = tuple(
+            (col, header, _COLUMN_MAPPING[header], header in _NUMERIC_HEADERS, header in _COLORED_HEADERS)
+            for col, header in enumerate(self._headers) if header in _COLUMN_MAPPING
+        )
+        
+    def _build_columns(self, data: pd.DataFrame):
+        """把数据整理为按列的显示文本、排序值和涨跌方向数组"""
+        display, sort_keys, signs = {}, {}, {}
+        for col, header, data_key, is_numeric, is_colored in self._col_specs:
+            if data_key not in data.columns:
+                display[col] = np.full(len(data), _EMPTY_TEXT, dtype=object)
+                continue
+            if not is_numeric:
+                display[col] = _format_column(header, data[data_key])
+                continue
+            # 每个数值列只转换一次，格式化、排序值和涨跌方向共用
+            values = pd.to_numeric(data[data_key], errors='coerce').to_numpy(dtype=float)
+            display[col] = _format_column(header, data[data_key], values)
+            sort_keys[col] = np.where(np.isnan(values), 0.0, values)
+            if is_colored:
+                signs[col] = np.sign(sort_keys[col]).astype(int)
+        codes = data['代码'].astype(str).to_numpy() if '代码' in data.columns else None
+        names = data['名称'].astype(str).to_numpy() if '名称' in data.columns else None
+        return display, sort_keys, signs, codes, names
+        
+    def set_data(self, data: pd.DataFrame):
+        """替换表格数据 - 股票与列不变时只通知有变化的单元格，否则一次模型重置"""
+        display, sort_keys, signs, codes, names = self._build_columns(data)
+        if self._same_layout(display, codes):
+            changed = {col: np.flatnonzero(values != self._display[col]) for col, values in display.items()}
+            self._display = display
+            self._sort_keys = sort_keys
+            self._signs = signs
+            self._names = names
+            changed = {col: rows for col, rows in changed.items() if len(rows)}
+            if changed:
+                # 一次 dataChanged 覆盖所有变化单元格所在的范围，没有变化时不通知视图
+                top = min(int(rows[0]) for rows in changed.values())
+                bottom = max(int(rows[-1]) for rows in changed.values())
+                self.dataChanged.emit(self.index(top, min(changed)), self.index(bottom, max(changed)))
+            return
+            
+        self.beginResetModel()
+        self._rows = len(data)
+        self._display = display
+        self._sort_keys = sort_keys
+        self._signs = signs
+        self._codes = codes
+        self._names = names
+        self.endResetModel()
+        
+    def _same_layout(self, display, codes) -> bool:
+        """新数据与当前数据的股票 (按顺序) 和列是否相同"""
+        return (codes is not None and self._codes is not None and display.keys() == self._display.keys()
+                and np.array_equal(codes, self._codes))
+        
+    def append_data(self, data: pd.DataFrame) -> bool:
+        """在末尾追加一批行 (只通知插入的行，已有行不重绘)；列结构与现有数据不一致时不追加并返回 False"""
+        display, sort_keys, signs, codes, names = self._build_columns(data)
+        if (display.keys() != self._display.keys() or sort_keys.keys() != self._sort_keys.keys()
+                or (codes is None) != (self._codes is None) or (names is None) != (self._names is None)):
+            return False
+        if data.empty:
+            return True
+            
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + len(data) - 1)
+        self._rows += len(data)
+        for current, new in ((self._display, display), (self._sort_keys, sort_keys), (self._signs, signs)):
+            for col, values in new.items():
+                current[col] = np.concatenate([current[col], values])
+        if codes is not None:
+            self._codes = np.concatenate([self._codes, codes])
+        if names is not None:
+            self._names = np.concatenate([self._names, names])
+        self.endInsertRows()
+        return True
+        
+    def stock_at(self, row: int):
+        """返回指定行的 (股票代码, 股票名称)，数据中缺少代码或名称时返回 None"""
+        if self._codes is None or self._names is None:
+            return None
+        return self._codes[row], self._names[row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            values = self._display.get(col)
+            return None if values is None else str(values[row])
+        if role == Qt.ItemDataRole.ForegroundRole:
+            signs = self._signs.get(col)
+            return None if signs is None else _SIGN_BRUSHES.get(signs[row])
+        if role == Qt.ItemDataRole.UserRole:
+            # 排序依据: 数值列按数值，其余列按显示文本
+            keys = self._sort_keys.get(col)
+            if keys is not None:
+                return float(keys[row])
+            values = self._display.get(col)
+            return None if values is None else str(values[row])
+        return None
+
 class StockListWidget(QWidget):
     """股票列表组件"""
     
@@ -18,8 +210,23 @@ class StockListWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.current_data = pd.DataFrame()
+        self._codes_lower = self._names_lower = np.array([], dtype=str)  # 小写的代码、名称列，搜索时直接匹配
+        
+        # 搜索防抖: 连续输入时只在停顿后过滤一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        
+        # 后台取数状态: 同一时间只保留一个取数任务，进行中又收到的刷新请求 (如切换显示模式) 完成后补一次
+        self._fetch_pending = False
+        self._refresh_pending = False
+        self._fetch_mode = None  # 进行中的取数对应的显示模式，模式已切换时丢弃其结果
+        self._pending_filter = None  # 数据到达前请求的按代码筛选
+        self._batch_frames = []  # 分批获取时已到达的各批数据
+        
         self.init_ui()
-        self.load_initial_data()
+        # 数据由主窗口调用 refresh_data 按当前模式在后台获取，构造时不阻塞取数
         
     def init_ui(self):
         """初始化界面"""
@@ -33,6 +240,9 @@ class StockListWidget(QWidget):
         # 股票表格
         self.setup_table(layout)
         
+        # 右键菜单
+        self._setup_context_menu()
+        
     def setup_toolbar(self, parent_layout):
         """设置工具栏"""
         toolbar_layout = QHBoxLayout()
@@ -43,13 +253,13 @@ class StockListWidget(QWidget):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("输入股票代码或名称...")
-        self.search_input.textChanged.connect(self.on_search_changed)
+        self.search_input.textChanged.connect(lambda _text: self._search_timer.start())
         toolbar_layout.addWidget(self.search_input)
         
         # 刷新按钮
-        refresh_btn = QPushButton("刷新")
-        refresh_btn.clicked.connect(self.refresh_data)
-        toolbar_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("刷新")
+        self.refresh_btn.clicked.connect(self.refresh_data)
+        toolbar_layout.addWidget(self.refresh_btn)
         
         # 显示模式选择
         mode_label = QLabel("显示:")
@@ -65,16 +275,19 @@ class StockListWidget(QWidget):
         
     def setup_table(self, parent_layout):
         """设置表格"""
-        self.table = QTableWidget()
-        
         # 设置列
         columns = config_manager.get('display.columns', [
             '代码', '名称', '现价', '涨跌幅', '涨跌额', 
             '成交量', '成交额', '换手率', '市盈率', '市净率'
         ])
         
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
+        # 模型/视图: 数据由 StockTableModel 持有，排序由代理模型按 UserRole (数值列为数值) 完成
+        self.model = StockTableModel(columns, self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.setSortRole(Qt.ItemDataRole.UserRole)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         
         # 表格属性设置
         self.table.setAlternatingRowColors(True)
@@ -82,6 +295,13 @@ class StockListWidget(QWidget):
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setSortingEnabled(True)
         
+        # 默认排序，之后用户点击表头改变的排序在刷新后保持
+        sort_column = config_manager.get('display.sort_column', '涨跌幅')
+        sort_order = config_manager.get('display.sort_order', 'desc')
+        if sort_column in columns:
+            order = Qt.SortOrder.DescendingOrder if sort_order == 'desc' else Qt.SortOrder.AscendingOrder
+            self.table.sortByColumn(columns.index(sort_column), order)
+        
         # 设置列宽
         header = self.table.horizontalHeader()
         header.setStretchLastSection(True)
@@ -91,7 +311,7 @@ class StockListWidget(QWidget):
         self.table.setColumnWidth(1, 100)
         
         # 连接信号
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table.doubleClicked.connect(self.on_cell_double_clicked)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
         
@@ -102,138 +322,112 @@ class StockListWidget(QWidget):
         self.refresh_data()
         
     def refresh_data(self):
-        """刷新数据"""
-        try:
-            mode = self.mode_combo.currentText()
-            
-            if mode == "热门股票":
-                # 获取热门股票实时数据
-                data = data_provider.get_real_time_data()
-            elif mode == "全部股票":
-                # 获取股票列表（基础信息）
-                data = data_provider.get_stock_list()
-                # 为了演示，只显示前100只股票的实时数据
-                if not data.empty:
-                    symbols = data['代码'].head(100).tolist()
-                    data = data_provider.get_real_time_data(symbols)
-            else:  # 自选股票
-                # 从配置获取自选股列表
-                my_stocks = config_manager.get('stock_pools.my_stocks', [])
-                if my_stocks:
-                    data = data_provider.get_real_time_data(my_stocks)
-                else:
-                    data = pd.DataFrame()
-            
-            self.current_data = data
-            self.update_table(data)
-            
-            logger.info(f"股票列表数据刷新完成，共{len(data)}条记录")
-            
-        except Exception as e:
-            logger.error(f"刷新股票列表数据失败: {e}")
+        """刷新数据 (按当前显示模式在线程池中获取，结果回到界面线程后更新)"""
+        if self._fetch_pending:
+            self._refresh_pending = True
+            return
+        self._fetch_pending = True
+        self._refresh_pending = False
+        self.refresh_btn.setEnabled(False)
+        
+        queued = Qt.ConnectionType.QueuedConnection
+        mode = self._fetch_mode = self.mode_combo.currentText()
+        if mode == "全部股票":
+            # 全部股票分批获取，第一批到达即显示，其余批次追加到表格末尾
+            self._batch_frames = []
+            runnable = BatchFetchRunnable(self.fetch_batches, _ALL_STOCKS_LIMIT)
+            runnable.signals.batch_ready.connect(self._on_batch_ready, queued)
+            runnable.signals.finished.connect(self._on_batches_finished, queued)
+        else:
+            runnable = FetchRunnable(self.fetch_data, mode)
+            runnable.signals.result_ready.connect(self._on_fetch_done, queued)
+        runnable.signals.error_occurred.connect(self._on_fetch_error, queued)
+        QThreadPool.globalInstance().start(runnable)
+        
+    def _is_stale_fetch(self) -> bool:
+        """进行中的取数是否已过期 (开始后显示模式已切换)"""
+        return self._fetch_mode != self.mode_combo.currentText()
+        
+    def _on_fetch_done(self, stock_data: pd.DataFrame):
+        """后台取数完成 (模式已切换时丢弃结果，由补刷获取新模式的数据)"""
+        if not self._is_stale_fetch():
+            self.apply_data(stock_data)
+            self._replay_pending_filter()
+        self._finish_fetch()
+        
+    def _replay_pending_filter(self):
+        """数据到达前请求过按代码筛选时，补做一次"""
+        if self._pending_filter:
+            stock_codes, self._pending_filter = self._pending_filter, None
+            if self.current_data.empty:
+                logger.warning("无股票数据可筛选")
+            else:
+                self.filter_by_stocks(stock_codes)
             
-    def update_table(self, data: pd.DataFrame):
-        """更新表格数据"""
-        if data.empty:
-            self.table.setRowCount(0)
+    def _on_batch_ready(self, batch: pd.DataFrame):
+        """分批获取时一批数据到达 (模式已切换时丢弃)"""
+        if self._is_stale_fetch():
+            return
+        self._batch_frames.append(batch)
+        if len(self._batch_frames) == 1:
+            self.apply_data(batch)
             return
             
-        self.table.setRowCount(len(data))
-        
-        # 获取列映射
-        column_mapping = {
-            '代码': '代码',
-            '名称': '名称', 
-            '现价': '最新价',
-            '涨跌幅': '涨跌幅',
-            '涨跌额': '涨跌额',
-            '成交量': '成交量',
-            '成交额': '成交额',
-            '换手率': '换手率',
-            '市盈率': '市盈率-动态',
-            '市净率': '市净率'
-        }
-        
-        for row in range(len(data)):
-            row_data = data.iloc[row]
+        data = pd.concat(self._batch_frames, ignore_index=True)
+        if self.search_input.text().strip() or not self.model.append_data(batch):
+            # 有搜索条件或列结构变化时按合并后的数据整体更新
+            self.apply_data(data)
+        else:
+            self._set_current_data(data)
             
-            for col, header in enumerate(self.table.horizontalHeaderItem(col).text() for col in range(self.table.columnCount())):
-                if header in column_mapping:
-                    data_key = column_mapping[header]
-                    if data_key in row_data:
-                        value = row_data[data_key]
-                        
-                        # 格式化数值
-                        formatted_value = self.format_value(header, value)
-                        
-                        item = QTableWidgetItem(str(formatted_value))
-                        
-                        # 设置数值类型的排序
-                        if header in ['现价', '涨跌幅', '涨跌额', '成交量', '成交额', '换手率', '市盈率', '市净率']:
-                            try:
-                                item.setData(Qt.ItemDataRole.UserRole, float(value) if value != '--' and pd.notna(value) else 0)
-                            except:
-                                item.setData(Qt.ItemDataRole.UserRole, 0)
-                        
-                        # 设置颜色
-                        if header in ['涨跌幅', '涨跌额']:
-                            try:
-                                val = float(value) if value != '--' and pd.notna(value) else 0
-                                if val > 0:
-                                    item.setForeground(QBrush(QColor(255, 0, 0)))  # 红色
-                                elif val < 0:
-                                    item.setForeground(QBrush(QColor(0, 128, 0)))  # 绿色
-                            except:
-                                pass
-                        
-                        self.table.setItem(row, col, item)
-                    else:
-                        item = QTableWidgetItem("--")
-                        self.table.setItem(row, col, item)
-        
-        # 应用排序
-        sort_column = config_manager.get('display.sort_column', '涨跌幅')
-        sort_order = config_manager.get('display.sort_order', 'desc')
-        
-        headers = [self.table.horizontalHeaderItem(col).text() for col in range(self.table.columnCount())]
-        if sort_column in headers:
-            col_index = headers.index(sort_column)
-            order = Qt.SortOrder.DescendingOrder if sort_order == 'desc' else Qt.SortOrder.AscendingOrder
-            self.table.sortItems(col_index, order)
+    def _on_batches_finished(self):
+        """分批获取全部完成"""
+        if not self._is_stale_fetch():
+            if not self._batch_frames:
+                self.apply_data(pd.DataFrame())
+            self._replay_pending_filter()
+        self._batch_frames = []
+        self._finish_fetch()
+        
+    def _on_fetch_error(self, error_msg: str):
+        """后台取数失败"""
+        self._pending_filter = None
+        self._batch_frames = []
+        logger.error(f"刷新股票列表数据失败: {error_msg}")
+        self._finish_fetch()
+        
+    def _finish_fetch(self):
+        """结束取数状态，恢复刷新按钮；取数期间有新的刷新请求时立即补一次"""
+        self._fetch_pending = False
+        self.refresh_btn.setEnabled(True)
+        if self._refresh_pending:
+            self.refresh_data()
             
-    def format_value(self, column: str, value) -> str:
-        """格式化数值显示"""
-        if pd.isna(value) or value == '' or value is None:
-            return '--'
+    def fetch_data(self, mode: str = "热门股票") -> pd.DataFrame:
+        """按显示模式获取股票数据 - 可在后台线程调用，不访问界面控件"""
+        if mode == "热门股票":
+            # 获取热门股票实时数据
+            return data_provider.get_real_time_data()
+        if mode == "全部股票":
+            batches = list(self.fetch_batches(_ALL_STOCKS_LIMIT))
+            return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+        # 自选股票: 只获取自选股的实时数据
+        my_stocks = config_manager.get('stock_pools.my_stocks', [])
+        return data_provider.get_real_time_data(my_stocks) if my_stocks else pd.DataFrame()
             
-        try:
-            if column in ['现价', '涨跌额']:
-                return f"{float(value):.2f}"
-            elif column == '涨跌幅':
-                return f"{float(value):.2f}%"
-            elif column in ['成交量', '成交额']:
-                val = float(value)
-                if val >= 100000000:  # 亿
-                    return f"{val/100000000:.1f}亿"
-                elif val >= 10000:  # 万
-                    return f"{val/10000:.1f}万"
-                else:
-                    return f"{val:.0f}"
-            elif column == '换手率':
-                return f"{float(value):.2f}%"
-            elif column in ['市盈率', '市净率']:
-                return f"{float(value):.2f}"
-            else:
-                return str(value)
-        except:
-            return str(value) if value is not None else '--'
+    def fetch_batches(self, limit: int = _ALL_STOCKS_LIMIT):
+        """分批获取全部股票模式的实时数据 (生成器) - 可在后台线程调用"""
+        symbols = data_provider.get_stock_symbols(limit)
+        yield from data_provider.get_real_time_data_batched(symbols, _ALL_STOCKS_BATCH_SIZE)
             
-    def refresh_data(self):
-        """刷新股票数据"""
+    def update_table(self, data: pd.DataFrame):
+        """更新表格数据 (一次模型重置；代理模型按当前排序列自动重新排序)"""
+        self.model.set_data(data)
+            
+    def apply_data(self, stock_data: pd.DataFrame):
+        """把获取到的股票数据更新到表格 - 必须在界面线程调用"""
         try:
-            # 获取股票数据
-            stock_data = data_provider.get_stock_list()
-            self.current_data = stock_data
+            self._set_current_data(stock_data)
             
             # 保留当前搜索状态
             current_search = self.search_input.text().strip()
@@ -250,6 +444,19 @@ class StockListWidget(QWidget):
         except Exception as e:
             logger.error(f"刷新股票数据失败: {e}")
             
+    def _set_current_data(self, data: pd.DataFrame):
+        """保存当前数据，并预先生成小写的代码、名称数组供搜索使用"""
+        self.current_data = data
+        self._codes_lower, self._names_lower = (
+            data[column].astype(str).str.lower().to_numpy(dtype=str) if column in data.columns
+            else np.full(len(data), '')
+            for column in ('代码', '名称')
+        )
+        
+    def _apply_search(self):
+        """输入停顿后按当前搜索文本过滤"""
+        self.on_search_changed(self.search_input.text())
+        
     def on_search_changed(self, text: str):
         """搜索文本改变"""
         if not text.strip():
@@ -257,11 +464,10 @@ class StockListWidget(QWidget):
             return
             
         try:
-            # 过滤数据 - 支持代码和名称搜索
-            filtered_data = self.current_data[
-                self.current_data['代码'].str.contains(text, case=False, na=False) |
-                self.current_data['名称'].str.contains(text, case=False, na=False)
-            ]
+            # 过滤数据 - 支持代码和名称搜索 (在预先小写的数组上按字面匹配，不再每次编译正则)
+            keyword = text.lower()
+            mask = (np.char.find(self._codes_lower, keyword) >= 0) | (np.char.find(self._names_lower, keyword) >= 0)
+            filtered_data = self.current_data[mask]
             
             self.update_table(filtered_data)
             logger.debug(f"搜索'{text}'找到{len(filtered_data)}条记录")
@@ -274,72 +480,80 @@ class StockListWidget(QWidget):
         """显示模式改变"""
         self.refresh_data()
         
-    def on_cell_double_clicked(self, row: int, column: int):
+    def _stock_at(self, index):
+        """视图索引对应的 (股票代码, 股票名称)"""
+        if not index.isValid():
+            return None
+        return self.model.stock_at(self.proxy_model.mapToSource(index).row())
+        
+    def on_cell_double_clicked(self, index):
         """单元格双击事件"""
         # 获取股票代码和名称
-        code_item = self.table.item(row, 0)  # 代码列
-        name_item = self.table.item(row, 1)  # 名称列
-        
-        if code_item and name_item:
-            stock_code = code_item.text()
-            stock_name = name_item.text()
-            self.stock_selected.emit(stock_code, stock_name)
+        stock = self._stock_at(index)
+        if stock:
+            self.stock_selected.emit(*stock)
             
     def show_context_menu(self, position):
         """显示右键菜单"""
-        if self.table.itemAt(position) is None:
-            return
-            
-        row = self.table.currentRow()
-        if row < 0:
-            return
-            
-        code_item = self.table.item(row, 0)
-        name_item = self.table.item(row, 1)
-        
-        if not code_item or not name_item:
+        stock = self._stock_at(self.table.indexAt(position))
+        if not stock:
             return
             
-        stock_code = code_item.text()
-        stock_name = name_item.text()
+        # 菜单只建一次，每次弹出前记下当前股票，菜单项的槽函数从这里读取
+        self._ctx_stock_code, self._ctx_stock_name = stock
+        self._stock_menu.exec(self.table.mapToGlobal(position))
         
-        menu = QMenu(self)
+    def _setup_context_menu(self):
+        """创建右键菜单 (只创建一次，弹出时复用)"""
+        self._ctx_stock_code = self._ctx_stock_name = None
+        self._stock_menu = QMenu(self)
         
         # 查看详情
         view_action = QAction("查看详情", self)
-        view_action.triggered.connect(lambda: self.stock_selected.emit(stock_code, stock_name))
-        menu.addAction(view_action)
+        view_action.triggered.connect(self._ctx_view)
+        self._stock_menu.addAction(view_action)
         
-        menu.addSeparator()
+        self._stock_menu.addSeparator()
         
         # 添加到自选
         add_action = QAction("添加到自选", self)
-        add_action.triggered.connect(lambda: self.add_to_favorites(stock_code, stock_name))
-        menu.addAction(add_action)
+        add_action.triggered.connect(self._ctx_add_fav)
+        self._stock_menu.addAction(add_action)
         
         # 从自选移除
         remove_action = QAction("从自选移除", self)
-        remove_action.triggered.connect(lambda: self.remove_from_favorites(stock_code))
-        menu.addAction(remove_action)
+        remove_action.triggered.connect(self._ctx_remove_fav)
+        self._stock_menu.addAction(remove_action)
         
-        menu.exec(self.table.mapToGlobal(position))
+    def _ctx_view(self):
+        """右键菜单: 查看详情"""
+        self.stock_selected.emit(self._ctx_stock_code, self._ctx_stock_name)
+        
+    def _ctx_add_fav(self):
+        """右键菜单: 添加到自选"""
+        self.add_to_favorites(self._ctx_stock_code, self._ctx_stock_name)
+        
+    def _ctx_remove_fav(self):
+        """右键菜单: 从自选移除"""
+        self.remove_from_favorites(self._ctx_stock_code)
         
     def add_to_favorites(self, stock_code: str, stock_name: str):
         """添加到自选"""
-        my_stocks = config_manager.get('stock_pools.my_stocks', [])
+        # 用保持顺序的字典做集合: 成员判断和增删都是O(1)，写回时仍为原顺序的列表
+        my_stocks = dict.fromkeys(config_manager.get('stock_pools.my_stocks', []))
         if stock_code not in my_stocks:
-            my_stocks.append(stock_code)
-            config_manager.set('stock_pools.my_stocks', my_stocks)
+            my_stocks[stock_code] = None
+            config_manager.set_deferred('stock_pools.my_stocks', list(my_stocks))
             QMessageBox.information(self, "成功", f"已将 {stock_name}({stock_code}) 添加到自选股")
         else:
             QMessageBox.information(self, "提示", f"{stock_name}({stock_code}) 已在自选股中")
             
     def remove_from_favorites(self, stock_code: str):
         """从自选移除"""
-        my_stocks = config_manager.get('stock_pools.my_stocks', [])
+        my_stocks = dict.fromkeys(config_manager.get('stock_pools.my_stocks', []))
         if stock_code in my_stocks:
-            my_stocks.remove(stock_code)
-            config_manager.set('stock_pools.my_stocks', my_stocks)
+            del my_stocks[stock_code]
+            config_manager.set_deferred('stock_pools.my_stocks', list(my_stocks))
             QMessageBox.information(self, "成功", f"已从自选股中移除 {stock_code}")
             
             # 如果当前显示的是自选股，刷新数据
@@ -355,17 +569,15 @@ class StockListWidget(QWidget):
                 logger.warning("股票代码列表为空")
                 return
             
-            # 获取完整的股票数据
+            # 还没有数据时先在后台获取，数据到达后再筛选
             if self.current_data.empty:
+                self._pending_filter = list(stock_codes)
                 self.refresh_data()
-            
-            if self.current_data.empty:
-                logger.warning("无股票数据可筛选")
                 return
             
             # 筛选指定的股票
             if '代码' in self.current_data.columns:
-                filtered_data = self.current_data[self.current_data['代码'].isin(stock_codes)]
+                filtered_data = self.current_data[self.current_data['代码'].isin(set(stock_codes))]
             else:
                 logger.warning("股票数据中没有'代码'列")
                 return
@@ -373,11 +585,11 @@ class StockListWidget(QWidget):
             if filtered_data.empty:
                 logger.warning(f"未找到匹配的股票数据，筛选代码: {stock_codes}")
                 # 显示空表格
-                self.stock_table.setRowCount(0)
+                self.update_table(filtered_data)
                 return
             
             # 更新表格显示
-            self.update_stock_table(filtered_data)
+            self.update_table(filtered_data)
             logger.info(f"按板块筛选显示 {len(filtered_data)} 只股票")
             
         except Exception as e:
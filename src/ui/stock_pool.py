@@ -1,11 +1,12 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QListWidget, QListWidgetItem, QPushButton, QGroupBox,
                              QMenu, QInputDialog, QMessageBox, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool
 from PyQt6.QtGui import QFont, QAction
 from src.utils.config import config_manager
 from src.data.stock_data import data_provider
 from src.utils.logger import get_logger
+from src.ui.workers import FetchRunnable
 
 logger = get_logger(__name__)
 
@@ -16,6 +17,7 @@ class StockPoolWidget(QWidget):
     
     def __init__(self):
         super().__init__()
+        self._name_map_loading = False
         self.init_ui()
         self.load_stock_pools()
         
@@ -43,6 +45,39 @@ class StockPoolWidget(QWidget):
         # 自定义股票池
         self.setup_custom_pools(layout)
         
+        # 右键菜单 (只创建一次，弹出时复用)
+        self._ctx_key = None  # 当前右键的股票代码或股票池名称，菜单项从这里读取
+        self._my_stocks_menu = self._build_context_menu([
+            ("查看详情", self.view_stock_detail),
+            ("移除", self.remove_from_my_stocks),
+        ])
+        self._watch_list_menu = self._build_context_menu([
+            ("查看详情", self.view_stock_detail),
+            ("移至自选", self.move_to_my_stocks),
+            ("移除", self.remove_from_watch_list),
+        ])
+        self._custom_pools_menu = self._build_context_menu([
+            ("编辑", self.edit_custom_pool),
+            ("删除", self.delete_custom_pool),
+        ])
+        
+    def _build_context_menu(self, actions) -> QMenu:
+        """创建右键菜单，actions 为 (菜单文字, 处理函数) 列表，处理函数以当前右键的项目为参数"""
+        menu = QMenu(self)
+        for text, handler in actions:
+            action = QAction(text, self)
+            action.triggered.connect(lambda _checked=False, handler=handler: handler(self._ctx_key))
+            menu.addAction(action)
+        return menu
+        
+    def _exec_context_menu(self, menu: QMenu, list_widget: QListWidget, position):
+        """在列表项上弹出右键菜单"""
+        item = list_widget.itemAt(position)
+        if item is None:
+            return
+        self._ctx_key = item.data(Qt.ItemDataRole.UserRole)
+        menu.exec(list_widget.mapToGlobal(position))
+        
     def setup_my_stocks(self, parent_layout):
         """设置我的自选"""
         group = QGroupBox("我的自选")
@@ -147,42 +182,60 @@ class StockPoolWidget(QWidget):
         
     def update_my_stocks_list(self, stocks):
         """更新我的自选列表"""
-        self.my_stocks_list.clear()
-        
-        # 获取股票名称
-        for stock_code in stocks:
-            try:
-                # 这里可以从缓存或API获取股票名称
-                stock_name = self._get_stock_name(stock_code)
-                item_text = f"{stock_code} {stock_name}"
-                
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, stock_code)
-                self.my_stocks_list.addItem(item)
-            except Exception as e:
-                logger.warning(f"获取股票{stock_code}名称失败: {e}")
-                item = QListWidgetItem(stock_code)
-                item.setData(Qt.ItemDataRole.UserRole, stock_code)
-                self.my_stocks_list.addItem(item)
+        self._fill_stock_list(self.my_stocks_list, stocks)
                 
     def update_watch_list(self, stocks):
         """更新观察池列表"""
-        self.watch_list_widget.clear()
-        
+        self._fill_stock_list(self.watch_list_widget, stocks)
+        
+    def _fill_stock_list(self, list_widget: QListWidget, stocks):
+        """批量重建股票列表: 先建好全部列表项，再在暂停重绘和信号的情况下一次加入"""
+        # 名称映射需要网络请求，尚未建立时先只显示代码，在线程池中建立后再补上名称
+        name_map = data_provider.peek_name_map()
+        if name_map is None:
+            self._warm_name_map()
+            
+        items = []
         for stock_code in stocks:
-            try:
-                stock_name = self._get_stock_name(stock_code)
-                item_text = f"{stock_code} {stock_name}"
-                
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, stock_code)
-                self.watch_list_widget.addItem(item)
-            except Exception as e:
-                logger.warning(f"获取股票{stock_code}名称失败: {e}")
-                item = QListWidgetItem(stock_code)
-                item.setData(Qt.ItemDataRole.UserRole, stock_code)
-                self.watch_list_widget.addItem(item)
+            text = stock_code if name_map is None else f"{stock_code} {name_map.get(stock_code, '未知')}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, stock_code)
+            items.append(item)
+            
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            for item in items:
+                list_widget.addItem(item)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
                 
+    def _warm_name_map(self):
+        """在线程池中建立股票名称映射 (已在建立时不重复提交)"""
+        if self._name_map_loading:
+            return
+        self._name_map_loading = True
+        queued = Qt.ConnectionType.QueuedConnection
+        runnable = FetchRunnable(data_provider.get_name_map)
+        runnable.signals.result_ready.connect(self._on_name_map_ready, queued)
+        runnable.signals.error_occurred.connect(self._on_name_map_failed, queued)
+        QThreadPool.globalInstance().start(runnable)
+        
+    def _on_name_map_ready(self, name_map):
+        """名称映射建立完成，重建列表补上股票名称"""
+        self._name_map_loading = False
+        if data_provider.peek_name_map() is None:
+            return
+        self.update_my_stocks_list(config_manager.get('stock_pools.my_stocks', []))
+        self.update_watch_list(config_manager.get('stock_pools.watch_list', []))
+        
+    def _on_name_map_failed(self, error):
+        """名称映射建立失败，列表保持只显示代码"""
+        self._name_map_loading = False
+        logger.warning(f"获取股票名称失败: {error}")
+        
     def update_custom_pools_list(self, pools):
         """更新自定义池列表"""
         self.custom_pools_list.clear()
@@ -194,17 +247,12 @@ class StockPoolWidget(QWidget):
             self.custom_pools_list.addItem(item)
             
     def _get_stock_name(self, stock_code: str) -> str:
-        """获取股票名称"""
+        """获取股票名称 (查询与股票列表共用的代码-名称映射)"""
         try:
-            # 从股票列表中查找
-            stock_list = data_provider.get_stock_list()
-            if not stock_list.empty:
-                match = stock_list[stock_list['代码'] == stock_code]
-                if not match.empty:
-                    return match.iloc[0]['名称']
-        except:
-            pass
-        return "未知"
+            return data_provider.get_stock_name(stock_code)
+        except Exception as e:
+            logger.warning(f"获取股票{stock_code}名称失败: {e}")
+            return "未知"
         
     def add_to_my_stocks(self):
         """添加到我的自选"""
@@ -212,10 +260,11 @@ class StockPoolWidget(QWidget):
         if ok and stock_code.strip():
             stock_code = stock_code.strip().upper()
             
-            my_stocks = config_manager.get('stock_pools.my_stocks', [])
+            # 用保持顺序的字典做集合: 成员判断和增删都是O(1)，写回时仍为原顺序的列表
+            my_stocks = dict.fromkeys(config_manager.get('stock_pools.my_stocks', []))
             if stock_code not in my_stocks:
-                my_stocks.append(stock_code)
-                config_manager.set('stock_pools.my_stocks', my_stocks)
+                my_stocks[stock_code] = None
+                config_manager.set_deferred('stock_pools.my_stocks', list(my_stocks))
                 self.update_my_stocks_list(my_stocks)
                 QMessageBox.information(self, "成功", f"已添加 {stock_code} 到我的自选")
             else:
@@ -226,7 +275,7 @@ class StockPoolWidget(QWidget):
         reply = QMessageBox.question(self, "确认", "确定要清空我的自选吗？",
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            config_manager.set('stock_pools.my_stocks', [])
+            config_manager.set_deferred('stock_pools.my_stocks', [])
             self.my_stocks_list.clear()
             
     def add_to_watch_list(self):
@@ -235,10 +284,10 @@ class StockPoolWidget(QWidget):
         if ok and stock_code.strip():
             stock_code = stock_code.strip().upper()
             
-            watch_list = config_manager.get('stock_pools.watch_list', [])
+            watch_list = dict.fromkeys(config_manager.get('stock_pools.watch_list', []))
             if stock_code not in watch_list:
-                watch_list.append(stock_code)
-                config_manager.set('stock_pools.watch_list', watch_list)
+                watch_list[stock_code] = None
+                config_manager.set_deferred('stock_pools.watch_list', list(watch_list))
                 self.update_watch_list(watch_list)
                 QMessageBox.information(self, "成功", f"已添加 {stock_code} 到观察池")
             else:
@@ -249,7 +298,7 @@ class StockPoolWidget(QWidget):
         reply = QMessageBox.question(self, "确认", "确定要清空观察池吗？",
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            config_manager.set('stock_pools.watch_list', [])
+            config_manager.set_deferred('stock_pools.watch_list', [])
             self.watch_list_widget.clear()
             
     def create_custom_pool(self):
@@ -258,10 +307,10 @@ class StockPoolWidget(QWidget):
         if ok and pool_name.strip():
             pool_name = pool_name.strip()
             
-            custom_pools = config_manager.get('stock_pools.custom_pools', {})
+            custom_pools = dict(config_manager.get('stock_pools.custom_pools', {}))
             if pool_name not in custom_pools:
                 custom_pools[pool_name] = []
-                config_manager.set('stock_pools.custom_pools', custom_pools)
+                config_manager.set_deferred('stock_pools.custom_pools', custom_pools)
                 self.update_custom_pools_list(custom_pools)
                 QMessageBox.information(self, "成功", f"已创建股票池: {pool_name}")
             else:
@@ -286,67 +335,15 @@ class StockPoolWidget(QWidget):
         
     def show_my_stocks_menu(self, position):
         """显示我的自选右键菜单"""
-        item = self.my_stocks_list.itemAt(position)
-        if item is None:
-            return
-            
-        stock_code = item.data(Qt.ItemDataRole.UserRole)
-        
-        menu = QMenu(self)
-        
-        view_action = QAction("查看详情", self)
-        view_action.triggered.connect(lambda: self.view_stock_detail(stock_code))
-        menu.addAction(view_action)
-        
-        remove_action = QAction("移除", self)
-        remove_action.triggered.connect(lambda: self.remove_from_my_stocks(stock_code))
-        menu.addAction(remove_action)
-        
-        menu.exec(self.my_stocks_list.mapToGlobal(position))
+        self._exec_context_menu(self._my_stocks_menu, self.my_stocks_list, position)
         
     def show_watch_list_menu(self, position):
         """显示观察池右键菜单"""
-        item = self.watch_list_widget.itemAt(position)
-        if item is None:
-            return
-            
-        stock_code = item.data(Qt.ItemDataRole.UserRole)
-        
-        menu = QMenu(self)
-        
-        view_action = QAction("查看详情", self)
-        view_action.triggered.connect(lambda: self.view_stock_detail(stock_code))
-        menu.addAction(view_action)
-        
-        move_action = QAction("移至自选", self)
-        move_action.triggered.connect(lambda: self.move_to_my_stocks(stock_code))
-        menu.addAction(move_action)
-        
-        remove_action = QAction("移除", self)
-        remove_action.triggered.connect(lambda: self.remove_from_watch_list(stock_code))
-        menu.addAction(remove_action)
-        
-        menu.exec(self.watch_list_widget.mapToGlobal(position))
+        self._exec_context_menu(self._watch_list_menu, self.watch_list_widget, position)
         
     def show_custom_pools_menu(self, position):
         """显示自定义池右键菜单"""
-        item = self.custom_pools_list.itemAt(position)
-        if item is None:
-            return
-            
-        pool_name = item.data(Qt.ItemDataRole.UserRole)
-        
-        menu = QMenu(self)
-        
-        edit_action = QAction("编辑", self)
-        edit_action.triggered.connect(lambda: self.edit_custom_pool(pool_name))
-        menu.addAction(edit_action)
-        
-        delete_action = QAction("删除", self)
-        delete_action.triggered.connect(lambda: self.delete_custom_pool(pool_name))
-        menu.addAction(delete_action)
-        
-        menu.exec(self.custom_pools_list.mapToGlobal(position))
+        self._exec_context_menu(self._custom_pools_menu, self.custom_pools_list, position)
         
     def view_stock_detail(self, stock_code: str):
         """查看股票详情"""
@@ -355,33 +352,35 @@ class StockPoolWidget(QWidget):
         
     def remove_from_my_stocks(self, stock_code: str):
         """从我的自选移除"""
-        my_stocks = config_manager.get('stock_pools.my_stocks', [])
+        my_stocks = dict.fromkeys(config_manager.get('stock_pools.my_stocks', []))
         if stock_code in my_stocks:
-            my_stocks.remove(stock_code)
-            config_manager.set('stock_pools.my_stocks', my_stocks)
+            del my_stocks[stock_code]
+            config_manager.set_deferred('stock_pools.my_stocks', list(my_stocks))
             self.update_my_stocks_list(my_stocks)
             
     def remove_from_watch_list(self, stock_code: str):
         """从观察池移除"""
-        watch_list = config_manager.get('stock_pools.watch_list', [])
+        watch_list = dict.fromkeys(config_manager.get('stock_pools.watch_list', []))
         if stock_code in watch_list:
-            watch_list.remove(stock_code)
-            config_manager.set('stock_pools.watch_list', watch_list)
+            del watch_list[stock_code]
+            config_manager.set_deferred('stock_pools.watch_list', list(watch_list))
             self.update_watch_list(watch_list)
             
     def move_to_my_stocks(self, stock_code: str):
         """移动到我的自选"""
         # 从观察池移除
-        watch_list = config_manager.get('stock_pools.watch_list', [])
-        if stock_code in watch_list:
-            watch_list.remove(stock_code)
-            config_manager.set('stock_pools.watch_list', watch_list)
+        watch_list = dict.fromkeys(config_manager.get('stock_pools.watch_list', []))
+        watch_list.pop(stock_code, None)
             
         # 添加到我的自选
-        my_stocks = config_manager.get('stock_pools.my_stocks', [])
-        if stock_code not in my_stocks:
-            my_stocks.append(stock_code)
-            config_manager.set('stock_pools.my_stocks', my_stocks)
+        my_stocks = dict.fromkeys(config_manager.get('stock_pools.my_stocks', []))
+        my_stocks[stock_code] = None
+        
+        # 两个股票池一次写入配置
+        config_manager.update_deferred({
+            'stock_pools.watch_list': list(watch_list),
+            'stock_pools.my_stocks': list(my_stocks),
+        })
             
         # 更新界面
         self.update_watch_list(watch_list)
@@ -396,8 +395,8 @@ class StockPoolWidget(QWidget):
         reply = QMessageBox.question(self, "确认", f"确定要删除股票池 {pool_name} 吗？",
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            custom_pools = config_manager.get('stock_pools.custom_pools', {})
+            custom_pools = dict(config_manager.get('stock_pools.custom_pools', {}))
             if pool_name in custom_pools:
                 del custom_pools[pool_name]
-                config_manager.set('stock_pools.custom_pools', custom_pools)
+                config_manager.set_deferred('stock_pools.custom_pools', custom_pools)
                 self.update_custom_pools_list(custom_pools)
@@ -2,22 +2,239 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QGroupBox, QTreeWidget, QTreeWidgetItem,
                              QTabWidget, QTextEdit, QComboBox, QSpinBox, QCheckBox,
                              QFormLayout, QScrollArea, QMessageBox, QDialog,
-                             QDialogButtonBox, QFrame, QLineEdit, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+                             QDialogButtonBox, QFrame, QLineEdit, QTableView,
+                             QHeaderView, QAbstractItemView, QStyledItemDelegate,
+                             QStyleOptionViewItem)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QThreadPool
+from PyQt6.QtGui import QFont, QIcon, QBrush, QColor, QPalette
+from collections import OrderedDict
+from functools import lru_cache
+import sys
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 from src.utils.config import config_manager
 from src.data.stock_data import data_provider
 from src.utils.logger import get_logger
+from src.utils.formatting import format_scaled
+from src.ui.workers import FetchRunnable
 
 logger = get_logger(__name__)
 
+# 选股结果表格的列: (表头, 数据列)
+_RESULT_COLUMNS = (
+    ("代码", '代码'),
+    ("名称", '名称'),
+    ("现价", '最新价'),
+    ("涨跌幅", '涨跌幅'),
+    ("成交额", '成交额'),
+    ("市盈率", '市盈率-动态'),
+    ("市净率", '市净率'),
+)
+# 按数值排序的列号
+_NUMERIC_RESULT_COLUMNS = frozenset({2, 3, 4, 5, 6})
+# 按涨跌着色的列号 (涨跌幅)
+_COLORED_RESULT_COLUMN = 3
+# 数值列的显示格式 (成交额按亿/万换算单位)
+_RESULT_FORMATS = {2: '%.2f', 3: '%.2f%%', 5: '%.2f', 6: '%.2f'}
+_SCALED_RESULT_COLUMN = 4
+
+# 条件类别 -> 可选字段
+_CATEGORY_FIELDS = MappingProxyType({
+    "技术面": ("现价", "涨跌幅", "成交量", "成交额", "换手率", "市盈率", "市净率", "RSI", "MACD", "KDJ"),
+    "基本面": ("每股收益", "净资产收益率", "资产负债率", "营业收入", "净利润", "毛利率"),
+    "热度面": ("搜索热度", "资讯数量", "讨论热度", "资金流向"),
+    "自定义": ("自定义指标1", "自定义指标2"),
+})
+
+# 条件中取值有限、需要驻留的字段
+_INTERNED_CONDITION_KEYS = ('category', 'field', 'operator', 'logic')
+
+# 执行选股按钮样式
+_EXECUTE_BTN_QSS = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+"""
+
+# 一次返回绘制所需全部角色的自定义角色 (显示文本、对齐方式、前景色)
+MultipleRoles = Qt.ItemDataRole.UserRole + 1
+# 委托缓存的单元格角色数量上限
+_ROLE_CACHE_SIZE = 200
+# 结果表格的固定行高 (像素)
+_RESULT_ROW_HEIGHT = 24
+
+_TEXT_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+_NUMBER_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_RISE_BRUSH = QBrush(QColor(255, 0, 0))   # 红色
+_FALL_BRUSH = QBrush(QColor(0, 128, 0))   # 绿色
+
+
+@lru_cache(maxsize=None)
+def _font(point_size=None, bold=False):
+    """按需创建并缓存字体，各面板共享 (需在QApplication创建之后调用)"""
+    font = QFont()
+    if point_size is not None:
+        font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+def _format_result_column(col, column: pd.Series):
+    """把一整列格式化为显示字符串数组，返回 (显示文本, 数值)"""
+    out = column.astype(str).to_numpy(dtype=object)
+    values = None
+    if col in _NUMERIC_RESULT_COLUMNS:
+        values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        if col == _SCALED_RESULT_COLUMN:
+            text = format_scaled(values)
+        else:
+            text = np.char.mod(_RESULT_FORMATS[col], values)
+        valid = ~np.isnan(values)
+        out[valid] = text[valid]
+    out[column.isna().to_numpy() | (column.to_numpy(dtype=object) == '')] = '--'
+    return out, values
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """选股结果表格模型 - 直接持有结果数据，视图只查询可见单元格，排序只重排行号数组"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._df = pd.DataFrame()
+        self._order = np.arange(0)  # 显示行 -> 数据行
+        self._display = {}  # 列号 -> 预先格式化好的显示字符串数组 (按数据行)
+        self._numbers = {}  # 数值列号 -> 数值数组 (按数据行，无法转换的为 NaN)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        
+    def set_data(self, df: pd.DataFrame):
+        """替换结果数据 (一次模型重置)，保持当前排序"""
+        # 显示文本在重置前整列格式化，视图绘制时只取现成的字符串
+        display, numbers = {}, {}
+        for col, (_, key) in enumerate(_RESULT_COLUMNS):
+            if key not in df.columns:
+                display[col] = np.full(len(df), '--', dtype=object)
+                continue
+            display[col], values = _format_result_column(col, df[key])
+            if values is not None:
+                numbers[col] = values
+                
+        self.beginResetModel()
+        self._df = df
+        self._display = display
+        self._numbers = numbers
+        self._order = self._sorted_order()
+        self.endResetModel()
+        
+    def _sorted_order(self) -> np.ndarray:
+        """按当前排序列计算行顺序 (整列一次 argsort，数值列按数值、其余列按已格式化的显示文本排序)"""
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        keys = self._numbers.get(self._sort_column)
+        if keys is not None:
+            # 数值列取负数实现降序，空值 (NaN) 无论升降序都排在最后
+            return np.argsort(-keys if descending else keys, kind='stable')
+        keys = self._display.get(self._sort_column)
+        if keys is None:
+            return np.arange(len(self._df))
+        order = np.argsort(keys.astype(str), kind='stable')
+        return order[::-1] if descending else order
+        
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """点击表头排序"""
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._order = self._sorted_order()
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_RESULT_COLUMNS)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return _RESULT_COLUMNS[section][0]
+        return None
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._display[col][self._order[row]])
+        if role == Qt.ItemDataRole.UserRole:
+            # 原始数值 (数值列)，供按数值比较使用
+            numbers = self._numbers.get(col)
+            return None if numbers is None else float(numbers[self._order[row]])
+        if role == MultipleRoles:
+            # 绘制所需的全部角色一次取回，委托不再逐个角色调用 data()
+            data_row = self._order[row]
+            roles = {
+                Qt.ItemDataRole.DisplayRole: str(self._display[col][data_row]),
+                Qt.ItemDataRole.TextAlignmentRole: _NUMBER_ALIGNMENT if col in _NUMERIC_RESULT_COLUMNS else _TEXT_ALIGNMENT,
+            }
+            if col == _COLORED_RESULT_COLUMN and col in self._numbers:
+                number = self._numbers[col][data_row]
+                if number > 0:
+                    roles[Qt.ItemDataRole.ForegroundRole] = _RISE_BRUSH
+                elif number < 0:
+                    roles[Qt.ItemDataRole.ForegroundRole] = _FALL_BRUSH
+            return roles
+        return None
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """绘制委托 - 每个单元格通过 MultipleRoles 一次取回全部绘制角色，并缓存最近绘制过的单元格"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = OrderedDict()  # (行, 列) -> 角色字典
+        
+    def clear_cache(self):
+        """清空缓存 (模型数据或行顺序变化时调用)"""
+        self._cache.clear()
+        
+    def initStyleOption(self, option, index):
+        key = (index.row(), index.column())
+        roles = self._cache.get(key)
+        if roles is None:
+            roles = index.data(MultipleRoles) or {}
+            self._cache[key] = roles
+            if len(self._cache) > _ROLE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+            
+        option.index = index
+        text = roles.get(Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = text
+        option.displayAlignment = roles.get(Qt.ItemDataRole.TextAlignmentRole, _TEXT_ALIGNMENT)
+        brush = roles.get(Qt.ItemDataRole.ForegroundRole)
+        if brush is not None:
+            option.palette.setBrush(QPalette.ColorRole.Text, brush)
+
+
 class StrategyPanelWidget(QWidget):
     """策略面板组件"""
     
     def __init__(self):
         super().__init__()
+        self._loaded_strategy_items = {}  # 策略名称 -> 已保存策略树中的项目
+        self._strategies_cache = {}  # 已保存的策略 (策略名称 -> 策略数据)，加载时从配置读取
+        self._last_results_sig = None  # 上次显示的选股结果签名 (形状, 列, 内容哈希)，结果未变化时跳过重建
         self.init_ui()
         self.load_saved_strategies()
         
@@ -29,32 +246,37 @@ class StrategyPanelWidget(QWidget):
         
         # 标题
         title_label = QLabel("策略中心")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(12, bold=True))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
-        # 创建标签页
+        # 创建标签页: 先放空白页，各页内容在第一次切换到该页时才创建
         self.tab_widget = QTabWidget()
-        
-        # 策略构建标签页
-        self.setup_strategy_builder_tab()
-        
-        # 已保存策略标签页
-        self.setup_saved_strategies_tab()
-        
-        # 选股结果标签页
-        self.setup_results_tab()
+        self._tab_builders = (
+            self.setup_strategy_builder_tab,   # 策略构建
+            self.setup_saved_strategies_tab,   # 已保存策略
+            self.setup_results_tab,            # 选股结果
+        )
+        self._tab_built = [False] * len(self._tab_builders)
+        for title in ("策略构建", "已保存策略", "选股结果"):
+            page = QWidget()
+            QVBoxLayout(page)
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
+        # 默认显示的策略构建页立即创建
+        self._ensure_tab_built(0)
         
         layout.addWidget(self.tab_widget)
         
-    def setup_strategy_builder_tab(self):
-        """设置策略构建标签页"""
-        builder_widget = QWidget()
-        layout = QVBoxLayout(builder_widget)
+    def _ensure_tab_built(self, index):
+        """确保指定标签页的内容已创建"""
+        if 0 <= index < len(self._tab_built) and not self._tab_built[index]:
+            self._tab_built[index] = True
+            self._tab_builders[index](self.tab_widget.widget(index).layout())
         
+    def setup_strategy_builder_tab(self, layout):
+        """设置策略构建标签页"""
         # 策略基本信息
         self.setup_strategy_info(layout)
         
@@ -64,8 +286,6 @@ class StrategyPanelWidget(QWidget):
         # 操作按钮
         self.setup_action_buttons(layout)
         
-        self.tab_widget.addTab(builder_widget, "策略构建")
-        
     def setup_strategy_info(self, parent_layout):
         """设置策略基本信息"""
         info_group = QGroupBox("策略信息")
@@ -105,6 +325,7 @@ class StrategyPanelWidget(QWidget):
         
         # 条件列表
         self.conditions_tree = QTreeWidget()
+        self.conditions_tree.setUniformRowHeights(True)
         self.conditions_tree.setHeaderLabels(["条件类型", "字段", "运算符", "值", "逻辑"])
         self.conditions_tree.setMaximumHeight(200)
         layout.addWidget(self.conditions_tree)
@@ -121,22 +342,10 @@ class StrategyPanelWidget(QWidget):
         button_layout.addWidget(preview_btn)
         
         # 执行选股按钮
-        execute_btn = QPushButton("执行选股")
-        execute_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
-        execute_btn.clicked.connect(self.execute_strategy)
-        button_layout.addWidget(execute_btn)
+        self.execute_btn = QPushButton("执行选股")
+        self.execute_btn.setStyleSheet(_EXECUTE_BTN_QSS)
+        self.execute_btn.clicked.connect(self.execute_strategy)
+        button_layout.addWidget(self.execute_btn)
         
         # 保存策略按钮
         save_btn = QPushButton("保存策略")
@@ -145,11 +354,8 @@ class StrategyPanelWidget(QWidget):
         
         parent_layout.addLayout(button_layout)
         
-    def setup_saved_strategies_tab(self):
+    def setup_saved_strategies_tab(self, layout):
         """设置已保存策略标签页"""
-        saved_widget = QWidget()
-        layout = QVBoxLayout(saved_widget)
-        
         # 工具栏
         toolbar_layout = QHBoxLayout()
         
@@ -162,28 +368,29 @@ class StrategyPanelWidget(QWidget):
         
         # 策略列表
         self.saved_strategies_tree = QTreeWidget()
+        self.saved_strategies_tree.setUniformRowHeights(True)
         self.saved_strategies_tree.setHeaderLabels(["策略名称", "创建时间", "描述"])
         self.saved_strategies_tree.itemDoubleClicked.connect(self.load_strategy)
         self.saved_strategies_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.saved_strategies_tree.customContextMenuRequested.connect(self.show_strategy_menu)
         layout.addWidget(self.saved_strategies_tree)
         
-        self.tab_widget.addTab(saved_widget, "已保存策略")
+        self._refresh_strategies_tree()
         
-    def setup_results_tab(self):
+    def setup_results_tab(self, layout):
         """设置选股结果标签页"""
-        results_widget = QWidget()
-        layout = QVBoxLayout(results_widget)
-        
         # 结果信息
         self.results_info_label = QLabel("选股结果: 0 只股票")
-        results_font = QFont()
-        results_font.setBold(True)
-        self.results_info_label.setFont(results_font)
+        self.results_info_label.setFont(_font(bold=True))
         layout.addWidget(self.results_info_label)
         
-        # 结果表格
-        self.results_table = QTableWidget()
+        # 结果表格 (模型/视图: 数据由 ResultsTableModel 持有)
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_delegate = SpeedUpDelegate(self.results_table)
+        self.results_table.setItemDelegate(self.results_delegate)
+        self.results_model.modelReset.connect(self.results_delegate.clear_cache)
         self.setup_results_table()
         layout.addWidget(self.results_table)
         
@@ -197,19 +404,19 @@ class StrategyPanelWidget(QWidget):
         
         layout.addLayout(export_layout)
         
-        self.tab_widget.addTab(results_widget, "选股结果")
-        
     def setup_results_table(self):
         """设置结果表格"""
-        columns = ["代码", "名称", "现价", "涨跌幅", "成交额", "市盈率", "市净率"]
-        self.results_table.setColumnCount(len(columns))
-        self.results_table.setHorizontalHeaderLabels(columns)
-        
         # 设置表格属性
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.results_table.setSortingEnabled(True)
         
+        # 固定行高、按像素滚动: 视图不必逐行计算行高，只为可见行取数据
+        self.results_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(_RESULT_ROW_HEIGHT)
+        
         # 设置列宽
         header = self.results_table.horizontalHeader()
         header.setStretchLastSection(True)
@@ -225,15 +432,23 @@ class StrategyPanelWidget(QWidget):
             
     def add_condition_to_tree(self, condition):
         """添加条件到树控件"""
-        item = QTreeWidgetItem(self.conditions_tree)
-        item.setText(0, condition['category'])
-        item.setText(1, condition['field'])
-        item.setText(2, condition['operator'])
-        item.setText(3, str(condition['value']))
-        item.setText(4, condition['logic'])
+        self.conditions_tree.addTopLevelItem(self._make_condition_item(condition))
+        
+    @staticmethod
+    def _make_condition_item(condition) -> QTreeWidgetItem:
+        """创建条件项目 (不指定父控件，由调用方加入树)"""
+        # 从配置加载的条件是只读视图，复制成普通字典；其中的字符串驻留后与对话框创建的条件共用
+        condition = dict(condition)
+        for key in _INTERNED_CONDITION_KEYS:
+            condition[key] = sys.intern(condition[key])
+        item = QTreeWidgetItem([
+            condition['category'], condition['field'], condition['operator'],
+            str(condition['value']), condition['logic'],
+        ])
         
         # 存储完整条件数据
         item.setData(0, Qt.ItemDataRole.UserRole, condition)
+        return item
         
     def clear_conditions(self):
         """清空条件"""
@@ -255,10 +470,18 @@ class StrategyPanelWidget(QWidget):
             QMessageBox.warning(self, "警告", "请至少添加一个选股条件")
             return
             
+        # 选股需要网络请求，在线程池中执行，完成前禁用按钮防止重复提交
+        self.execute_btn.setEnabled(False)
+        queued = Qt.ConnectionType.QueuedConnection
+        runnable = FetchRunnable(self.run_stock_selection, conditions)
+        runnable.signals.result_ready.connect(self._on_selection_finished, queued)
+        runnable.signals.error_occurred.connect(self._on_selection_failed, queued)
+        QThreadPool.globalInstance().start(runnable)
+        
+    def _on_selection_finished(self, results):
+        """选股完成"""
+        self.execute_btn.setEnabled(True)
         try:
-            # 执行选股逻辑
-            results = self.run_stock_selection(conditions)
-            
             # 更新结果
             self.update_results_table(results)
             
@@ -271,88 +494,44 @@ class StrategyPanelWidget(QWidget):
             logger.error(f"执行选股策略失败: {e}")
             QMessageBox.critical(self, "错误", f"执行选股失败: {str(e)}")
             
+    def _on_selection_failed(self, error_msg):
+        """选股失败"""
+        self.execute_btn.setEnabled(True)
+        logger.error(f"执行选股策略失败: {error_msg}")
+        QMessageBox.critical(self, "错误", f"执行选股失败: {error_msg}")
+            
     def run_stock_selection(self, conditions):
         """运行股票选择逻辑"""
         # 这里实现实际的选股逻辑
         # 目前返回模拟数据
-        import random
         
         # 获取股票列表
         stock_list = data_provider.get_stock_list()
         if stock_list.empty:
             return pd.DataFrame()
             
-        # 随机选择一些股票作为演示
-        sample_size = min(20, len(stock_list))
-        selected_stocks = stock_list.sample(n=sample_size)
+        # 随机选择一些股票作为演示 (只抽取行号，不复制整张股票列表；限制数量避免请求过多)
+        sample_size = min(10, len(stock_list))
+        idx = np.random.default_rng().choice(len(stock_list), size=sample_size, replace=False)
+        symbols = stock_list['代码'].to_numpy()[idx].tolist()
         
         # 获取这些股票的实时数据
-        symbols = selected_stocks['代码'].tolist()
-        real_time_data = data_provider.get_real_time_data(symbols[:10])  # 限制数量避免请求过多
-        
-        return real_time_data
+        return data_provider.get_real_time_data(symbols)
         
     def update_results_table(self, results):
         """更新结果表格"""
-        if results.empty:
-            self.results_table.setRowCount(0)
-            self.results_info_label.setText("选股结果: 0 只股票")
+        # 结果与上次完全相同 (如重复执行同一策略) 时不重建表格
+        results_sig = (results.shape, tuple(results.columns),
+                       hash(pd.util.hash_pandas_object(results, index=False).to_numpy().tobytes()))
+        if results_sig == self._last_results_sig:
             return
-            
-        self.results_table.setRowCount(len(results))
-        self.results_info_label.setText(f"选股结果: {len(results)} 只股票")
+        self._last_results_sig = results_sig
         
-        column_mapping = {
-            0: '代码',
-            1: '名称',
-            2: '最新价',
-            3: '涨跌幅',
-            4: '成交额',
-            5: '市盈率-动态',
-            6: '市净率'
-        }
-        
-        for row in range(len(results)):
-            row_data = results.iloc[row]
-            
-            for col in range(self.results_table.columnCount()):
-                if col in column_mapping:
-                    data_key = column_mapping[col]
-                    if data_key in row_data:
-                        value = row_data[data_key]
-                        formatted_value = self.format_table_value(col, value)
-                        
-                        item = QTableWidgetItem(str(formatted_value))
-                        self.results_table.setItem(row, col, item)
-                    else:
-                        item = QTableWidgetItem("--")
-                        self.results_table.setItem(row, col, item)
+        # 一次模型重置，视图只为可见单元格取值
+        self._ensure_tab_built(2)
+        self.results_model.set_data(results)
+        self.results_info_label.setText(f"选股结果: {len(results)} 只股票")
                         
-    def format_table_value(self, col, value):
-        """格式化表格值"""
-        if pd.isna(value) or value == '':
-            return '--'
-            
-        try:
-            if col == 2:  # 现价
-                return f"{float(value):.2f}"
-            elif col == 3:  # 涨跌幅
-                return f"{float(value):.2f}%"
-            elif col == 4:  # 成交额
-                val = float(value)
-                if val >= 100000000:
-                    return f"{val/100000000:.1f}亿"
-                elif val >= 10000:
-                    return f"{val/10000:.1f}万"
-                else:
-                    return f"{val:.0f}"
-            elif col in [5, 6]:  # 市盈率、市净率
-                return f"{float(value):.2f}"
-            else:
-                return str(value)
-        except:
-            return str(value) if value is not None else '--'
-            
     def save_strategy(self):
         """保存策略"""
         strategy_name = self.strategy_name_input.text().strip()
@@ -372,15 +551,14 @@ class StrategyPanelWidget(QWidget):
             'created_time': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # 保存到配置
-        saved_strategies = config_manager.get('strategy.saved_strategies', {})
-        saved_strategies[strategy_name] = strategy_data
-        config_manager.set('strategy.saved_strategies', saved_strategies)
+        # 保存到配置 (在面板缓存的策略字典上修改后写回，不再重新读取)
+        self._strategies_cache[strategy_name] = strategy_data
+        config_manager.set('strategy.saved_strategies', self._strategies_cache)
         
         QMessageBox.information(self, "成功", f"策略 '{strategy_name}' 已保存")
         
         # 刷新已保存策略列表
-        self.load_saved_strategies()
+        self._refresh_strategies_tree()
         
     def get_conditions_from_tree(self):
         """从树控件获取条件"""
@@ -393,19 +571,47 @@ class StrategyPanelWidget(QWidget):
         return conditions
         
     def load_saved_strategies(self):
-        """加载已保存的策略"""
-        self.saved_strategies_tree.clear()
-        
-        saved_strategies = config_manager.get('strategy.saved_strategies', {})
+        """从配置重新加载已保存的策略"""
+        self._strategies_cache = dict(config_manager.get('strategy.saved_strategies', {}))
+        self._refresh_strategies_tree()
+        
+    def _refresh_strategies_tree(self):
+        """按缓存的策略字典刷新已保存策略树 (与上次加载的结果比较，只增删改有变化的项目)"""
+        if not self._tab_built[1]:
+            # 已保存策略页尚未创建，创建时再填充
+            return
+        saved_strategies = self._strategies_cache
+        tree = self.saved_strategies_tree
         
-        for name, strategy_data in saved_strategies.items():
-            item = QTreeWidgetItem(self.saved_strategies_tree)
-            item.setText(0, name)
-            item.setText(1, strategy_data.get('created_time', ''))
-            item.setText(2, strategy_data.get('description', ''))
-            
-            # 存储策略数据
-            item.setData(0, Qt.ItemDataRole.UserRole, strategy_data)
+        tree.setUpdatesEnabled(False)
+        try:
+            # 移除已删除的策略
+            for name in self._loaded_strategy_items.keys() - saved_strategies.keys():
+                item = self._loaded_strategy_items.pop(name)
+                tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+                
+            # 新增的策略先创建好项目，最后一次加入树
+            new_items = []
+            for name, strategy_data in saved_strategies.items():
+                item = self._loaded_strategy_items.get(name)
+                if item is None:
+                    item = QTreeWidgetItem()
+                    self._loaded_strategy_items[name] = item
+                    new_items.append(item)
+                elif item.data(0, Qt.ItemDataRole.UserRole) == strategy_data:
+                    continue
+                    
+                item.setText(0, name)
+                item.setText(1, strategy_data.get('created_time', ''))
+                item.setText(2, strategy_data.get('description', ''))
+                
+                # 存储策略数据
+                item.setData(0, Qt.ItemDataRole.UserRole, strategy_data)
+                
+            if new_items:
+                tree.addTopLevelItems(new_items)
+        finally:
+            tree.setUpdatesEnabled(True)
             
     def load_strategy(self, item):
         """加载策略"""
@@ -422,8 +628,7 @@ class StrategyPanelWidget(QWidget):
         
         # 加载条件
         conditions = strategy_data.get('conditions', [])
-        for condition in conditions:
-            self.add_condition_to_tree(condition)
+        self.conditions_tree.addTopLevelItems([self._make_condition_item(condition) for condition in conditions])
             
         # 切换到策略构建标签页
         self.tab_widget.setCurrentIndex(0)
@@ -497,24 +702,19 @@ class ConditionDialog(QDialog):
         
     def on_category_changed(self, category):
         """类别改变事件"""
+        # 清空和填充期间不发出选项变化信号
+        self.field_combo.blockSignals(True)
         self.field_combo.clear()
-        
-        fields = {
-            "技术面": ["现价", "涨跌幅", "成交量", "成交额", "换手率", "市盈率", "市净率", "RSI", "MACD", "KDJ"],
-            "基本面": ["每股收益", "净资产收益率", "资产负债率", "营业收入", "净利润", "毛利率"],
-            "热度面": ["搜索热度", "资讯数量", "讨论热度", "资金流向"],
-            "自定义": ["自定义指标1", "自定义指标2"]
-        }
-        
-        if category in fields:
-            self.field_combo.addItems(fields[category])
+        self.field_combo.addItems(_CATEGORY_FIELDS.get(category, ()))
+        self.field_combo.blockSignals(False)
             
     def get_condition(self):
         """获取条件"""
+        # 类别、字段、运算符、逻辑只有少数几种取值，驻留后各条件共用同一个字符串对象
         return {
-            'category': self.category_combo.currentText(),
-            'field': self.field_combo.currentText(),
-            'operator': self.operator_combo.currentText(),
+            'category': sys.intern(self.category_combo.currentText()),
+            'field': sys.intern(self.field_combo.currentText()),
+            'operator': sys.intern(self.operator_combo.currentText()),
             'value': self.value_input.text(),
-            'logic': self.logic_combo.currentText()
+            'logic': sys.intern(self.logic_combo.currentText())
         }
@@ -7,21 +7,180 @@
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTableWidget, QTableWidgetItem, 
-                             QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox,
-                             QGroupBox, QTabWidget, QTextEdit, QCheckBox,
-                             QProgressBar, QMessageBox, QFrame, QSplitter)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSlot
-from PyQt6.QtGui import QFont, QColor, QAction
+                             QPushButton, QTableView, QAbstractItemView, QHeaderView,
+                             QComboBox, QSpinBox, QDoubleSpinBox, QGroupBox,
+                             QMessageBox, QSplitter, QStackedWidget, QFileDialog)
+from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, pyqtSlot,
+                          QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QFont, QColor
 import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+import numpy as np
 from datetime import datetime
-import json
 
-from src.data.data_provider import data_provider
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
+# 结果表格文字颜色，所有行共用
+_RED = QColor("#EF4444")
+_GREEN = QColor("#10B981")
+_YELLOW = QColor("#F59E0B")
+_GRAY = QColor("#6B7280")
+
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size):
+    """按字号创建并缓存微软雅黑粗体，各控件共享 (需在QApplication创建之后调用)"""
+    return QFont("微软雅黑", point_size, QFont.Weight.Bold)
+
+
+def _widget_value(widget):
+    """读取参数控件的当前值 (下拉框取文字，数值框取数值)"""
+    return widget.currentText() if isinstance(widget, QComboBox) else widget.value()
+
+
+# 连续点击执行时合并为一次发送的时间窗口
+_STRATEGY_EMIT_DEBOUNCE_MS = 50
+
+# 策略类型: (显示名称, 稳定键)，键用于选择参数页，不依赖显示文字
+_STRATEGY_TYPES = (
+    ("💹 技术指标策略", 'tech'),
+    ("📈 价值投资策略", 'value'),
+    ("🚀 成长股策略", 'growth'),
+    ("💰 高股息策略", 'dividend'),
+    ("📊 量价策略", 'volume'),
+    ("🔥 热门概念策略", 'concept'),
+)
+
+
+# 结果列: (表头, 字段, 数据类型, 格式)，每个字段按类型存成一列数组；
+# 格式为 None 的文字列原样显示，数值列按格式一次性批量转成字符串
+_RESULT_FIELDS = (
+    ("股票代码", 'code', 'U6', None),
+    ("股票名称", 'name', str, None),
+    ("现价", 'price', 'f8', '%.2f'),
+    ("涨跌幅", 'pct', 'f8', '%+.2f%%'),
+    ("成交量", 'volume', 'i8', '%d万'),
+    ("市盈率", 'pe', 'f8', '%.1f'),
+    ("评分", 'score', 'f8', '%d'),
+    ("操作", 'action', str, None),
+)
+
+# 结果表格固定行高和各列宽度 (最后一列随窗口拉伸)
+_RESULT_ROW_HEIGHT = 24
+_RESULT_COLUMN_WIDTHS = (80, 100, 80, 80, 90, 70, 60, 60)
+
+# 评分分档 -> 颜色 (>=80 红, >=70 黄, 其余灰)
+_SCORE_COLORS = (_RED, _YELLOW, _GRAY)
+
+
+def _score_colors(score):
+    """评分列对应的文字颜色"""
+    buckets = np.where(score >= 80, 0, np.where(score >= 70, 1, 2))
+    return [_SCORE_COLORS[bucket] for bucket in buckets]
+
+
+def _change_colors(pct):
+    """涨跌幅列对应的文字颜色 (涨或平红, 跌绿)"""
+    return [_RED if up else _GREEN for up in pct >= 0]
+
+
+# 字段 -> 整列文字颜色函数，未列出的列不着色
+_FIELD_COLOR_FNS = {'pct': _change_colors, 'score': _score_colors}
+
+
+def _format_field(values, fmt):
+    """把一列数据整体格式化为字符串列表"""
+    if fmt is None:
+        return values.astype(str).tolist()
+    return np.char.mod(fmt, values).tolist()
+
+
+class StrategyResultsModel(QAbstractTableModel):
+    """策略结果表格模型 - 每个字段一列类型化数组，显示文字和颜色在设置数据时按列批量算好，排序只重排行号"""
+    
+    HEADERS = tuple(header for header, _field, _dtype, _fmt in _RESULT_FIELDS)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = {field: np.empty(0, dtype=dtype) for _header, field, dtype, _fmt in _RESULT_FIELDS}
+        self._order = np.arange(0)  # 显示行 -> 数据行
+        self._display = [[] for _ in _RESULT_FIELDS]  # 列号 -> 每个数据行的显示文字
+        self._colors = {}  # 列号 -> 每个数据行的文字颜色
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        
+    def set_columns(self, columns):
+        """替换全部结果 (字段 -> 一列数据，一次模型重置，视图只重绘一次)，保持当前排序"""
+        columns = {field: np.asarray(columns[field], dtype=dtype)
+                   for _header, field, dtype, _fmt in _RESULT_FIELDS}
+        display = [_format_field(columns[field], fmt) for _header, field, _dtype, fmt in _RESULT_FIELDS]
+        colors = {col: _FIELD_COLOR_FNS[field](columns[field])
+                  for col, (_header, field, _dtype, _fmt) in enumerate(_RESULT_FIELDS)
+                  if field in _FIELD_COLOR_FNS}
+        self.beginResetModel()
+        self._columns = columns
+        self._display = display
+        self._colors = colors
+        self._order = self._sorted_order()
+        self.endResetModel()
+        
+    def to_frame(self) -> "pd.DataFrame":
+        """按当前显示顺序导出结果 (列名为表头)"""
+        # 延迟导入: 只有导出时才需要 pandas
+        import pandas as pd
+        return pd.DataFrame({header: self._columns[field][self._order]
+                             for header, field, _dtype, _fmt in _RESULT_FIELDS})
+        
+    def _sorted_order(self) -> np.ndarray:
+        """按当前排序列计算行顺序 (直接对该列的类型化数组整列 argsort)"""
+        row_count = len(self._columns['code'])
+        if not 0 <= self._sort_column < len(_RESULT_FIELDS):
+            return np.arange(row_count)
+        keys = self._columns[_RESULT_FIELDS[self._sort_column][1]]
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        if keys.dtype.kind in 'if':
+            # 数值列取负数实现降序，保持相同值的原有顺序
+            return np.argsort(-keys if descending else keys, kind='stable')
+        order = np.argsort(keys, kind='stable')
+        return order[::-1] if descending else order
+        
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """点击表头排序"""
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_order = order
+        self._order = self._sorted_order()
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        data_row = self._order[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.column()][data_row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            colors = self._colors.get(index.column())
+            return None if colors is None else colors[data_row]
+        return None
+
+
 class StrategyBuilder(QWidget):
     """策略构建器"""
     
@@ -29,6 +188,17 @@ class StrategyBuilder(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 策略类型 -> {参数名: 输入控件}，由各 create_*_params 登记；_param_key 为当前显示的参数页
+        self._param_widgets = {}
+        self._param_key = None
+        
+        # 执行请求先暂存，定时器到期时只发送最后一次
+        self._pending_strategy = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(_STRATEGY_EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_pending_strategy)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -39,7 +209,7 @@ class StrategyBuilder(QWidget):
         
         # 标题
         title = QLabel("🧠 智能策略构建器")
-        title.setFont(QFont("微软雅黑", 14, QFont.Weight.Bold))
+        title.setFont(_bold_font(14))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -48,24 +218,34 @@ class StrategyBuilder(QWidget):
         strategy_layout = QVBoxLayout(strategy_group)
         
         self.strategy_combo = QComboBox()
-        self.strategy_combo.addItems([
-            "💹 技术指标策略", 
-            "📈 价值投资策略", 
-            "🚀 成长股策略",
-            "💰 高股息策略",
-            "📊 量价策略",
-            "🔥 热门概念策略"
-        ])
-        self.strategy_combo.currentTextChanged.connect(self.on_strategy_changed)
+        for display, key in _STRATEGY_TYPES:
+            self.strategy_combo.addItem(display, key)
+        self.strategy_combo.currentIndexChanged.connect(self.on_strategy_changed)
         strategy_layout.addWidget(self.strategy_combo)
         
         layout.addWidget(strategy_group)
         
-        # 参数设置区域
+        # 参数设置区域 - 每种策略的参数页只创建一次，切换策略时只切换当前页
         self.params_group = QGroupBox("⚙️ 参数设置")
-        self.params_layout = QVBoxLayout(self.params_group)
+        params_layout = QVBoxLayout(self.params_group)
+        self.params_stack = QStackedWidget()
+        self._pages = {}
+        page_builders = {
+            'tech': self.create_technical_params,
+            'value': self.create_value_params,
+            'growth': self.create_growth_params,
+            'dividend': self.create_dividend_params,
+            'volume': self.create_volume_params,
+            'concept': self.create_concept_params,
+        }
+        for key, create_params in page_builders.items():
+            page = QWidget()
+            create_params(QVBoxLayout(page))
+            self.params_stack.addWidget(page)
+            self._pages[key] = page
+        params_layout.addWidget(self.params_stack)
         
-        self.create_technical_params()  # 默认显示技术指标参数
+        self.show_params('tech')  # 默认显示技术指标参数
         
         layout.addWidget(self.params_group)
         
@@ -73,12 +253,12 @@ class StrategyBuilder(QWidget):
         button_layout = QHBoxLayout()
         
         self.preview_btn = QPushButton("👀 预览结果")
-        self.preview_btn.setFont(QFont("微软雅黑", 10, QFont.Weight.Bold))
+        self.preview_btn.setFont(_bold_font(10))
         self.preview_btn.clicked.connect(self.preview_strategy)
         button_layout.addWidget(self.preview_btn)
         
         self.execute_btn = QPushButton("🚀 执行策略")
-        self.execute_btn.setFont(QFont("微软雅黑", 10, QFont.Weight.Bold))
+        self.execute_btn.setFont(_bold_font(10))
         self.execute_btn.setStyleSheet("""
             QPushButton {
                 background-color: #10B981;
@@ -97,10 +277,8 @@ class StrategyBuilder(QWidget):
         layout.addWidget(QWidget())  # 弹性空间
         layout.addLayout(button_layout)
         
-    def create_technical_params(self):
+    def create_technical_params(self, layout):
         """创建技术指标参数"""
-        self.clear_params()
-        
         # RSI参数
         rsi_layout = QHBoxLayout()
         rsi_layout.addWidget(QLabel("RSI周期:"))
@@ -121,7 +299,7 @@ class StrategyBuilder(QWidget):
         self.rsi_upper.setValue(70)
         rsi_layout.addWidget(self.rsi_upper)
         
-        self.params_layout.addLayout(rsi_layout)
+        layout.addLayout(rsi_layout)
         
         # MACD参数
         macd_layout = QHBoxLayout()
@@ -143,12 +321,18 @@ class StrategyBuilder(QWidget):
         self.macd_signal.setValue(9)
         macd_layout.addWidget(self.macd_signal)
         
-        self.params_layout.addLayout(macd_layout)
+        layout.addLayout(macd_layout)
+        self._param_widgets['tech'] = {
+            'rsi_period': self.rsi_period,
+            'rsi_lower': self.rsi_lower,
+            'rsi_upper': self.rsi_upper,
+            'macd_fast': self.macd_fast,
+            'macd_slow': self.macd_slow,
+            'macd_signal': self.macd_signal,
+        }
         
-    def create_value_params(self):
+    def create_value_params(self, layout):
         """创建价值投资参数"""
-        self.clear_params()
-        
         # PE参数
         pe_layout = QHBoxLayout()
         pe_layout.addWidget(QLabel("市盈率上限:"))
@@ -163,7 +347,7 @@ class StrategyBuilder(QWidget):
         self.pb_upper.setValue(3)
         pe_layout.addWidget(self.pb_upper)
         
-        self.params_layout.addLayout(pe_layout)
+        layout.addLayout(pe_layout)
         
         # ROE参数
         roe_layout = QHBoxLayout()
@@ -179,12 +363,16 @@ class StrategyBuilder(QWidget):
         self.debt_upper.setValue(60)
         roe_layout.addWidget(self.debt_upper)
         
-        self.params_layout.addLayout(roe_layout)
+        layout.addLayout(roe_layout)
+        self._param_widgets['value'] = {
+            'pe_upper': self.pe_upper,
+            'pb_upper': self.pb_upper,
+            'roe_lower': self.roe_lower,
+            'debt_upper': self.debt_upper,
+        }
         
-    def create_growth_params(self):
+    def create_growth_params(self, layout):
         """创建成长股参数"""
-        self.clear_params()
-        
         # 营收增长
         revenue_layout = QHBoxLayout()
         revenue_layout.addWidget(QLabel("营收增长率下限(%):"))
@@ -199,12 +387,14 @@ class StrategyBuilder(QWidget):
         self.profit_growth.setValue(25)
         revenue_layout.addWidget(self.profit_growth)
         
-        self.params_layout.addLayout(revenue_layout)
+        layout.addLayout(revenue_layout)
+        self._param_widgets['growth'] = {
+            'revenue_growth': self.revenue_growth,
+            'profit_growth': self.profit_growth,
+        }
         
-    def create_dividend_params(self):
+    def create_dividend_params(self, layout):
         """创建高股息参数"""
-        self.clear_params()
-        
         dividend_layout = QHBoxLayout()
         dividend_layout.addWidget(QLabel("股息率下限(%):"))
         self.dividend_yield = QDoubleSpinBox()
@@ -218,12 +408,14 @@ class StrategyBuilder(QWidget):
         self.dividend_years.setValue(3)
         dividend_layout.addWidget(self.dividend_years)
         
-        self.params_layout.addLayout(dividend_layout)
+        layout.addLayout(dividend_layout)
+        self._param_widgets['dividend'] = {
+            'dividend_yield': self.dividend_yield,
+            'dividend_years': self.dividend_years,
+        }
         
-    def create_volume_params(self):
+    def create_volume_params(self, layout):
         """创建量价策略参数"""
-        self.clear_params()
-        
         volume_layout = QHBoxLayout()
         volume_layout.addWidget(QLabel("成交量倍数:"))
         self.volume_ratio = QDoubleSpinBox()
@@ -237,12 +429,14 @@ class StrategyBuilder(QWidget):
         self.price_change.setValue(3)
         volume_layout.addWidget(self.price_change)
         
-        self.params_layout.addLayout(volume_layout)
+        layout.addLayout(volume_layout)
+        self._param_widgets['volume'] = {
+            'volume_ratio': self.volume_ratio,
+            'price_change': self.price_change,
+        }
         
-    def create_concept_params(self):
+    def create_concept_params(self, layout):
         """创建热门概念参数"""
-        self.clear_params()
-        
         concept_layout = QVBoxLayout()
         
         concept_layout.addWidget(QLabel("热门概念:"))
@@ -261,30 +455,21 @@ class StrategyBuilder(QWidget):
         strength_layout.addWidget(self.concept_strength)
         concept_layout.addLayout(strength_layout)
         
-        self.params_layout.addLayout(concept_layout)
+        layout.addLayout(concept_layout)
+        self._param_widgets['concept'] = {
+            'concept': self.concept_combo,
+            'concept_strength': self.concept_strength,
+        }
+        
+    def show_params(self, key):
+        """切换到指定策略类型的参数页"""
+        self.params_stack.setCurrentWidget(self._pages[key])
+        self._param_key = key
         
-    def clear_params(self):
-        """清空参数区域"""
-        while self.params_layout.count():
-            child = self.params_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
-    def on_strategy_changed(self, strategy_name):
+    def on_strategy_changed(self, index):
         """策略类型变化"""
-        if "技术指标" in strategy_name:
-            self.create_technical_params()
-        elif "价值投资" in strategy_name:
-            self.create_value_params()
-        elif "成长股" in strategy_name:
-            self.create_growth_params()
-        elif "高股息" in strategy_name:
-            self.create_dividend_params()
-        elif "量价" in strategy_name:
-            self.create_volume_params()
-        elif "热门概念" in strategy_name:
-            self.create_concept_params()
-            
+        self.show_params(self.strategy_combo.itemData(index))
+        
     def preview_strategy(self):
         """预览策略结果"""
         QMessageBox.information(self, "预览", "策略预览功能开发中...")
@@ -296,38 +481,23 @@ class StrategyBuilder(QWidget):
         # 收集参数
         params = self.collect_params()
         
-        strategy_data = {
+        self._pending_strategy = {
             "name": strategy_name,
             "params": params,
             "timestamp": datetime.now().isoformat()
         }
+        self._emit_timer.start()
         
-        self.strategy_ready.emit(strategy_data)
+    def _emit_pending_strategy(self):
+        """发送暂存的策略 (连续执行只发送最后一次)"""
+        strategy_data, self._pending_strategy = self._pending_strategy, None
+        if strategy_data is not None:
+            self.strategy_ready.emit(strategy_data)
         
     def collect_params(self):
         """收集当前参数"""
-        strategy_name = self.strategy_combo.currentText()
-        params = {}
-        
-        if "技术指标" in strategy_name:
-            params = {
-                "rsi_period": getattr(self, 'rsi_period', QSpinBox()).value() if hasattr(self, 'rsi_period') else 14,
-                "rsi_lower": getattr(self, 'rsi_lower', QDoubleSpinBox()).value() if hasattr(self, 'rsi_lower') else 30,
-                "rsi_upper": getattr(self, 'rsi_upper', QDoubleSpinBox()).value() if hasattr(self, 'rsi_upper') else 70,
-                "macd_fast": getattr(self, 'macd_fast', QSpinBox()).value() if hasattr(self, 'macd_fast') else 12,
-                "macd_slow": getattr(self, 'macd_slow', QSpinBox()).value() if hasattr(self, 'macd_slow') else 26,
-                "macd_signal": getattr(self, 'macd_signal', QSpinBox()).value() if hasattr(self, 'macd_signal') else 9
-            }
-        elif "价值投资" in strategy_name:
-            params = {
-                "pe_upper": getattr(self, 'pe_upper', QDoubleSpinBox()).value() if hasattr(self, 'pe_upper') else 20,
-                "pb_upper": getattr(self, 'pb_upper', QDoubleSpinBox()).value() if hasattr(self, 'pb_upper') else 3,
-                "roe_lower": getattr(self, 'roe_lower', QDoubleSpinBox()).value() if hasattr(self, 'roe_lower') else 15,
-                "debt_upper": getattr(self, 'debt_upper', QDoubleSpinBox()).value() if hasattr(self, 'debt_upper') else 60
-            }
-        # 其他策略类型的参数收集...
-        
-        return params
+        widgets = self._param_widgets.get(self._param_key, {})
+        return {name: _widget_value(widget) for name, widget in widgets.items()}
 
 
 class StrategyResultsWidget(QWidget):
@@ -345,17 +515,27 @@ class StrategyResultsWidget(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         
         # 结果表格
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(8)
-        self.results_table.setHorizontalHeaderLabels([
-            "股票代码", "股票名称", "现价", "涨跌幅", 
-            "成交量", "市盈率", "评分", "操作"
-        ])
+        self.results_model = StrategyResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         
         # 设置表格样式
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.results_table.setSortingEnabled(True)
+        
+        # 固定行高列宽、按像素滚动: 数据变化时视图不必逐行逐列计算尺寸
+        self.results_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.results_table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(_RESULT_ROW_HEIGHT)
+        
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        for col, width in enumerate(_RESULT_COLUMN_WIDTHS):
+            self.results_table.setColumnWidth(col, width)
+        header.setStretchLastSection(True)
         
         layout.addWidget(self.results_table)
         
@@ -363,7 +543,7 @@ class StrategyResultsWidget(QWidget):
         stats_layout = QHBoxLayout()
         
         self.total_label = QLabel("总计: 0 只")
-        self.total_label.setFont(QFont("微软雅黑", 10, QFont.Weight.Bold))
+        self.total_label.setFont(_bold_font(10))
         stats_layout.addWidget(self.total_label)
         
         stats_layout.addStretch()
@@ -375,44 +555,40 @@ class StrategyResultsWidget(QWidget):
         layout.addLayout(stats_layout)
         
     def update_results(self, strategy_data):
-        """更新策略结果"""
-        # 模拟策略执行结果
-        mock_results = [
-            ["000001", "平安银行", "12.50", "+2.50%", "1200万", "6.5", "85", "买入"],
-            ["000002", "万科A", "15.80", "+1.20%", "800万", "8.2", "78", "观望"],
-            ["600036", "招商银行", "45.20", "+0.80%", "2000万", "7.8", "82", "买入"],
-            ["600519", "贵州茅台", "1680.00", "-0.50%", "500万", "28.5", "75", "观望"],
-            ["000858", "五粮液", "155.30", "+1.80%", "1500万", "22.3", "80", "买入"]
-        ]
-        
-        self.results_table.setRowCount(len(mock_results))
-        
-        for row, data in enumerate(mock_results):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(str(value))
-                
-                # 设置颜色
-                if col == 3:  # 涨跌幅列
-                    if "+" in value:
-                        item.setForeground(QColor("#EF4444"))  # 红色
-                    else:
-                        item.setForeground(QColor("#10B981"))  # 绿色
-                elif col == 6:  # 评分列
-                    score = float(value)
-                    if score >= 80:
-                        item.setForeground(QColor("#EF4444"))  # 红色
-                    elif score >= 70:
-                        item.setForeground(QColor("#F59E0B"))  # 黄色
-                    else:
-                        item.setForeground(QColor("#6B7280"))  # 灰色
-                        
-                self.results_table.setItem(row, col, item)
-                
-        self.total_label.setText(f"总计: {len(mock_results)} 只")
+        """更新策略结果，返回选出的股票代码列表"""
+        # 模拟策略执行结果 (按列保存原始数值，显示格式由模型统一处理)
+        mock_results = {
+            'code': ["000001", "000002", "600036", "600519", "000858"],
+            'name': ["平安银行", "万科A", "招商银行", "贵州茅台", "五粮液"],
+            'price': [12.50, 15.80, 45.20, 1680.00, 155.30],
+            'pct': [2.50, 1.20, 0.80, -0.50, 1.80],
+            'volume': [1200, 800, 2000, 500, 1500],
+            'pe': [6.5, 8.2, 7.8, 28.5, 22.3],
+            'score': [85, 78, 82, 75, 80],
+            'action': ["买入", "观望", "买入", "观望", "买入"],
+        }
+        
+        # 一次模型重置替代逐格创建表格项
+        self.results_model.set_columns(mock_results)
+        self.total_label.setText(f"总计: {self.results_model.rowCount()} 只")
+        return list(mock_results['code'])
         
     def export_results(self):
         """导出结果"""
-        QMessageBox.information(self, "导出", "结果导出功能开发中...")
+        if self.results_model.rowCount() == 0:
+            QMessageBox.information(self, "导出", "没有可导出的结果")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(self, "导出结果", "策略结果.csv", "CSV 文件 (*.csv)")
+        if not file_path:
+            return
+        
+        try:
+            self.results_model.to_frame().to_csv(file_path, index=False, encoding='utf-8-sig')
+            logger.info(f"策略结果已导出: {file_path}")
+        except Exception as e:
+            logger.error(f"导出策略结果失败: {e}")
+            QMessageBox.warning(self, "导出", f"导出失败: {e}")
 
 
 class StrategyWindow(QWidget):
@@ -455,78 +631,12 @@ class StrategyWindow(QWidget):
         
     def setup_connections(self):
         """设置信号连接"""
-        self.strategy_builder.strategy_ready.connect(self.on_strategy_ready)
+        self.strategy_builder.strategy_ready.connect(
+            self.on_strategy_ready, Qt.ConnectionType.QueuedConnection)
         
     def apply_style(self):
-        """应用样式"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-                font-family: "微软雅黑";
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin: 10px 0px;
-                padding-top: 15px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-            }
-            QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover, QLineEdit:hover {
-                border-color: #0D7377;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                width: 12px;
-                height: 12px;
-            }
-            QPushButton {
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 8px 16px;
-                background-color: #404040;
-                color: #FFFFFF;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #0D7377;
-            }
-            QTableWidget {
-                border: 1px solid #404040;
-                background-color: #2D2D2D;
-                alternate-background-color: #353535;
-                gridline-color: #404040;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #0D7377;
-            }
-            QHeaderView::section {
-                background-color: #404040;
-                color: #FFFFFF;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
+        """应用样式 - 深色主题规则在 styles/professional.qss 中按对象名限定到本窗口，由应用统一加载"""
+        self.setObjectName("strategyWindow")
         
     @pyqtSlot(dict)
     def on_strategy_ready(self, strategy_data):
@@ -534,10 +644,11 @@ class StrategyWindow(QWidget):
         logger.info(f"策略执行: {strategy_data['name']}")
         
         # 更新结果显示
-        self.results_widget.update_results(strategy_data)
+        stock_codes = self.results_widget.update_results(strategy_data)
         
-        # 发送策略结果信号
-        self.strategy_applied.emit([])  # 暂时发送空列表
+        # 有选股结果时才发送策略结果信号
+        if stock_codes:
+            self.strategy_applied.emit(stock_codes)
         
     def closeEvent(self, event):
         """关闭事件"""
@@ -549,7 +660,10 @@ class StrategyWindow(QWidget):
 if __name__ == "__main__":
     from PyQt6.QtWidgets import QApplication
     
+    from src.ui.styles import load_qss
+    
     app = QApplication(sys.argv)
+    app.setStyleSheet(load_qss("professional.qss"))
     
     window = StrategyWindow()
     window.show()
@@ -0,0 +1,32 @@
+"""
+界面样式表
+读取并压缩本目录下的 QSS 文件，供各窗口共用
+"""
+import os
+import re
+from functools import lru_cache
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 样式表文件目录
+STYLES_DIR = os.path.dirname(__file__)
+
+
+def minify_qss(qss):
+    """去掉样式表中的注释和多余空白，缩短Qt解析的输入"""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{};,])\s*", r"\1", qss).strip()
+
+
+@lru_cache(maxsize=None)
+def load_qss(name):
+    """读取并压缩样式表文件，每个文件只读取一次"""
+    try:
+        with open(os.path.join(STYLES_DIR, name), encoding="utf-8") as f:
+            return minify_qss(f.read())
+    except OSError as e:
+        logger.error(f"加载样式表失败 [{name}]: {e}")
+        return ""
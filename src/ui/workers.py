@@ -0,0 +1,104 @@
+"""
+后台数据获取任务
+在全局线程池中执行阻塞的数据请求，结果通过信号交回界面线程
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 批量刷新时并发执行各子模块的网络请求，使多个请求的等待时间重叠
+_fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fetch")
+
+
+class FetchSignals(QObject):
+    """后台任务信号 (QRunnable 本身不是 QObject，不能直接发射信号)"""
+
+    result_ready = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+
+
+class FetchRunnable(QRunnable):
+    """在线程池中执行一次阻塞调用，只负责取数，不触碰任何界面控件"""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = FetchSignals()
+
+    def run(self):
+        """执行数据获取"""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"后台数据获取失败: {e}")
+            self.signals.error_occurred.emit(str(e))
+            return
+        self.signals.result_ready.emit(result)
+
+
+class BatchFetchSignals(QObject):
+    """分批获取任务信号"""
+
+    batch_ready = pyqtSignal(object)
+    finished = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+
+
+class BatchFetchRunnable(QRunnable):
+    """在线程池中逐批消费一个生成器，每得到一批就交回界面线程"""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = BatchFetchSignals()
+
+    def run(self):
+        """执行分批获取，出错时已交回的批次保留"""
+        try:
+            for batch in self.fn(*self.args, **self.kwargs):
+                self.signals.batch_ready.emit(batch)
+        except Exception as e:
+            logger.error(f"后台分批获取失败: {e}")
+            self.signals.error_occurred.emit(str(e))
+            return
+        self.signals.finished.emit()
+
+
+class RefreshSignals(QObject):
+    """批量刷新任务信号"""
+
+    finished = pyqtSignal(dict)             # 子模块 -> 获取结果 (只包含成功的子模块)
+    error_occurred = pyqtSignal(str, str)   # 子模块, 错误信息
+
+
+class RefreshWorker(QRunnable):
+    """在一个后台任务中获取多个子模块的数据，全部完成后一次性交回界面线程"""
+
+    def __init__(self, fetchers):
+        super().__init__()
+        self.fetchers = fetchers  # 子模块 -> 获取函数
+        self.signals = RefreshSignals()
+
+    def run(self):
+        """并发获取各子模块数据，单个子模块失败不影响其余子模块"""
+        if len(self.fetchers) > 1:
+            futures = {key: _fetch_executor.submit(fetch) for key, fetch in self.fetchers.items()}
+        else:
+            futures = None
+            
+        results = {}
+        for key, fetch in self.fetchers.items():
+            try:
+                results[key] = futures[key].result() if futures else fetch()
+            except Exception as e:
+                logger.error(f"后台获取数据失败 [{key}]: {e}")
+                self.signals.error_occurred.emit(key, str(e))
+        self.signals.finished.emit(results)
@@ -1,16 +1,69 @@
+import atexit
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+
+from src.utils.paths import PROJECT_ROOT
+
+# orjson 可选: 安装了就用它解析和序列化 (直接处理UTF-8字节，比标准库快)，否则回退到 json
+try:
+    import orjson
+    
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode('utf-8'))
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点分配置键并缓存，频繁读取的键不再重复 split"""
+    return tuple(key.split('.'))
+
+
+def _freeze(value: Any) -> Any:
+    """转成只读视图: 字典 -> MappingProxyType，列表 -> 元组 (逐层转换)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """只读视图还原为普通字典/列表 (写入配置时调用，保存的配置与调用方的对象互不影响)"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
 
 class ConfigManager:
     """配置管理器"""
     
     def __init__(self):
-        self.config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
-        os.makedirs(self.config_dir, exist_ok=True)
+        self.config_dir = PROJECT_ROOT / "config"
+        self.config_dir.mkdir(exist_ok=True)
         
-        self.config_file = os.path.join(self.config_dir, "app_config.json")
+        self.config_file = self.config_dir / "app_config.json"
         self._config = self._load_config()
+        # 已读取过的键 -> 只读配置值，任何修改都会清空
+        self._read_cache: Dict[str, Any] = {}
+        
+        # 延迟保存: 短时间内的多次修改合并为一次写文件 (定时器在后台线程写入，读写配置时加锁)
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._dirty = False
+        atexit.register(self.flush)
     
     def _load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
@@ -49,10 +102,10 @@ class ConfigManager:
             }
         }
         
-        if os.path.exists(self.config_file):
+        if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    saved_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    saved_config = _loads(f.read())
                     # 合并默认配置和保存的配置
                     self._merge_config(default_config, saved_config)
                     return default_config
@@ -64,13 +117,16 @@ class ConfigManager:
             return default_config
     
     def _merge_config(self, default: Dict[str, Any], saved: Dict[str, Any]):
-        """递归合并配置"""
-        for key, value in saved.items():
-            if key in default:
-                if isinstance(value, dict) and isinstance(default[key], dict):
-                    self._merge_config(default[key], value)
-                else:
-                    default[key] = value
+        """合并配置 - 用显式栈逐层合并嵌套字典，不做递归调用"""
+        stack = [(default, saved)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if key in dst:
+                    if isinstance(value, dict) and isinstance(dst[key], dict):
+                        stack.append((dst[key], value))
+                    else:
+                        dst[key] = value
     
     def _save_config(self, config: Optional[Dict[str, Any]] = None):
         """保存配置到文件"""
@@ -78,27 +134,36 @@ class ConfigManager:
             config = self._config
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # 先写临时文件再替换，写入中途出错不会损坏原配置文件
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(config))
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"保存配置文件失败: {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
-        """获取配置值"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        """获取配置值 - 返回只读视图 (字典为 MappingProxyType，列表为元组)，需要修改时先复制再 set"""
+        try:
+            return self._read_cache[key]
+        except KeyError:
+            pass
         
-        return value
+        # 查找、冻结和写入缓存在锁内完成: 后台线程读取期间界面线程修改配置时，不会把旧值写回已清空的缓存
+        with self._lock:
+            value = self._config
+            for k in _split_key(key):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    return default
+            
+            value = self._read_cache[key] = _freeze(value)
+            return value
     
-    def set(self, key: str, value: Any) -> None:
-        """设置配置值"""
-        keys = key.split('.')
+    def _assign(self, key: str, value: Any) -> None:
+        """只在内存中设置配置值，不写文件"""
+        keys = _split_key(key)
         config = self._config
         
         for k in keys[:-1]:
@@ -106,12 +171,57 @@ class ConfigManager:
                 config[k] = {}
             config = config[k]
         
-        config[keys[-1]] = value
+        config[keys[-1]] = _thaw(value)
+        self._read_cache.clear()
+    
+    def set(self, key: str, value: Any) -> None:
+        """设置配置值"""
+        with self._lock:
+            self._assign(key, value)
+            self._save_now()
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """一次设置多个配置值 (键 -> 值)，全部设置后只写一次文件"""
+        with self._lock:
+            for key, value in values.items():
+                self._assign(key, value)
+            self._save_now()
+    
+    def set_deferred(self, key: str, value: Any, delay_ms: int = 500) -> None:
+        """设置配置值，延迟写文件 - delay_ms 内没有新的修改时才写入一次"""
+        self.update_deferred({key: value}, delay_ms)
+    
+    def update_deferred(self, values: Dict[str, Any], delay_ms: int = 500) -> None:
+        """一次设置多个配置值，延迟写文件"""
+        with self._lock:
+            for key, value in values.items():
+                self._assign(key, value)
+            self._dirty = True
+            # 每次修改重新计时，连续修改只在停顿后写一次
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay_ms / 1000, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> None:
+        """立即写入尚未保存的延迟修改"""
+        with self._lock:
+            if self._dirty:
+                self._save_now()
+    
+    def _save_now(self) -> None:
+        """立即写文件，并取消等待中的延迟保存"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        self._dirty = False
         self._save_config()
     
     def save(self):
         """保存当前配置"""
-        self._save_config()
+        with self._lock:
+            self._save_now()
 
 # 全局配置管理器实例
 config_manager = ConfigManager()
@@ -0,0 +1,13 @@
+import numpy as np
+
+# 亿/万换算阈值
+_YI = 100000000
+_WAN = 10000
+
+
+def format_scaled(values: np.ndarray) -> np.ndarray:
+    """把数值数组按亿/万换算单位格式化为字符串数组 (万以上保留一位小数，以下取整)"""
+    conditions = [values >= _YI, values >= _WAN]
+    scaled = np.select(conditions, [values / _YI, values / _WAN], values)
+    text = np.where(values >= _WAN, np.char.mod('%.1f', scaled), np.char.mod('%.0f', scaled))
+    return np.char.add(text, np.select(conditions, ['亿', '万'], ''))
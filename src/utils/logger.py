@@ -1,30 +1,48 @@
+import atexit
 import logging
-import os
+import logging.handlers
+import queue
 from datetime import datetime
 
+from src.utils.paths import PROJECT_ROOT
+
+# 后台写日志的监听线程，setup_logger 只启动一次
+_listener = None
+
 def setup_logger():
-    """设置日志配置"""
+    """设置日志配置 - 调用线程只把记录放入队列，格式化和写文件在后台监听线程完成"""
+    global _listener
+    if _listener is not None:
+        return logging.getLogger(__name__)
+    
     # 创建logs目录
-    logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    logs_dir = PROJECT_ROOT / "logs"
+    logs_dir.mkdir(exist_ok=True)
     
     # 配置日志格式
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
+    formatter = logging.Formatter(log_format, date_format)
     
-    # 配置根日志器
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.FileHandler(
-                os.path.join(logs_dir, f'app_{datetime.now().strftime("%Y%m%d")}.log'),
-                encoding='utf-8'
-            ),
-            logging.StreamHandler()
-        ]
+    file_handler = logging.FileHandler(
+        logs_dir / f'app_{datetime.now().strftime("%Y%m%d")}.log',
+        encoding='utf-8'
     )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    # 退出时先写完队列中剩余的日志
+    atexit.register(_listener.stop)
+    
+    # 配置根日志器 (已有处理器时不再重复添加)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    if not root.handlers:
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logging.getLogger(__name__)
 
@@ -0,0 +1,4 @@
+from pathlib import Path
+
+# 项目根目录 (src/utils 的上两级)，导入时解析一次，日志、配置等目录都基于它
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -0,0 +1,13 @@
+import pytest
+
+from src.utils import config as config_module
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """在临时目录中创建配置管理器，不读写项目自身的配置文件"""
+    monkeypatch.setattr(config_module, "PROJECT_ROOT", tmp_path)
+    mgr = config_module.ConfigManager()
+    yield mgr
+    if mgr._save_timer is not None:
+        mgr._save_timer.cancel()
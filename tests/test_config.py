@@ -0,0 +1,107 @@
+import json
+from types import MappingProxyType
+
+import pytest
+
+from src.utils import config as config_module
+from src.utils.config import ConfigManager, _dumps, _freeze, _loads, _thaw
+
+
+def test_loads_dumps_round_trip():
+    data = {"名称": "平安银行", "列表": [1, 2.5, None, True], "嵌套": {"键": {}}}
+    raw = _dumps(data)
+    assert isinstance(raw, bytes)
+    assert _loads(raw) == data
+    # 写出的文件标准库也能读取
+    assert json.loads(raw.decode("utf-8")) == data
+
+
+def test_freeze_and_thaw():
+    data = {"a": [1, {"b": [2, 3]}], "c": {"d": 4}}
+    frozen = _freeze(data)
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen["a"] == (1, MappingProxyType({"b": (2, 3)}))
+    with pytest.raises(TypeError):
+        frozen["c"]["d"] = 5
+    thawed = _thaw(frozen)
+    assert thawed == data
+    assert isinstance(thawed["a"], list) and isinstance(thawed["a"][1], dict)
+
+
+def test_merge_keeps_defaults_for_missing_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_module, "PROJECT_ROOT", tmp_path)
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    saved = {"ui": {"theme": "dark"}, "data": {"data_sources": {"tushare": True}}, "extra": 1}
+    (config_dir / "app_config.json").write_bytes(_dumps(saved))
+
+    mgr = ConfigManager()
+    assert mgr.get("ui.theme") == "dark"
+    assert mgr.get("ui.window_size") == (1200, 800)
+    assert mgr.get("data.data_sources.tushare") is True
+    assert mgr.get("data.data_sources.akshare") is True
+    # 默认配置中没有的键不合并
+    assert mgr.get("extra") is None
+
+
+def test_missing_file_writes_defaults(manager):
+    assert manager.config_file.exists()
+    assert _loads(manager.config_file.read_bytes())["ui"]["theme"] == "light"
+
+
+def test_get_returns_read_only_cached_view(manager):
+    pools = manager.get("stock_pools")
+    assert isinstance(pools, MappingProxyType)
+    assert manager.get("stock_pools") is pools
+    assert manager.get("no.such.key", "默认") == "默认"
+
+
+def test_set_invalidates_read_cache(manager):
+    assert manager.get("stock_pools.my_stocks") == ()
+    parent = manager.get("stock_pools")
+    manager.set("stock_pools.my_stocks", ["000001"])
+    assert manager.get("stock_pools.my_stocks") == ("000001",)
+    assert manager.get("stock_pools")["my_stocks"] == ("000001",)
+    assert parent["my_stocks"] == ()
+
+
+def test_set_stores_a_copy(manager):
+    stocks = ["000001"]
+    manager.set("stock_pools.my_stocks", stocks)
+    stocks.append("000002")
+    assert manager.get("stock_pools.my_stocks") == ("000001",)
+
+
+def test_set_accepts_frozen_values(manager):
+    manager.set("stock_pools.my_stocks", ["000001"])
+    manager.set("stock_pools.watch_list", manager.get("stock_pools.my_stocks"))
+    saved = _loads(manager.config_file.read_bytes())
+    assert saved["stock_pools"]["watch_list"] == ["000001"]
+
+
+def test_deferred_save_writes_on_flush(manager):
+    manager.update_deferred({"ui.theme": "dark", "ui.window_size": [800, 600]}, delay_ms=60000)
+    assert manager.get("ui.theme") == "dark"
+    assert _loads(manager.config_file.read_bytes())["ui"]["theme"] == "light"
+
+    manager.flush()
+    saved = _loads(manager.config_file.read_bytes())
+    assert saved["ui"]["theme"] == "dark"
+    assert saved["ui"]["window_size"] == [800, 600]
+    assert manager._save_timer is None
+
+
+def test_deferred_save_fires_after_delay(manager):
+    manager.set_deferred("ui.theme", "dark", delay_ms=10)
+    manager._save_timer.join(5)
+    assert _loads(manager.config_file.read_bytes())["ui"]["theme"] == "dark"
+
+
+def test_set_cancels_pending_deferred_save(manager):
+    manager.set_deferred("ui.theme", "dark", delay_ms=60000)
+    timer = manager._save_timer
+    manager.set("ui.window_position", [0, 0])
+    assert timer.finished.is_set()
+    saved = _loads(manager.config_file.read_bytes())
+    assert saved["ui"]["theme"] == "dark"
+    assert saved["ui"]["window_position"] == [0, 0]
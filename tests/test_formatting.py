@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.utils.formatting import format_scaled
+
+
+def _format_amount(value):
+    """逐个格式化的参考实现 (向量化之前的写法)"""
+    if value >= 100000000:
+        return f"{value/100000000:.1f}亿"
+    if value >= 10000:
+        return f"{value/10000:.1f}万"
+    return f"{value:.0f}"
+
+
+def test_format_scaled_matches_scalar_formatting():
+    values = np.array([0.0, 12.4, 9999.0, 10000.0, 123456.0, 99999999.0, 100000000.0, 2.5e12, -5.0])
+    assert list(format_scaled(values)) == [_format_amount(v) for v in values]
+
+
+def test_stock_list_columns_match_scalar_formatting():
+    pytest.importorskip("PyQt6")
+    pd = pytest.importorskip("pandas")
+    from src.ui.stock_list import _format_column
+
+    column = pd.Series([1.234, None, "", "abc", 12.5])
+    assert list(_format_column("现价", column)) == ["1.23", "--", "--", "abc", "12.50"]
+    assert list(_format_column("涨跌幅", column)) == ["1.23%", "--", "--", "abc", "12.50%"]
+    amounts = pd.Series([123456789.0, 54321.0, 12.0, None])
+    assert list(_format_column("成交额", amounts)) == ["1.2亿", "5.4万", "12", "--"]
+    assert list(_format_column("名称", pd.Series(["平安银行", None]))) == ["平安银行", "--"]
+
+
+def test_strategy_results_match_stock_list_formatting():
+    pytest.importorskip("PyQt6")
+    pd = pytest.importorskip("pandas")
+    from src.ui.stock_list import _format_column
+    from src.ui.strategy_panel import _format_result_column
+
+    amounts = pd.Series([123456789.0, 54321.0, 12.0, None])
+    display, values = _format_result_column(4, amounts)
+    assert list(display) == list(_format_column("成交额", amounts))
+    assert np.isnan(values[-1])
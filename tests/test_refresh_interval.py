@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("pandas")
+
+from src.ui.data_hub import _OFF_HOURS_INTERVAL_MS, _refresh_interval
+
+# 2024-01-08 是周一
+_MONDAY = (2024, 1, 8)
+
+
+@pytest.mark.parametrize("hour, minute", [(9, 30), (10, 15), (11, 30), (13, 0), (14, 59), (15, 0)])
+def test_trading_hours_use_trading_interval(hour, minute):
+    assert _refresh_interval(1000, datetime(*_MONDAY, hour, minute)) == 1000
+
+
+@pytest.mark.parametrize("hour, minute", [(9, 0), (9, 29), (12, 0), (15, 30)])
+def test_off_hours_use_slow_interval(hour, minute):
+    assert _refresh_interval(1000, datetime(*_MONDAY, hour, minute)) == _OFF_HOURS_INTERVAL_MS
+
+
+@pytest.mark.parametrize("hour, minute", [(8, 59), (15, 31), (22, 0)])
+def test_closed_hours_pause(hour, minute):
+    assert _refresh_interval(1000, datetime(*_MONDAY, hour, minute)) == 0
+
+
+def test_weekend_pauses():
+    assert _refresh_interval(1000, datetime(2024, 1, 13, 10, 0)) == 0